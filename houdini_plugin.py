@@ -30,13 +30,15 @@ except ImportError:
 class HoudiniMCPServer:
     _active_server = None
 
-    def __init__(self, host="localhost", port=9876):
+    def __init__(self, host="localhost", port=9876, prewarm_hdas=None):
         self.host = host
         self.port = port
+        self.prewarm_hdas = list(prewarm_hdas or [])
         self.socket = None
         self.running = False
         self._registry = importlib.import_module("tool_modules.registry")
         self.MUTATING_COMMANDS = set()
+        self.edit_session = None
         self._refresh_registry()
 
     def _refresh_registry(self):
@@ -68,6 +70,8 @@ class HoudiniMCPServer:
             print(f"✅ Houdini MCP Server listening on {self.host}:{self.port}")
             print("Ready to receive commands from Claude Code!")
 
+            self._prewarm_libraries()
+
             # Start in background thread
             thread = threading.Thread(target=self._accept_connections, daemon=True)
             thread.start()
@@ -77,9 +81,25 @@ class HoudiniMCPServer:
             print(f"   {e}")
             print("   Is another instance already running?")
 
+    def _prewarm_libraries(self):
+        """Install prewarm_hdas and $HOUDINI_MCP_PREWARM_HDAS before the first command."""
+        install_cache = importlib.import_module("tool_modules.hda_install_cache")
+        paths = install_cache.prewarm_paths(self.prewarm_hdas)
+        if not paths:
+            return
+        result = install_cache.ensure_installed_many(paths, hou)
+        print(f"📚 Prewarmed HDA libraries: {result['counts']}")
+        for entry in result["results"]:
+            if entry["action"] == "failed":
+                print(f"   ⚠️  {entry['path']}: {entry['reason']}")
+
     def stop(self):
         """Stop the TCP socket server"""
         self.running = False
+        if self.edit_session is not None:
+            # Never leave Houdini stuck in manual update mode.
+            self.edit_session.close(hou, cook=False)
+            self.edit_session = None
         if self.socket is not None:
             try:
                 self.socket.shutdown(socket.SHUT_RDWR)
@@ -178,7 +198,11 @@ class HoudiniMCPServer:
 
         if cmd_type in self.MUTATING_COMMANDS:
             with hou.undos.group(f"MCP: {cmd_type}"):
-                return handler(params)
+                result = handler(params)
+            # Record only commands that succeeded; a failed one changed nothing to cook.
+            if self.edit_session is not None:
+                self.edit_session.record(cmd_type, params)
+            return result
         return handler(params)
 
     def _get_handlers(self):
@@ -1,6 +1,8 @@
 """Regression tests for root tool_modules behaviors."""
 
 from pathlib import Path
+import json
+import os
 import sys
 import types
 
@@ -11,8 +13,48 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from tool_modules.hda_utils import geometry_stats
+from tool_modules.hda_utils import (
+    definition_parm_templates,
+    diff_parm_template_rows,
+    geometry_stats,
+    invalidate_parm_template_cache,
+    project_template_names,
+    select_template_subtree,
+)
 import tool_modules.set_hda_parm_default as set_hda_parm_default_mod
+from tool_modules.apply_network_spec import normalize_network_spec, plan_network_diff
+from tool_modules.cook_utils import EditSession
+from tool_modules import run_edit_batch
+from tool_modules.profile_cook import aggregate_profile_stats
+from tool_modules.get_cook_stats import collect_node_cook_stats, summarize_cook_stats
+from tool_modules.geometry_utils import (
+    auto_voxel_stride,
+    columnar_time_series,
+    geometry_data_ids,
+    packed_primitive_summary,
+    usage_histogram,
+    volume_summary,
+    voxel_value_summary,
+)
+from tool_modules.worker_pool import shard
+from tool_modules.array_utils import pack_array, unpack_array, write_arrays
+from tool_modules.read_attribute_values import slice_elements
+from tool_modules.geometry_cache import GeometryCache, cached_geometry_product, get_geometry_cache
+from tool_modules.spatial_index import UniformGridIndex
+from tool_modules.compare_geometry import align_by_id, compare_attribute_arrays
+from tool_modules.get_usd_stage import StageTraversal, filter_traversal, usd_value_to_json
+from tool_modules.get_dop_simulation_state import dop_data_tree, resolve_dop_network
+from tool_modules.read_chop_channels import select_tracks
+from tool_modules import worker_pool
+from tool_modules.node_type_index import NodeTypeIndex, catalog_entry, split_type_name
+from tool_modules.list_node_types import search_catalog
+from tool_modules.hda_library_index import HdaLibraryIndex
+from tool_modules.hda_install_cache import ensure_installed, ensure_installed_many
+from tool_modules.validate_hda_library import collect_shard_results, read_progress, summarize_results
+from tool_modules.run_hda_regression import case_input_hash, cases_skippable, diff_fingerprints
+from tool_modules import hda_save_cache
+from tool_modules.hda_save_cache import remember_locked_contents, save_instances
+from tool_modules.hda_utils import apply_parameter_bindings, binding_expression_error
 
 
 class _Attr:
@@ -211,3 +253,1220 @@ def test_set_hda_parm_default_updates_editable_parm(monkeypatch):
     assert result["definition_name"] == "fake::hda::1.0"
     assert definition.parmTemplateGroup().find("scale").defaultValue() == (2.5,)
     assert node.synced == 1
+
+
+def test_plan_network_diff_is_minimal_and_idempotent():
+    spec = normalize_network_spec({
+        "nodes": [
+            {"name": "box1", "type": "box", "parms": {"scale": 2.0}},
+            {"name": "xform1", "type": "xform", "inputs": ["box1"], "flags": {"display": True}},
+            {"name": "out", "type": "null", "inputs": [{"node": "xform1", "output": 0}]},
+        ],
+    })
+    live = {
+        "box1": {"type": "box", "parms": {"scale": 1.0}, "flags": {}, "inputs": {}},
+        "xform1": {"type": "xform", "parms": {}, "flags": {"display": True}, "inputs": {0: ("box1", 0)}},
+        "out": {"type": "merge", "parms": {}, "flags": {}, "inputs": {}},
+        "stray": {"type": "null", "parms": {}, "flags": {}, "inputs": {}},
+    }
+
+    plan = plan_network_diff(spec, live, delete_missing=True)
+
+    assert plan["create"] == []
+    assert plan["replace"] == ["out"]
+    assert plan["delete"] == ["stray"]
+    assert plan["parms"] == {"box1": {"scale": 2.0}}
+    assert plan["connect"] == [
+        {"dest": "out", "dest_index": 0, "source": "xform1", "source_index": 0}
+    ]
+    assert plan["unchanged"] == ["xform1"]
+
+    live["box1"]["parms"]["scale"] = 2.0
+    live["out"] = {"type": "null", "parms": {}, "flags": {}, "inputs": {0: ("xform1", 0)}}
+    del live["stray"]
+    replan = plan_network_diff(spec, live, delete_missing=True)
+    assert replan["unchanged"] == ["box1", "xform1", "out"]
+    assert not any(replan[key] for key in ("create", "replace", "delete", "parms", "connect", "disconnect"))
+
+
+def test_plan_network_diff_rewires_consumers_of_replaced_nodes():
+    spec = normalize_network_spec({
+        "nodes": [
+            {"name": "src", "type": "sphere"},
+            {"name": "xform1", "type": "xform", "inputs": ["src"]},
+            {"name": "out", "type": "null", "inputs": ["xform1"]},
+        ],
+    })
+    live = {
+        "src": {"type": "box", "parms": {}, "flags": {}, "inputs": {}},
+        "xform1": {"type": "xform", "parms": {}, "flags": {}, "inputs": {0: ("src", 0)}},
+        "out": {"type": "null", "parms": {}, "flags": {}, "inputs": {0: ("xform1", 0)}},
+    }
+
+    plan = plan_network_diff(spec, live)
+
+    assert plan["replace"] == ["src"]
+    assert plan["connect"] == [
+        {"dest": "xform1", "dest_index": 0, "source": "src", "source_index": 0}
+    ]
+    assert plan["unchanged"] == ["out"]
+
+
+class _UpdateModeHou:
+    updateMode = types.SimpleNamespace(Manual="manual", AutoUpdate="auto")
+
+    def __init__(self):
+        self.mode = "auto"
+
+    def updateModeSetting(self):
+        return self.mode
+
+    def setUpdateMode(self, mode):
+        self.mode = mode
+
+    def node(self, path):
+        return None
+
+    def isUIAvailable(self):
+        return False
+
+
+def test_edit_session_defers_cooks_and_restores_update_mode():
+    fake_hou = _UpdateModeHou()
+    session = EditSession("test", fake_hou)
+    assert fake_hou.mode == "manual"
+
+    session.record("set_parameter", {"node_path": "/obj/geo1/box1", "param_name": "sizex"})
+    session.record("connect_nodes", {"source_path": "/obj/geo1/box1", "dest_path": "/obj/geo1/xform1"})
+    session.record("run_edit_batch", {"commands": []})
+
+    summary = session.close(fake_hou)
+    assert fake_hou.mode == "auto"
+    assert summary["mutations"] == 2
+    assert summary["touched_paths"] == ["/obj/geo1/box1", "/obj/geo1/xform1"]
+    assert summary["cooked"] == [] and summary["cooks_avoided"] == 2
+
+
+def test_run_edit_batch_rejects_session_commands_and_counts_successes():
+    fake_hou = _UpdateModeHou()
+
+    def execute(command):
+        if command["params"].get("fail"):
+            raise ValueError("boom")
+        return {"ok": True}
+
+    server = types.SimpleNamespace(edit_session=None, _execute_command=execute)
+    with pytest.raises(ValueError, match="end_edit_session cannot run inside run_edit_batch"):
+        run_edit_batch.execute_plugin({"commands": [{"type": "end_edit_session"}]}, server, fake_hou)
+
+    commands = [
+        {"type": "set_parameter", "params": {}},
+        {"type": "set_parameter", "params": {"fail": True}},
+        {"type": "set_parameter", "params": {}},
+    ]
+    result = run_edit_batch.execute_plugin({"commands": commands, "stop_on_error": False}, server, fake_hou)
+    assert (result["commands_total"], result["commands_run"]) == (3, 2)
+    assert result["errors"] == ["[1] set_parameter: boom"]
+    assert server.edit_session is None and fake_hou.mode == "auto"
+
+
+def test_aggregate_profile_stats_reads_the_cook_stats_table():
+    stats = {
+        "cookStats": {
+            "headers": ["Cook Count", "Self Cook Time", "Total Cook Time", "Self Memory Growth"],
+            "/obj/geo1/box1": [1, 2.0, 2.0, 0],
+            "/obj/geo1/mountain1": [2, 8.0, 11.0, 1024],
+        },
+        "frameStats": {"headers": ["Time"], "/obj/geo1/box1": [99.0]},
+    }
+
+    rows = aggregate_profile_stats(stats)
+
+    assert set(rows) == {"/obj/geo1/box1", "/obj/geo1/mountain1"}
+    assert rows["/obj/geo1/mountain1"] == {
+        "cook_count": 2, "self_ms": 8.0, "total_ms": 11.0, "memory_growth_bytes": 1024.0,
+    }
+    assert rows["/obj/geo1/box1"]["self_ms"] == 2.0
+    assert aggregate_profile_stats({"cookStats": {"headers": ["Name"], "/obj/a": ["x"]}}) == {}
+    assert aggregate_profile_stats([]) == {}
+
+
+class _StatsNode:
+    def __init__(self, path, cook_ms=None, cooks=None, time_dependent=False, errors=(), memory=None):
+        self._path = path
+        self._category = "Sop" if memory is not None else "Object"
+        if cook_ms is not None:
+            self.lastCookTime = lambda: cook_ms
+            self.cookCount = lambda: cooks
+            self.isTimeDependent = lambda: time_dependent
+            self.errors = lambda: list(errors)
+            self.needsToCook = lambda: False
+            self.geometry = lambda: types.SimpleNamespace(intrinsicValue=lambda name: memory)
+
+    def path(self):
+        return self._path
+
+    def type(self):
+        category = types.SimpleNamespace(name=lambda: self._category)
+        return types.SimpleNamespace(name=lambda: "box", category=lambda: category)
+
+
+def test_summarize_cook_stats_ranks_nodes_and_tolerates_missing_data():
+    nodes = [
+        _StatsNode("/obj/geo1/box1", cook_ms=2.0, cooks=3, memory=4096),
+        _StatsNode("/obj/geo1/solver1", cook_ms=9.5, cooks=1, time_dependent=True, errors=["bad input"], memory=512),
+        _StatsNode("/obj/geo1/null1", cook_ms=0.5, cooks=7, time_dependent=True),
+        _StatsNode("/obj/geo1/uncooked"),
+    ]
+    rows = [collect_node_cook_stats(node) for node in nodes]
+    assert rows[3]["last_cook_ms"] is None and rows[3]["cook_count"] is None
+    assert rows[3]["geometry_memory_bytes"] is None and rows[3]["num_errors"] == 0
+
+    edges = [["/obj/geo1/box1", "/obj/geo1/solver1"], ["/obj/geo1/solver1", "/obj/geo1/null1"]]
+    summary = summarize_cook_stats(rows, edges, top_n=2)
+    assert summary["num_nodes"] == 4
+    assert summary["total_last_cook_ms"] == 12.0
+    assert summary["total_geometry_memory_bytes"] == 4608
+    assert [row["path"] for row in summary["top_by_cook_time"]] == ["/obj/geo1/solver1", "/obj/geo1/box1"]
+    assert [row["cook_count"] for row in summary["top_by_cook_count"]] == [7, 3]
+    assert [row["path"] for row in summary["top_by_memory"]] == ["/obj/geo1/box1", "/obj/geo1/solver1"]
+    assert summary["nodes_with_errors"] == [{"path": "/obj/geo1/solver1", "error": "bad input"}]
+    assert summary["time_dependent_subgraph"] == {
+        "nodes": ["/obj/geo1/null1", "/obj/geo1/solver1"],
+        "edges": [["/obj/geo1/solver1", "/obj/geo1/null1"]],
+    }
+
+
+def test_columnar_time_series_aligns_attribute_stats_by_frame():
+    summaries = [
+        {"points": 4, "prims": 1, "vertices": 4, "bbox_min": [0, 0, 0], "bbox_max": [1, 1, 0], "attributes": {}},
+        {
+            "points": 8,
+            "prims": 2,
+            "vertices": 8,
+            "bbox_min": [0, 0, 0],
+            "bbox_max": [2, 1, 0],
+            "attributes": {"point:P": {"count": 8, "mean": [1.0, 0.5, 0.0]}},
+        },
+    ]
+
+    series = columnar_time_series([1.0, 2.0], summaries)
+
+    assert series["points"] == [4, 8]
+    assert series["bbox_max"] == [[1, 1, 0], [2, 1, 0]]
+    assert series["attributes"]["point:P"]["mean"] == [None, [1.0, 0.5, 0.0]]
+    assert shard(list(range(5)), 2) == [[0, 1, 2], [3, 4]]
+    assert shard([1.0], 8) == [[1.0]]
+
+
+def test_write_arrays_npy_descriptor_is_memory_mappable(tmp_path):
+    np = pytest.importorskip("numpy")
+    positions = np.arange(12, dtype=np.float32).reshape(4, 3)
+    names = np.array([["a"], ["bb"]], dtype=object)
+
+    descriptor = write_arrays({"point:P": positions, "prim:name": names}, "npy", str(tmp_path / "out"))
+
+    by_key = {entry["key"]: entry for entry in descriptor["arrays"]}
+    assert by_key["point:P"]["shape"] == [4, 3]
+    assert by_key["point:P"]["dtype"] == "<f4"
+    mapped = np.load(by_key["point:P"]["path"], mmap_mode="r")
+    assert mapped.tolist() == positions.tolist()
+    assert np.load(by_key["prim:name"]["path"]).ravel().tolist() == ["a", "bb"]
+
+
+def test_read_attribute_page_round_trips_through_packed_encoding():
+    np = pytest.importorskip("numpy")
+    values = np.arange(30, dtype=np.float32).reshape(10, 3)
+
+    element_indices, page = slice_elements(values, offset=2, count=3, stride=3)
+    packed = pack_array(page)
+
+    assert element_indices.tolist() == [2, 5, 8]
+    assert packed["dtype"] == "<f4"
+    assert unpack_array(packed).tolist() == values[[2, 5, 8]].tolist()
+    with pytest.raises(ValueError, match="out of range"):
+        slice_elements(values, indices=[0, 10])
+
+
+class _CookedNode:
+    def __init__(self, session_id):
+        self._session_id = session_id
+        self.cooks = 1
+
+    def geometry(self):
+        return None
+
+    def cookCount(self):
+        return self.cooks
+
+    def sessionId(self):
+        return self._session_id
+
+    def isTimeDependent(self):
+        return False
+
+
+def test_geometry_cache_reuses_until_recook_and_respects_budget():
+    cache = get_geometry_cache()
+    cache.invalidate()
+    node = _CookedNode(session_id=101)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"points": len(calls)}
+
+    first = cached_geometry_product(node, None, "stats", compute, _FakeHou())
+    second = cached_geometry_product(node, None, "stats", compute, _FakeHou())
+    assert first == second == {"points": 1}
+
+    node.cooks += 1
+    third = cached_geometry_product(node, None, "stats", compute, _FakeHou())
+    assert third == {"points": 2}
+    assert cache.stats()["invalidations"] >= 1
+
+    small = GeometryCache(max_bytes=100)
+    small.put((1, 1, None, "a"), "x", nbytes=60)
+    small.put((2, 1, None, "b"), "y", nbytes=60)
+    assert small.get((1, 1, None, "a")) == (False, None)
+    assert small.get((2, 1, None, "b")) == (True, "y")
+    assert small.stats()["evictions"] == 1
+    cache.invalidate()
+
+
+class _AnimatedNode(_CookedNode):
+    def __init__(self, session_id):
+        super().__init__(session_id)
+        self.callbacks = []
+
+    def isTimeDependent(self):
+        return True
+
+    def geometryAtFrame(self, frame):
+        # Every frame evaluation recooks a time-dependent node.
+        self.cooks += 1
+        return {"frame": frame}
+
+    def inputAncestors(self):
+        return []
+
+    def references(self):
+        return []
+
+    def addEventCallback(self, event_types, callback):
+        self.callbacks.append(callback)
+
+    def removeEventCallback(self, event_types, callback):
+        self.callbacks.remove(callback)
+
+
+def test_geometry_cache_keeps_frames_of_time_dependent_nodes_until_edited():
+    cache = get_geometry_cache()
+    cache.invalidate()
+    node = _AnimatedNode(session_id=202)
+    fake_hou = types.SimpleNamespace(
+        frame=lambda: 1.0,
+        nodeEventType=types.SimpleNamespace(
+            ParmTupleChanged="parm", InputRewired="rewire", FlagChanged="flag",
+            ChildCreated="created", ChildDeleted="deleted", BeingDeleted="deleting",
+        ),
+    )
+    computed = []
+
+    def probe(frame):
+        def compute():
+            computed.append(frame)
+            return node.geometryAtFrame(frame)
+        return cached_geometry_product(node, frame, "stats", compute, fake_hou)
+
+    for _ in range(2):
+        assert [probe(frame)["frame"] for frame in (1.0, 2.0, 3.0)] == [1.0, 2.0, 3.0]
+    assert computed == [1.0, 2.0, 3.0]
+
+    node.callbacks[0](event_type="parm", node=node)
+    probe(2.0)
+    assert computed == [1.0, 2.0, 3.0, 2.0]
+
+    node.callbacks[0](event_type="rewire", node=node)
+    probe(2.0)
+    assert computed[-1] == 2.0 and len(computed) == 5 and len(node.callbacks) == 1
+    cache.invalidate()
+
+
+class _FileParm:
+    def __init__(self, path):
+        self.path = path
+
+    def parmTemplate(self):
+        return types.SimpleNamespace(stringType=lambda: "file")
+
+    def evalAtFrame(self, frame):
+        return self.path
+
+
+class _NetworkNode(_AnimatedNode):
+    def __init__(self, session_id, ancestors=(), refs=(), children=(), locked=False, parms=()):
+        super().__init__(session_id)
+        self.ancestors, self.refs, self.kids, self.locked, self.file_parms = ancestors, refs, children, locked, parms
+
+    def inputAncestors(self):
+        return list(self.ancestors)
+
+    def references(self):
+        return list(self.refs)
+
+    def children(self):
+        return list(self.kids)
+
+    def isLockedHDA(self):
+        return self.locked
+
+    def parms(self):
+        return list(self.file_parms)
+
+
+def test_geometry_cache_watches_nested_edits_and_files(tmp_path):
+    cache = get_geometry_cache()
+    cache.invalidate()
+    source = tmp_path / "frame.bgeo"
+    source.write_bytes(b"a")
+    control = _NetworkNode(301)
+    inner = _NetworkNode(302, refs=[control])
+    hidden = _NetworkNode(303)
+    locked = _NetworkNode(304, children=[hidden], locked=True)
+    subnet = _NetworkNode(305, children=[inner], parms=[_FileParm(str(source))])
+    node = _NetworkNode(306, ancestors=[subnet, locked])
+    fake_hou = types.SimpleNamespace(
+        frame=lambda: 1.0,
+        stringParmType=types.SimpleNamespace(FileReference="file"),
+        nodeEventType=types.SimpleNamespace(
+            ParmTupleChanged="parm", InputRewired="rewire", FlagChanged="flag",
+            ChildCreated="created", ChildDeleted="deleted", BeingDeleted="deleting",
+        ),
+    )
+    computed = []
+
+    def probe():
+        return cached_geometry_product(node, 1.0, "stats", lambda: computed.append(1) or len(computed), fake_hou)
+
+    assert probe() == probe() == 1
+    assert [bool(n.callbacks) for n in (control, inner, hidden, locked, subnet)] == [True, True, False, True, True]
+
+    control.callbacks[0](event_type="parm", node=control)
+    assert probe() == 2
+
+    source.write_bytes(b"longer")
+    assert probe() == 3 and probe() == 3
+    cache.invalidate()
+
+
+def test_uniform_grid_index_matches_brute_force():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(7)
+    points = rng.random((2000, 3)) * [10.0, 0.0, 10.0]
+    index = UniformGridIndex(points)
+
+    for query in (np.array([5.0, 0.0, 5.0]), np.array([40.0, 3.0, -9.0])):
+        distances = np.linalg.norm(points - query, axis=1)
+        _, nearest = index.nearest(query, 5)
+        assert np.allclose(nearest, np.sort(distances)[:5])
+        within, _ = index.radius(query, 1.5)
+        assert sorted(within.tolist()) == np.nonzero(distances <= 1.5)[0].tolist()
+
+    inside = index.bbox([2.0, -1.0, 2.0], [3.0, 1.0, 4.0])
+    expected = np.nonzero(np.all((points >= [2.0, -1.0, 2.0]) & (points <= [3.0, 1.0, 4.0]), axis=1))[0]
+    assert inside.tolist() == expected.tolist()
+
+
+def test_compare_geometry_aligns_by_id_and_applies_tolerance():
+    np = pytest.importorskip("numpy")
+    ids_a = np.array([[3], [1], [2]], dtype=np.int32)
+    ids_b = np.array([[1], [2], [4], [3]], dtype=np.int32)
+    positions_a = np.array([[3.0, 0, 0], [1.0, 0, 0], [2.0, 0, 0]])
+    positions_b = np.array([[1.0, 0, 0], [2.0, 0, 0.5], [9.0, 9, 9], [3.0, 0, 1e-7]])
+
+    index_a, index_b, unmatched_a, unmatched_b = align_by_id(ids_a, ids_b)
+    stats = compare_attribute_arrays(positions_a[index_a], positions_b[index_b], tolerance=1e-5)
+
+    assert (unmatched_a, unmatched_b) == (0, 1)
+    assert stats["equal"] is False
+    assert stats["elements_over_tolerance"] == 1
+    assert stats["max_abs_diff"] == pytest.approx(0.5)
+    assert compare_attribute_arrays(positions_a, positions_a + 1e-7, tolerance=1e-5)["equal"] is True
+
+
+class _DataIdGeo:
+    def __init__(self, topology_id, attrib_ids):
+        self.topology_id = topology_id
+        self.attribs = [
+            types.SimpleNamespace(name=lambda name=name: name, dataId=lambda data_id=data_id: data_id)
+            for name, data_id in attrib_ids.items()
+        ]
+
+    def intrinsicValue(self, name):
+        return {"pointcount": 8, "primitivecount": 6, "vertexcount": 24}[name]
+
+    def topologyDataId(self):
+        return self.topology_id
+
+    def primitiveListDataId(self):
+        return 7
+
+    def pointAttribs(self):
+        return self.attribs
+
+    def primAttribs(self):
+        return []
+
+    def vertexAttribs(self):
+        return []
+
+    def globalAttribs(self):
+        return []
+
+
+def test_geometry_data_ids_match_only_shared_data():
+    source = _DataIdGeo(1, {"P": 10, "Cd": 11})
+    passed_through = _DataIdGeo(1, {"Cd": 11, "P": 10})
+    moved = _DataIdGeo(1, {"P": 12, "Cd": 11})
+    assert geometry_data_ids(source) == geometry_data_ids(passed_through)
+    assert geometry_data_ids(source) != geometry_data_ids(moved)
+    assert geometry_data_ids(object()) is None
+
+
+def test_usage_histogram_buckets_instance_counts_by_decade():
+    assert usage_histogram([1, 1, 5, 42, 999, 5000]) == {
+        "1": 2,
+        "2-9": 1,
+        "10-99": 1,
+        "100-999": 1,
+        "1000+": 1,
+    }
+
+
+class _PackedPrim:
+    def __init__(self, filename, scale):
+        self.values = {
+            "typename": "PackedDisk",
+            "filename": filename,
+            "pointcount": 100,
+            "packedfulltransform": [scale, 0, 0, 0, 0, scale, 0, 0, 0, 0, scale, 0, 0, 0, 0, 1],
+        }
+
+    def intrinsicNames(self):
+        return list(self.values)
+
+    def intrinsicValue(self, name):
+        return self.values[name]
+
+
+def test_packed_primitive_summary_batches_transform_scales():
+    pytest.importorskip("numpy")
+    prims = [_PackedPrim("rock.bgeo", 2.0), _PackedPrim("rock.bgeo", 3.0), _PackedPrim("tree.bgeo", 1.0), object()]
+    geo = types.SimpleNamespace(iterPrims=lambda: iter(prims), intrinsicValue=lambda name: len(prims))
+    fake_hou = types.SimpleNamespace(PackedPrim=_PackedPrim)
+
+    summary = packed_primitive_summary(geo, fake_hou, top_n=1)
+    assert summary["packed_prims"] == 3 and summary["total_prims"] == 4
+    assert summary["unique_sources"] == 2 and summary["instanced_points"] == 300
+    assert summary["top_sources"] == [
+        {"type": "PackedDisk", "source": "rock.bgeo", "instances": 2, "points_per_instance": 100}
+    ]
+    assert summary["uniform_scale"] == pytest.approx({"min": 1.0, "max": 3.0, "mean": 2.0})
+
+
+def test_voxel_value_summary_and_auto_stride():
+    np = pytest.importorskip("numpy")
+    values = np.zeros((8, 8, 8), dtype=np.float32)
+    values[0, 0, :4] = [1.0, 2.0, 3.0, np.nan]
+
+    summary = voxel_value_summary(values, bins=4)
+
+    assert summary["sampled"] == 512
+    assert summary["nonfinite"] == 1
+    assert summary["nonzero"] == 3
+    assert (summary["min"], summary["max"]) == (0.0, 3.0)
+    assert sum(summary["histogram"]["counts"]) == 511
+    assert auto_voxel_stride([512, 512, 512]) == 2
+    assert auto_voxel_stride([64, 64, 64]) == 1
+
+
+class _FakeVDB:
+    """4x1x1 active box of an SDF with background 0.3: two narrow-band voxels, two inactive."""
+
+    values = [0.3, -0.1, 0.1, -0.3]
+
+    def number(self):
+        return 0
+
+    def attribValue(self, attrib):
+        return "surface"
+
+    def voxelSize(self):
+        return (0.1, 0.1, 0.1)
+
+    def activeVoxelCount(self):
+        return 2
+
+    def isSDF(self):
+        return True
+
+    def isEmpty(self):
+        return False
+
+    def activeVoxelBoundingBox(self):
+        return types.SimpleNamespace(minvec=lambda: (0, 0, 0), maxvec=lambda: (3, 0, 0))
+
+    def backgroundValue(self):
+        return 0.3
+
+    def voxelRangeAsFloat(self, box):
+        return list(self.values)
+
+
+def test_volume_summary_ignores_inactive_vdb_voxels():
+    pytest.importorskip("numpy")
+    geo = types.SimpleNamespace(findPrimAttrib=lambda name: object(), iterPrims=lambda: iter([_FakeVDB()]))
+    fake_hou = types.SimpleNamespace(VDB=_FakeVDB, Volume=type("Volume", (), {}), BoundingBox=lambda *args: args)
+
+    [entry] = volume_summary(geo, fake_hou, stride=1, bins=2)
+    assert entry["active_voxels"] == 2 and entry["sampled_voxels"] == 4
+    assert entry["values"]["sampled"] == 2
+    assert entry["values"]["min"] == pytest.approx(-0.1) and entry["values"]["max"] == pytest.approx(0.1)
+
+
+def test_usd_stage_traversal_filters_and_converts_values():
+    traversal = StageTraversal()
+    traversal.append("/world", "Xform", 0, True, False)
+    traversal.append("/world/a", "Mesh", 1, True, True)
+    traversal.append("/world/b", "Mesh", 1, False, False)
+
+    assert filter_traversal(traversal, ["Mesh"], include_inactive=True) == [1, 2]
+    assert filter_traversal(traversal, [], include_inactive=False) == [0, 1]
+    assert traversal.type_counts() == {"Xform": 1, "Mesh": 2}
+    assert usd_value_to_json((1.0, 2.0)) == [1.0, 2.0]
+    assert usd_value_to_json(list(range(40)))["length"] == 40
+
+
+class _DopRecord:
+    def __init__(self, fields):
+        self._fields = fields
+
+    def fieldNames(self):
+        return tuple(self._fields)
+
+    def field(self, name):
+        return self._fields[name]
+
+
+class _DopData:
+    def __init__(self, data_type, records=None, subdata=None):
+        self._type = data_type
+        self._records = records or {}
+        self._subdata = subdata or {}
+
+    def dataType(self):
+        return self._type
+
+    def recordTypes(self):
+        return tuple(self._records)
+
+    def records(self, record_type):
+        return [_DopRecord(fields) for fields in self._records[record_type]]
+
+    def subData(self):
+        return self._subdata
+
+
+def test_dop_data_tree_expands_records_and_limits_depth():
+    solver = _DopData("SIM_SolverNull", subdata={"Inner": _DopData("SIM_Data")})
+    obj = _DopData(
+        "SIM_Object",
+        records={"Basic": [{"position": (1.0, 2.0, 3.0), "name": "box"}]},
+        subdata={"Geometry": _DopData("SIM_Geometry"), "Solver": solver},
+    )
+
+    tree = dop_data_tree(obj, ["Basic"], max_depth=1)
+
+    assert tree["records"]["Basic"] == [{"position": [1.0, 2.0, 3.0], "name": "box"}]
+    assert sorted(tree["subdata"]) == ["Geometry", "Solver"]
+    assert tree["subdata"]["Solver"]["subdata_names"] == ["Inner"]
+    assert "subdata" not in tree["subdata"]["Solver"]
+
+
+class _DopNetworkNode:
+    def __init__(self, path, type_name, parent=None, dop_net=None):
+        self._path, self._type_name, self._parent, self._dop_net = path, type_name, parent, dop_net
+
+    def path(self):
+        return self._path
+
+    def type(self):
+        return types.SimpleNamespace(name=lambda: self._type_name)
+
+    def parent(self):
+        return self._parent
+
+    def simulation(self):
+        return None
+
+    def dopNetNode(self):
+        return self._dop_net
+
+
+def test_resolve_dop_network_uses_the_enclosing_dopnet():
+    dopnet = _DopNetworkNode("/obj/dopnet1", "dopnet")
+    solver = _DopNetworkNode("/obj/dopnet1/rbdsolver1", "rigidbodysolver", parent=dopnet, dop_net=dopnet)
+    nested = _DopNetworkNode("/obj/dopnet1/sub/merge1", "merge", parent=_DopNetworkNode(
+        "/obj/dopnet1/sub", "subnet", parent=dopnet))
+    assert resolve_dop_network(dopnet) is dopnet
+    assert resolve_dop_network(solver) is dopnet
+    assert resolve_dop_network(nested) is dopnet
+    with pytest.raises(ValueError, match="is not a DOP network"):
+        resolve_dop_network(_DopNetworkNode("/obj/geo1", "geo"))
+
+
+def test_select_tracks_keeps_chop_order_for_patterns():
+    names = ["tx", "ty", "tz", "rx", "ry", "rz", "sx"]
+    assert select_tracks(names, None) == names
+    assert select_tracks(names, ["r*", "tx"]) == ["tx", "rx", "ry", "rz"]
+    assert select_tracks(names, ["missing"]) == []
+
+
+class _IndexedType:
+    def __init__(self, category, name):
+        self._category = category
+        self._name = name
+
+    def category(self):
+        return self._category
+
+    def nameWithCategory(self):
+        return f"{self._category.name()}/{self._name}"
+
+
+class _IndexedCategory:
+    def __init__(self, name, type_names):
+        self._name = name
+        self._types = {type_name: _IndexedType(self, type_name) for type_name in type_names}
+
+    def name(self):
+        return self._name
+
+    def nodeTypes(self):
+        return self._types
+
+
+def test_node_type_index_tiers_ambiguity_and_invalidation():
+    sop = _IndexedCategory("Sop", ["null", "labs::Edge_Smooth::2.0", "box"])
+    obj = _IndexedCategory("Object", ["null", "geo"])
+    categories = {"Sop": sop, "Object": obj}
+    fake_hou = types.SimpleNamespace(
+        nodeTypeCategories=lambda: dict(categories),
+        ObjectWasDeleted=RuntimeError,
+    )
+    index = NodeTypeIndex()
+
+    node_type, match = index.resolve("null", fake_hou)
+    assert match["match"] == "exact" and match["ambiguous"] is True
+    assert sorted(match["candidates"]) == ["Object/null", "Sop/null"]
+    assert index.resolve("null", fake_hou, category=obj)[0].nameWithCategory() == "Object/null"
+    assert index.resolve("Sop/BOX", fake_hou)[1]["match"] == "qualified_lowercase"
+    assert index.resolve("edge_smooth", fake_hou)[0].nameWithCategory() == "Sop/labs::Edge_Smooth::2.0"
+    assert index.resolve("missing", fake_hou)[0] is None
+    assert index.builds == 1
+
+    categories["Sop"] = _IndexedCategory("Sop", ["null", "box", "fresh"])
+    assert index.resolve("fresh", fake_hou)[0] is None
+    index.invalidate()
+    assert index.resolve("fresh", fake_hou)[1]["match"] == "exact"
+    assert index.builds == 2
+    assert split_type_name("labs::Edge_Smooth::2.0") == ("labs", "Edge_Smooth", "2.0")
+
+
+def test_search_catalog_ranks_filters_and_tolerates_typos():
+    def entry(name, description, inputs=(1, 1), hda=False):
+        node_type = types.SimpleNamespace(
+            description=lambda: description,
+            minNumInputs=lambda: inputs[0],
+            maxNumInputs=lambda: inputs[1],
+            definition=lambda: object() if hda else None,
+        )
+        return catalog_entry(name, node_type, "Sop")
+
+    catalog = [
+        entry("polyextrude::2.0", "PolyExtrude"),
+        entry("extrudevolume", "Extrude Volume"),
+        entry("labs::extrude_curves::1.0", "Labs Extrude Curves", hda=True),
+        entry("merge", "Merge", inputs=(0, 9999)),
+        entry("box", "Box", inputs=(0, 0)),
+    ]
+
+    ranked = search_catalog(catalog, "polyextrude")
+    assert ranked[0]["name"] == "polyextrude::2.0" and ranked[0]["version"] == "2.0"
+    assert [e["name"] for e in search_catalog(catalog, "extrude")] == [
+        "extrudevolume",
+        "labs::extrude_curves::1.0",
+        "polyextrude::2.0",
+    ]
+    assert search_catalog(catalog, "mrege")[0]["name"] == "merge"
+    assert search_catalog(catalog, "mrege", fuzzy=False) == []
+    assert [e["name"] for e in search_catalog(catalog, is_hda=True)] == ["labs::extrude_curves::1.0"]
+    assert [e["name"] for e in search_catalog(catalog, namespace="labs")] == ["labs::extrude_curves::1.0"]
+    assert [e["name"] for e in search_catalog(catalog, min_inputs=2)] == ["merge"]
+    assert "score" not in catalog[0]
+
+
+def test_hda_library_index_reparses_only_changed_files(tmp_path):
+    library_dir = tmp_path / "libs"
+    library_dir.mkdir()
+    first = library_dir / "edge.hda"
+    second = library_dir / "other.otl"
+    first.write_text("a")
+    second.write_text("b")
+    parsed = []
+
+    def definitions_in_file(path):
+        parsed.append(Path(path).name)
+        name = "labs::edge_smooth::2.0" if path.endswith("edge.hda") else "tool"
+        return [types.SimpleNamespace(
+            nodeTypeName=lambda: name,
+            nodeTypeCategory=lambda: types.SimpleNamespace(name=lambda: "Sop"),
+            description=lambda: name.title(),
+            version=lambda: "",
+        )]
+
+    fake_hou = types.SimpleNamespace(hda=types.SimpleNamespace(definitionsInFile=definitions_in_file))
+    index_path = str(tmp_path / "index.json")
+
+    scan = HdaLibraryIndex(index_path).scan([str(library_dir)], fake_hou)
+    assert (scan["libraries"], scan["parsed"], scan["definitions"]) == (2, 2, 2)
+
+    reloaded = HdaLibraryIndex(index_path)
+    assert reloaded.scan([str(library_dir)], fake_hou)["parsed"] == 0
+    matches = reloaded.find("Sop/edge_smooth")
+    assert [(m["path"], m["match"], m["version"]) for m in matches] == [(str(first), "base_name", "2.0")]
+
+    second.write_text("changed")
+    os.utime(second, (1, 1))
+    first.unlink()
+    rescan = reloaded.scan([str(library_dir)], fake_hou)
+    assert (rescan["parsed"], rescan["removed"]) == (1, 1)
+    assert reloaded.find("edge_smooth") == []
+    assert parsed == ["edge.hda", "other.otl", "other.otl"]
+
+    missing = str(library_dir / "gone.hda")
+    assert reloaded.definitions_in_file(missing, fake_hou) == []
+    assert "gone.hda" in reloaded.library_error(missing)
+    assert reloaded.library_error(str(second)) is None
+
+
+def test_ensure_installed_skips_unchanged_libraries(tmp_path):
+    library = tmp_path / "asset.hda"
+    library.write_bytes(b"v1")
+    loaded = set()
+    calls = []
+
+    def install_file(path, change_oplibraries_file=False):
+        calls.append(("install", Path(path).name))
+        loaded.add(path)
+
+    fake_hou = types.SimpleNamespace(hda=types.SimpleNamespace(
+        installFile=install_file,
+        reloadFile=lambda path: calls.append(("reload", Path(path).name)),
+        loadedFiles=lambda: sorted(loaded),
+    ))
+
+    assert ensure_installed(str(library), fake_hou)["action"] == "installed"
+    assert ensure_installed(str(library), fake_hou)["action"] == "skipped"
+    os.utime(library, (1, 1))
+    assert ensure_installed(str(library), fake_hou)["reason"] == "touched but content unchanged"
+    library.write_bytes(b"v2-longer")
+    assert ensure_installed(str(library), fake_hou)["action"] == "reloaded"
+    loaded.clear()
+    assert ensure_installed(str(library), fake_hou)["reason"] == "no longer loaded"
+
+    batch = ensure_installed_many([str(library), str(tmp_path / "missing.hda")], fake_hou)
+    assert batch["counts"] == {"skipped": 1, "failed": 1}
+    assert calls == [("install", "asset.hda"), ("reload", "asset.hda"), ("install", "asset.hda")]
+
+    fresh = tmp_path / "fresh.hda"
+    fresh.write_bytes(b"v1")
+    (tmp_path / "sub").mkdir()
+    batch = ensure_installed_many([str(fresh), str(tmp_path / "sub" / ".." / "fresh.hda")], fake_hou)
+    assert batch["counts"] == {"installed": 1}
+    assert ensure_installed_many([str(fresh)], fake_hou)["counts"] == {"skipped": 1}
+    assert calls[3:] == [("install", "fresh.hda")]
+
+
+def test_diff_parm_template_rows_reports_minimal_moves():
+    before = [
+        ("main", (), {"type": "Folder"}),
+        ("scale", ("main",), {"label": "Scale", "default_value": 1.0}),
+        ("seed", ("main",), {"label": "Seed"}),
+        ("mode", ("main",), {"label": "Mode"}),
+        ("old", (), {"label": "Old"}),
+    ]
+    after = [
+        ("main", (), {"type": "Folder"}),
+        ("mode", ("main",), {"label": "Mode"}),
+        ("scale", ("main",), {"label": "Size", "default_value": 1.0}),
+        ("seed", ("main",), {"label": "Seed"}),
+        ("extra", ("main",), {"label": "Extra"}),
+    ]
+
+    diff = diff_parm_template_rows(before, after)
+
+    assert diff["added"] == ["extra"]
+    assert diff["removed"] == ["old"]
+    assert diff["moved"] == ["mode"]
+    assert diff["modified"] == {"scale": {"label": {"from": "Scale", "to": "Size"}}}
+    assert diff_parm_template_rows(before, before) == {"added": [], "removed": [], "modified": {}, "moved": []}
+
+
+def test_definition_parm_templates_memoized_until_definition_changes(monkeypatch):
+    import tool_modules.hda_utils as hda_utils_mod
+
+    serialized = []
+    tree = [{"name": "main", "label": "Main", "type": "Folder", "children": [
+        {"name": "adv", "label": "Advanced", "type": "Folder", "children": [
+            {"name": "seed", "label": "Seed", "type": "Int", "default_value": 0},
+        ]},
+        {"name": "scale", "label": "Scale", "type": "Float", "default_value": 1.0},
+    ]}]
+    monkeypatch.setattr(hda_utils_mod, "parm_template_to_dict", lambda t, hou: serialized.append(t) or tree[0])
+
+    script = {"text": "parm { name scale }"}
+    ptg = types.SimpleNamespace(asDialogScript=lambda: script["text"], entries=lambda: ("main",))
+    modified = {"time": 100}
+    definition = types.SimpleNamespace(
+        parmTemplateGroup=lambda: ptg,
+        modificationTime=lambda: modified["time"],
+        nodeTypeCategory=lambda: types.SimpleNamespace(name=lambda: "Sop"),
+        nodeTypeName=lambda: "memo_test",
+        libraryFilePath=lambda: "/tmp/memo_test.hda",
+    )
+
+    invalidate_parm_template_cache(definition)
+    assert definition_parm_templates(definition, None) == tree
+    assert definition_parm_templates(definition, None) == tree
+    assert len(serialized) == 1
+    definition_parm_templates(definition, None)[0]["label"] = "Mutated"
+    assert definition_parm_templates(definition, None)[0]["label"] == "Main"
+    assert len(serialized) == 1
+    # Hashing the dialog script only happens on demand.
+    script["text"] += " parm { name seed }"
+    definition_parm_templates(definition, None)
+    assert len(serialized) == 1
+    definition_parm_templates(definition, None, verify=True)
+    definition_parm_templates(definition, None, verify=True)
+    assert len(serialized) == 2
+    script["text"] += " parm { name mode }"
+    definition_parm_templates(definition, None, verify=True)
+    assert len(serialized) == 3
+    modified["time"] = 101
+    definition_parm_templates(definition, None)
+    assert len(serialized) == 4
+
+    assert select_template_subtree(tree, "Main/adv")[0]["name"] == "seed"
+    assert project_template_names(tree) == [{"name": "main", "type": "Folder", "children": [
+        {"name": "adv", "type": "Folder", "children": [{"name": "seed", "type": "Int"}]},
+        {"name": "scale", "type": "Float"},
+    ]}]
+    with pytest.raises(ValueError, match="Folder not found"):
+        select_template_subtree(tree, "Main/Missing")
+
+
+def test_validate_hda_library_progress_resume_and_summary(tmp_path):
+    progress = tmp_path / "progress.ndjson"
+    records = [
+        {"key": "a.hda|Sop/a", "status": "valid", "seconds": 0.5, "checks": [{"check": "is_hda_instance", "ok": True}]},
+        {"key": "b.hda|Sop/b", "status": "invalid", "seconds": 2.0, "checks": [
+            {"check": "has_parameter:scale", "ok": False},
+            {"check": "has_parameter:seed", "ok": False},
+        ]},
+    ]
+    progress.write_text("\n".join(json.dumps(r) for r in records) + '\n{"key": "c.hda|Sop/c", "sta')
+
+    done = read_progress(str(progress))
+    summary = summarize_results(list(done.values()))
+
+    assert sorted(done) == ["a.hda|Sop/a", "b.hda|Sop/b"]
+    assert summary["counts"] == {"valid": 1, "invalid": 1}
+    assert summary["failing_checks"] == {"has_parameter": 2}
+    assert summary["slowest"][0] == {"key": "b.hda|Sop/b", "seconds": 2.0}
+    assert read_progress(str(tmp_path / "missing.ndjson")) == {}
+
+
+def test_collect_shard_results_keeps_progress_of_a_crashed_worker(tmp_path):
+    progress = tmp_path / "progress.ndjson"
+    assets = [dict(path=f"{name}.hda", type_name=name, category="Sop") for name in "abcd"]
+    progress.write_text(json.dumps({"key": "c.hda|Sop/c", "status": "valid"}) + "\n")
+    chunks = [assets[:2], assets[2:]]
+    shard_results = [[{"key": "a.hda|Sop/a", "status": "valid"}, {"key": "b.hda|Sop/b", "status": "invalid"}],
+                     RuntimeError("Worker 1 exited with code -9")]
+
+    results = collect_shard_results(chunks, shard_results, str(progress))
+    assert [(result["key"], result["status"]) for result in results] == [
+        ("a.hda|Sop/a", "valid"), ("b.hda|Sop/b", "invalid"), ("c.hda|Sop/c", "valid"), ("d.hda|Sop/d", "failed"),
+    ]
+    assert "code -9" in results[3]["errors"][0]
+    assert "d.hda|Sop/d" not in read_progress(str(progress))
+
+
+def test_case_input_hash_covers_all_parms_and_frame():
+    values = {"seed": 1, "scale": 2.0}
+    parms = [types.SimpleNamespace(name=lambda name=name: name, eval=lambda name=name: values[name]) for name in values]
+    definition = types.SimpleNamespace(libraryFilePath=lambda: "/lib/asset.hda", modificationTime=lambda: 5)
+    state = {"locked": True, "matches": True}
+    ref_values = {"blend": 0.5}
+    referenced = types.SimpleNamespace(
+        path=lambda: "/obj/ctrl",
+        parms=lambda: [types.SimpleNamespace(name=lambda: "blend", eval=lambda: ref_values["blend"])],
+    )
+    node = types.SimpleNamespace(
+        path=lambda: "/obj/asset1",
+        parms=lambda: parms,
+        inputs=lambda: [],
+        references=lambda: [referenced],
+        type=lambda: types.SimpleNamespace(definition=lambda: definition, nameWithCategory=lambda: "Sop/asset"),
+        isLockedHDA=lambda: state["locked"],
+        matchesCurrentDefinition=lambda: state["matches"],
+    )
+    frame = {"value": 1.0}
+    fake_hou = types.SimpleNamespace(frame=lambda: frame["value"], applicationVersionString=lambda: "20.5")
+    case = {"name": "default", "set_parameters": {"seed": 3}}
+
+    baseline = case_input_hash(node, case, ["P"], fake_hou)
+    values["seed"] = 9
+    assert case_input_hash(node, case, ["P"], fake_hou) == baseline
+    values["scale"] = 4.0
+    changed = case_input_hash(node, case, ["P"], fake_hou)
+    assert changed != baseline
+    frame["value"] = 2.0
+    assert case_input_hash(node, case, ["P"], fake_hou) != changed
+    assert case_input_hash(node, dict(case, frame=2.0), ["P"], fake_hou) != case_input_hash(
+        node, dict(case, frame=3.0), ["P"], fake_hou
+    )
+    before = case_input_hash(node, case, ["P"], fake_hou)
+    ref_values["blend"] = 0.75
+    assert case_input_hash(node, case, ["P"], fake_hou) != before
+
+    assert cases_skippable(node)
+    state["matches"] = False
+    assert not cases_skippable(node)
+
+
+def test_diff_fingerprints_uses_hash_then_tolerance():
+    golden = {
+        "points": 8, "prims": 6, "vertices": 24,
+        "bbox_min": [-0.5, -0.5, -0.5], "bbox_max": [0.5, 0.5, 0.5],
+        "attributes": {"point:P": {"count": 8, "min": [-0.5] * 3, "max": [0.5] * 3, "mean": [0.0] * 3}},
+        "content_hash": "abc",
+    }
+    jittered = json.loads(json.dumps(golden))
+    jittered["content_hash"] = "def"
+    jittered["bbox_max"][1] += 1e-7
+    grown = json.loads(json.dumps(jittered))
+    grown["points"] = 10
+    grown["attributes"]["point:P"]["max"][1] = 0.75
+    grown["attributes"]["point:N"] = {"count": 10}
+
+    assert diff_fingerprints(golden, dict(grown, content_hash="abc"), 1e-5) == []
+    assert diff_fingerprints(golden, jittered, 1e-5) == []
+    assert diff_fingerprints(golden, grown, 1e-5) == [
+        "points: 8 -> 10",
+        "point:N: new attribute",
+        "point:P.max: [0.5, 0.5, 0.5] -> [0.5, 0.75, 0.5]",
+    ]
+
+
+class _SavableDefinition:
+    def __init__(self, library, instances=()):
+        self.library = library
+        self.stored = ""
+        self.writes = 0
+        self.instances = list(instances)
+
+    def nodeType(self):
+        return types.SimpleNamespace(instances=lambda: list(self.instances))
+
+    def libraryFilePath(self):
+        return str(self.library)
+
+    def nodeTypeName(self):
+        return "mcp::asset::1.0"
+
+    def sections(self):
+        return {"Contents.gz": types.SimpleNamespace(contents=lambda: self.stored)}
+
+    def updateFromNode(self, node):
+        self.stored = node.code
+        self.writes += 1
+        self.library.write_text(f"library v{self.writes}: {self.stored}")
+
+
+class _SavableInstance:
+    def __init__(self, path, definition, code, locked=False):
+        self._path = path
+        self.code = code
+        self.locked = locked
+        self._type = types.SimpleNamespace(definition=lambda: definition)
+
+    def path(self):
+        return self._path
+
+    def type(self):
+        return self._type
+
+    def isLockedHDA(self):
+        return self.locked
+
+    def matchesCurrentDefinition(self):
+        return self.locked
+
+    def parmTemplateGroup(self):
+        return types.SimpleNamespace(asDialogScript=lambda: "{ parm scale }")
+
+    def children(self):
+        return [object()]
+
+    def asCode(self, recurse=False):
+        return self.code
+
+
+def test_save_instances_skips_unchanged_contents_and_coalesces(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOUDINI_MCP_HDA_DIGESTS", str(tmp_path / "digests.json"))
+    definition = _SavableDefinition(tmp_path / "asset.hda")
+    first = _SavableInstance("/obj/asset1", definition, "box")
+    second = _SavableInstance("/obj/asset2", definition, "box")
+    nodes = {node.path(): node for node in (first, second)}
+    fake_hou = types.SimpleNamespace(node=nodes.get)
+
+    saved = save_instances(["/obj/asset1"], fake_hou)
+    assert saved["counts"] == {"saved": 1}
+    assert saved["library_bytes"] == definition.library.stat().st_size
+    assert save_instances(["/obj/asset1"], fake_hou)["results"][0]["reason"] == "contents unchanged since last save"
+    os.utime(definition.library, (1, 1))
+    assert save_instances(["/obj/asset1"], fake_hou)["counts"] == {"skipped": 1}
+
+    first.code = "sphere"
+    batch = save_instances(["/obj/asset2", "/obj/asset1", "/missing"], fake_hou)
+    assert batch["counts"] == {"coalesced": 1, "failed": 1, "saved": 1}
+    assert definition.writes == 2 and definition.stored == "sphere"
+    assert save_instances(["/obj/asset1"], fake_hou, force=True)["results"][0]["reason"] == "forced"
+
+
+def test_first_save_of_unmodified_instance_is_skipped(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOUDINI_MCP_HDA_DIGESTS", str(tmp_path / "digests.json"))
+    definition = _SavableDefinition(tmp_path / "asset.hda")
+    definition.stored = "box"
+    definition.library.write_text("library v0: box")
+    edited = _SavableInstance("/obj/asset1", definition, "box", locked=True)
+    fake_hou = types.SimpleNamespace(node={edited.path(): edited}.get)
+
+    assert remember_locked_contents(edited)
+    edited.locked = False
+    assert save_instances([edited.path()], fake_hou)["counts"] == {"skipped": 1}
+
+    # A restart keeps the record, since it is persisted per library.
+    monkeypatch.setattr(hda_save_cache, "_STORE", {"path": None, "entries": {}})
+    assert save_instances([edited.path()], fake_hou)["counts"] == {"skipped": 1}
+    assert definition.writes == 0
+
+    other = _SavableDefinition(tmp_path / "other.hda")
+    other.stored = "grid"
+    other.library.write_text("library v0: grid")
+    other.instances = [_SavableInstance("/obj/other1", other, "grid", locked=True)]
+    unlocked = _SavableInstance("/obj/other2", other, "grid")
+    other.instances.append(unlocked)
+    fake_hou = types.SimpleNamespace(node={unlocked.path(): unlocked}.get)
+    assert save_instances([unlocked.path()], fake_hou)["counts"] == {"skipped": 1}
+    unlocked.code = "tube"
+    result = save_instances([unlocked.path()], fake_hou)["results"][0]
+    assert (result["action"], result["reason"]) == ("saved", "contents changed")
+    assert other.writes == 1
+
+
+class _BindableParm:
+    def __init__(self, path):
+        self._path = path
+        self.bound = None
+        self.writes = 0
+
+    def path(self):
+        return self._path
+
+    def expression(self):
+        if self.bound is None:
+            raise RuntimeError("no expression")
+        return self.bound[0]
+
+    def expressionLanguage(self):
+        return self.bound[1]
+
+    def setExpression(self, expression, language):
+        self.bound = (expression, language)
+        self.writes += 1
+
+
+class _BindableNode:
+    def __init__(self, path, parms):
+        self._path = path
+        self.parms = {name: _BindableParm(f"{path}/{name}") for name in parms}
+
+    def path(self):
+        return self._path
+
+    def parm(self, name):
+        return self.parms.get(name)
+
+
+def test_apply_parameter_bindings_validates_dedupes_and_skips_bound():
+    xform = _BindableNode("/obj/asset1/xform1", ["tx", "ty", "scale"])
+    lookups = []
+
+    def child(ref):
+        lookups.append(ref)
+        return {"xform1": xform}.get(ref)
+
+    root = types.SimpleNamespace(node=child)
+    fake_hou = types.SimpleNamespace(
+        exprLanguage=types.SimpleNamespace(Python="python", Hscript="hscript"), node=lambda path: None
+    )
+    xform.parms["scale"].bound = ('ch("../scale")', "hscript")
+    bindings = [
+        {"target_node": "xform1", "target_parm": "tx", "expression": "ch('../a')"},
+        {"target_node": "xform1", "target_parm": "tx", "source_parm": "offset"},
+        {"target_node": "xform1", "target_parm": "ty", "expression": "hou.ch('../b') *", "language": "python"},
+        {"target_node": "xform1", "target_parm": "scale", "source_parm": "scale"},
+        {"target_node": "missing", "target_parm": "tx", "source_parm": "x"},
+        {"target_node": "xform1", "target_parm": "tz", "source_parm": "z"},
+    ]
+
+    result = apply_parameter_bindings(root, bindings, fake_hou)
+    assert result["counts"] == {"applied": 1, "skipped": 2, "failed": 3}
+    assert xform.parms["tx"].bound == ('ch("../offset")', "hscript") and xform.parms["tx"].writes == 1
+    assert xform.parms["scale"].writes == 0 and xform.parms["ty"].bound is None
+    assert [entry["reason"] for entry in result["skipped"]] == ["superseded by binding 1", "already bound"]
+    assert lookups == ["xform1", "missing"]
+
+    assert binding_expression_error('ch("../a") * (1 + 2', "hscript") == "unclosed '('"
+    assert binding_expression_error("`chs(\"../name\")`", "hscript") is None
+    assert binding_expression_error('strcat("a\\"b", ch("../x"))', "hscript") is None
+    assert binding_expression_error('strcat("a\\", ch("../x")', "hscript") == 'unterminated " quote'
+    assert binding_expression_error("x = hou.ch('../a')\nreturn x * 2", "python") is None
+
+
+def test_run_worker_shards_removes_its_work_dir_even_on_failure(tmp_path, monkeypatch):
+    work_dir = tmp_path / "workers"
+    work_dir.mkdir()
+    monkeypatch.setenv("HOUDINI_MCP_HYTHON", sys.executable)
+    monkeypatch.setattr(worker_pool.tempfile, "mkdtemp", lambda prefix="": str(work_dir))
+    fake_hou = types.SimpleNamespace(getenv=lambda name: None)
+
+    # Plain python cannot import hou, so the worker fails after the request file is written.
+    with pytest.raises(RuntimeError, match="Worker 0"):
+        worker_pool.run_worker_shards("tool_modules.missing", "run", [{"x": 1}], 1, fake_hou, load_hip=False)
+    assert not work_dir.exists()
+
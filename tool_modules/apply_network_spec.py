@@ -0,0 +1,396 @@
+from typing import Any, Dict, List, Optional
+import json
+import math
+
+from .cook_utils import cook_networks, manual_update_mode
+
+TOOL_NAME = "apply_network_spec"
+IS_MUTATING = True
+
+FLAG_GETTERS = {
+    "display": "isDisplayFlagSet",
+    "render": "isRenderFlagSet",
+    "bypass": "isBypassed",
+    "template": "isTemplateFlagSet",
+}
+FLAG_SETTERS = {
+    "display": "setDisplayFlag",
+    "render": "setRenderFlag",
+    "bypass": "bypass",
+    "template": "setTemplateFlag",
+}
+
+send_command = None
+
+
+def _coerce_spec(value):
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError as exc:
+            raise ValueError("spec must be a JSON object or dict") from exc
+    if not isinstance(value, dict):
+        raise ValueError("spec must be a dict with 'nodes' and optional 'connections'")
+    return value
+
+
+def _input_ref(ref):
+    """Normalize an input reference to (source_name, source_index)."""
+    if ref is None:
+        return None
+    if isinstance(ref, str):
+        return (ref, 0)
+    if isinstance(ref, dict):
+        source = ref.get("node") or ref.get("source")
+        if not source:
+            raise ValueError(f"Input reference requires 'node': {ref}")
+        return (str(source), int(ref.get("output", ref.get("source_index", 0))))
+    raise ValueError(f"Unsupported input reference: {ref!r}")
+
+
+def _normalize_expression_target(value):
+    if isinstance(value, dict) and "expression" in value:
+        return {
+            "expression": str(value["expression"]),
+            "language": str(value.get("language", "hscript")).lower(),
+        }
+    return value
+
+
+def normalize_network_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a graph spec into name-keyed nodes and a desired input map."""
+    nodes = {}
+    inputs = {}
+    for entry in spec.get("nodes", []) or []:
+        if not isinstance(entry, dict):
+            raise ValueError("Each node spec must be a dict")
+        name = str(entry.get("name", "")).strip()
+        node_type = str(entry.get("type", "")).strip()
+        if not name or not node_type:
+            raise ValueError("Each node spec requires 'name' and 'type'")
+        if name in nodes:
+            raise ValueError(f"Duplicate node name in spec: {name}")
+        flags = entry.get("flags", {}) or {}
+        unknown_flags = sorted(set(flags) - set(FLAG_SETTERS))
+        if unknown_flags:
+            raise ValueError(f"Unsupported flags on {name}: {unknown_flags}")
+        nodes[name] = {
+            "type": node_type,
+            "parms": {
+                parm_name: _normalize_expression_target(value)
+                for parm_name, value in (entry.get("parms", {}) or {}).items()
+            },
+            "flags": {key: bool(value) for key, value in flags.items()},
+        }
+        inputs[name] = {}
+        for index, ref in enumerate(entry.get("inputs", []) or []):
+            normalized = _input_ref(ref)
+            if normalized is not None:
+                inputs[name][index] = normalized
+
+    for conn in spec.get("connections", []) or []:
+        dest = str(conn.get("dest", ""))
+        source = str(conn.get("source", ""))
+        if not dest or not source:
+            raise ValueError("Each connection requires 'source' and 'dest'")
+        if dest not in nodes:
+            raise ValueError(f"Connection destination is not in the spec: {dest}")
+        inputs[dest][int(conn.get("dest_index", 0))] = (source, int(conn.get("source_index", 0)))
+
+    return {"nodes": nodes, "inputs": inputs}
+
+
+def _values_equal(left, right):
+    if isinstance(left, dict) or isinstance(right, dict):
+        return left == right
+    if isinstance(left, (list, tuple)) or isinstance(right, (list, tuple)):
+        if not isinstance(left, (list, tuple)) or not isinstance(right, (list, tuple)):
+            return False
+        return len(left) == len(right) and all(_values_equal(a, b) for a, b in zip(left, right))
+    if isinstance(left, bool) or isinstance(right, bool):
+        return left == right
+    if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+        return math.isclose(float(left), float(right), rel_tol=1e-9, abs_tol=1e-9)
+    return left == right
+
+
+def plan_network_diff(spec: Dict[str, Any], live: Dict[str, Any], delete_missing: bool = False) -> Dict[str, Any]:
+    """Diff a normalized spec against a live snapshot and return the minimal edit plan."""
+    plan = {
+        "create": [],
+        "replace": [],
+        "delete": [],
+        "parms": {},
+        "flags": {},
+        "connect": [],
+        "disconnect": [],
+        "unchanged": [],
+    }
+    # Destroying a replaced node cuts the wires of everything reading from it,
+    # so those inputs have to be reconnected even when the snapshot shows them.
+    replaced = {
+        name for name, node_spec in spec["nodes"].items()
+        if name in live and live[name]["type"] != node_spec["type"]
+    }
+
+    for name, node_spec in spec["nodes"].items():
+        current = live.get(name)
+        fresh = current is None or current["type"] != node_spec["type"]
+        if current is None:
+            plan["create"].append(name)
+        elif fresh:
+            plan["replace"].append(name)
+
+        parm_changes = {}
+        for parm_name, value in node_spec["parms"].items():
+            if fresh or not _values_equal(current["parms"].get(parm_name), value):
+                parm_changes[parm_name] = value
+        if parm_changes:
+            plan["parms"][name] = parm_changes
+
+        flag_changes = {}
+        for flag, value in node_spec["flags"].items():
+            if fresh or current["flags"].get(flag) != value:
+                flag_changes[flag] = value
+        if flag_changes:
+            plan["flags"][name] = flag_changes
+
+        desired_inputs = spec["inputs"].get(name, {})
+        live_inputs = {} if fresh else current["inputs"]
+        for index in sorted(desired_inputs):
+            source, source_index = desired_inputs[index]
+            if source in replaced or tuple(live_inputs.get(index) or ()) != (source, source_index):
+                plan["connect"].append({
+                    "dest": name,
+                    "dest_index": index,
+                    "source": source,
+                    "source_index": source_index,
+                })
+        for index in sorted(set(live_inputs) - set(desired_inputs)):
+            plan["disconnect"].append({"dest": name, "dest_index": index})
+
+        if not fresh and name not in plan["parms"] and name not in plan["flags"] and not any(
+            edit["dest"] == name for edit in plan["connect"] + plan["disconnect"]
+        ):
+            plan["unchanged"].append(name)
+
+    if delete_missing:
+        plan["delete"] = sorted(name for name in live if name not in spec["nodes"])
+
+    return plan
+
+
+def _read_parm_value(node, parm_name, target):
+    if isinstance(target, dict) and "expression" in target:
+        parm = node.parm(parm_name)
+        if parm is None:
+            return None
+        try:
+            language = "python" if "python" in str(parm.expressionLanguage()).lower() else "hscript"
+            return {"expression": parm.expression(), "language": language}
+        except Exception:
+            return None
+    if isinstance(target, (list, tuple)):
+        parm_tuple = node.parmTuple(parm_name)
+        if parm_tuple is None:
+            return None
+        return [_read_single_parm(parm, value) for parm, value in zip(parm_tuple, target)]
+    parm = node.parm(parm_name)
+    if parm is None:
+        return None
+    return _read_single_parm(parm, target)
+
+
+def _read_single_parm(parm, target):
+    if isinstance(target, str):
+        try:
+            return parm.unexpandedString()
+        except Exception:
+            return parm.evalAsString()
+    return parm.eval()
+
+
+def snapshot_network(parent, spec: Dict[str, Any], hou) -> Dict[str, Any]:
+    """Capture type, spec'd parm values, flags and inputs of the parent's children."""
+    live = {}
+    for child in parent.children():
+        name = child.name()
+        entry = {"type": child.type().name(), "parms": {}, "flags": {}, "inputs": {}}
+        node_spec = spec["nodes"].get(name)
+        if node_spec is not None and node_spec["type"] == entry["type"]:
+            for parm_name, target in node_spec["parms"].items():
+                entry["parms"][parm_name] = _read_parm_value(child, parm_name, target)
+            for flag in node_spec["flags"]:
+                getter = getattr(child, FLAG_GETTERS[flag], None)
+                if callable(getter):
+                    try:
+                        entry["flags"][flag] = bool(getter())
+                    except Exception:
+                        pass
+            for conn in child.inputConnections():
+                source = conn.inputNode()
+                if source is None:
+                    continue
+                source_ref = source.name() if source.parent() == parent else source.path()
+                entry["inputs"][conn.inputIndex()] = (source_ref, conn.outputIndex())
+        live[name] = entry
+    return live
+
+
+def _apply_parm(node, parm_name, value, hou):
+    if isinstance(value, dict) and "expression" in value:
+        parm = node.parm(parm_name)
+        if parm is None:
+            raise ValueError(f"Parameter not found: {node.path()}.{parm_name}")
+        language = hou.exprLanguage.Python if value["language"] == "python" else hou.exprLanguage.Hscript
+        parm.setExpression(value["expression"], language)
+        return
+    if isinstance(value, (list, tuple)):
+        parm_tuple = node.parmTuple(parm_name)
+        if parm_tuple is None:
+            raise ValueError(f"Parameter tuple not found: {node.path()}.{parm_name}")
+        parm_tuple.set(list(value))
+        return
+    parm = node.parm(parm_name)
+    if parm is None:
+        raise ValueError(f"Parameter not found: {node.path()}.{parm_name}")
+    parm.set(value)
+
+
+def apply_network_spec(
+    parent_path: str,
+    spec: Any,
+    delete_missing: bool = False,
+    dry_run: bool = False,
+) -> str:
+    """
+    Declaratively reconcile a network with a JSON graph spec.
+
+    Only the differences between the spec and the live network are applied,
+    inside one undo group and followed by a single cook, so re-running the
+    same spec is a no-op.
+
+    Args:
+        parent_path: Network to reconcile (e.g., '/obj/geo1')
+        spec: {"nodes": [{"name", "type", "parms", "flags", "inputs"}],
+               "connections": [{"source", "dest", "source_index", "dest_index"}]}.
+               Parm values may be scalars, lists for tuples, or
+               {"expression": str, "language": "hscript"|"python"}.
+               Flags: display, render, bypass, template.
+        delete_missing: Delete children of parent_path that are not in the spec
+        dry_run: Return the edit plan without touching the scene
+    """
+    result = send_command({
+        "type": "apply_network_spec",
+        "params": {
+            "parent_path": parent_path,
+            "spec": spec,
+            "delete_missing": delete_missing,
+            "dry_run": dry_run,
+        }
+    })
+    plan = result.get("plan", {})
+    header = "🧭 Network spec plan" if result.get("dry_run") else "✅ Network spec applied"
+    lines = [
+        header,
+        f"Parent: {result.get('parent_path')}",
+        f"Created: {plan.get('create', [])}",
+        f"Replaced: {plan.get('replace', [])}",
+        f"Deleted: {plan.get('delete', [])}",
+        f"Parm updates: {sum(len(v) for v in plan.get('parms', {}).values())}",
+        f"Flag updates: {sum(len(v) for v in plan.get('flags', {}).values())}",
+        f"Connections set/cleared: {len(plan.get('connect', []))}/{len(plan.get('disconnect', []))}",
+        f"Unchanged nodes: {len(plan.get('unchanged', []))}",
+    ]
+    if result.get("cooked"):
+        lines.append(f"Cooked: {result['cooked']}")
+    if result.get("errors"):
+        lines.append("Errors:")
+        lines.extend(f"- {err}" for err in result["errors"])
+    return "\n".join(lines)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(apply_network_spec)
+
+
+def execute_plugin(params, server, hou):
+    """Reconcile a network with a declarative spec using minimal edits."""
+    parent_path = params.get("parent_path", "")
+    parent = hou.node(parent_path)
+    if parent is None:
+        raise ValueError(f"Parent not found: {parent_path}")
+
+    spec = normalize_network_spec(_coerce_spec(params.get("spec", {})))
+
+    live = snapshot_network(parent, spec, hou)
+    plan = plan_network_diff(spec, live, bool(params.get("delete_missing", False)))
+
+    if bool(params.get("dry_run", False)):
+        return {"parent_path": parent.path(), "dry_run": True, "plan": plan, "errors": []}
+
+    errors: List[str] = []
+    with manual_update_mode(hou):
+        for name in plan["delete"] + plan["replace"]:
+            existing = parent.node(name)
+            if existing is not None:
+                existing.destroy()
+
+        created = []
+        for name in plan["create"] + plan["replace"]:
+            node = parent.createNode(spec["nodes"][name]["type"], name)
+            if node.name() != name:
+                errors.append(f"Created node was renamed by Houdini: {name} -> {node.name()}")
+            created.append(node)
+
+        for name, parm_changes in plan["parms"].items():
+            node = parent.node(name)
+            for parm_name, value in parm_changes.items():
+                try:
+                    _apply_parm(node, parm_name, value, hou)
+                except Exception as exc:
+                    errors.append(f"{name}.{parm_name}: {exc}")
+
+        for edit in plan["disconnect"]:
+            parent.node(edit["dest"]).setInput(edit["dest_index"], None)
+        for edit in plan["connect"]:
+            source = parent.node(edit["source"])
+            if source is None:
+                errors.append(f"Connection source not found: {edit['source']}")
+                continue
+            parent.node(edit["dest"]).setInput(edit["dest_index"], source, edit["source_index"])
+
+        for name, flag_changes in plan["flags"].items():
+            node = parent.node(name)
+            for flag, value in flag_changes.items():
+                setter = getattr(node, FLAG_SETTERS[flag], None)
+                if not callable(setter):
+                    errors.append(f"{name}: flag '{flag}' is not supported by {node.type().name()}")
+                    continue
+                setter(value)
+
+        for node in created:
+            try:
+                node.moveToGoodPosition()
+            except Exception:
+                pass
+
+    cook = {"cooked": [], "errors": []}
+    if any(plan[key] for key in ("create", "replace", "delete", "parms", "flags", "connect", "disconnect")):
+        session = getattr(server, "edit_session", None)
+        if session is not None:
+            # An open edit session cooks every touched network once at commit.
+            session.touch(parent.path())
+        else:
+            cook = cook_networks([parent.path()], hou)
+
+    return {
+        "parent_path": parent.path(),
+        "dry_run": False,
+        "plan": plan,
+        "cooked": cook["cooked"],
+        "errors": errors + cook["errors"],
+    }
@@ -0,0 +1,158 @@
+"""Typed-array transport helpers: base64 packing, memory-mapped files and shared memory."""
+
+from __future__ import annotations
+
+import base64
+import os
+import re
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+EXPORT_FORMATS = ("npy", "npz", "arrow", "shm")
+
+# Keep shared-memory segments referenced so they outlive the exporting call.
+_SHARED_SEGMENTS: Dict[str, Any] = {}
+
+
+def default_export_dir(hou=None) -> str:
+    """Directory for exported arrays: $HOUDINI_MCP_EXPORT_DIR, $HOUDINI_TEMP_DIR or the system temp."""
+    base = os.environ.get("HOUDINI_MCP_EXPORT_DIR")
+    if not base and hou is not None:
+        try:
+            base = hou.getenv("HOUDINI_TEMP_DIR")
+        except Exception:
+            base = None
+    path = os.path.join(base or tempfile.gettempdir(), "houdini_mcp_arrays")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def safe_array_key(key: str) -> str:
+    """Turn 'point:P' into a filesystem-safe 'point_P'."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", key)
+
+
+def to_transport_array(array):
+    """Convert object (string) arrays to fixed-width unicode so they serialize without pickle."""
+    import numpy as np
+
+    if array.dtype == object:
+        return np.asarray(array.tolist(), dtype=str)
+    return np.ascontiguousarray(array)
+
+
+def describe_array(key: str, array, **extra) -> Dict[str, Any]:
+    descriptor = {
+        "key": key,
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "nbytes": int(array.nbytes),
+    }
+    descriptor.update(extra)
+    return descriptor
+
+
+def pack_array(array) -> Dict[str, Any]:
+    """Encode a numeric array as little-endian base64 with dtype and shape."""
+    import numpy as np
+
+    if array.dtype == object:
+        raise ValueError("String arrays cannot be packed; return them as lists")
+    little = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+    return {
+        "encoding": "base64",
+        "dtype": little.dtype.str,
+        "shape": list(little.shape),
+        "data": base64.b64encode(little.tobytes()).decode("ascii"),
+    }
+
+
+def unpack_array(packed: Dict[str, Any]):
+    """Inverse of pack_array."""
+    import numpy as np
+
+    raw = base64.b64decode(packed["data"])
+    return np.frombuffer(raw, dtype=np.dtype(packed["dtype"])).reshape(packed["shape"])
+
+
+def write_arrays(arrays: Dict[str, Any], fmt: str, output_path: Optional[str] = None, hou=None) -> Dict[str, Any]:
+    """Write named arrays in the requested format and return a small descriptor."""
+    import numpy as np
+
+    fmt = str(fmt).lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format '{fmt}'. Use one of {EXPORT_FORMATS}")
+
+    stamp = f"export_{int(time.time() * 1000)}_{os.getpid()}"
+    target = output_path or os.path.join(default_export_dir(hou), stamp)
+    target = os.path.abspath(os.path.expanduser(target))
+    descriptors: List[Dict[str, Any]] = []
+    transport = {key: to_transport_array(array) for key, array in arrays.items()}
+
+    if fmt == "npy":
+        os.makedirs(target, exist_ok=True)
+        for key, array in transport.items():
+            path = os.path.join(target, f"{safe_array_key(key)}.npy")
+            mapped = np.lib.format.open_memmap(path, mode="w+", dtype=array.dtype, shape=array.shape)
+            mapped[...] = array
+            mapped.flush()
+            del mapped
+            descriptors.append(describe_array(key, array, path=path))
+    elif fmt == "npz":
+        if not target.endswith(".npz"):
+            target += ".npz"
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        np.savez(target, **{safe_array_key(key): array for key, array in transport.items()})
+        for key, array in transport.items():
+            descriptors.append(describe_array(key, array, path=target, member=safe_array_key(key)))
+    elif fmt == "arrow":
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc as ipc
+        except ImportError as exc:
+            raise ValueError("pyarrow is not available in this Houdini; use format 'npy'") from exc
+        os.makedirs(target, exist_ok=True)
+        for key, array in transport.items():
+            path = os.path.join(target, f"{safe_array_key(key)}.arrow")
+            flat = pa.array(array.reshape(-1))
+            column = pa.FixedSizeListArray.from_arrays(flat, array.shape[1]) if array.ndim == 2 else flat
+            table = pa.table({safe_array_key(key): column})
+            with ipc.new_file(path, table.schema) as writer:
+                writer.write_table(table)
+            descriptors.append(describe_array(key, array, path=path))
+    else:
+        from multiprocessing import shared_memory
+
+        for key, array in transport.items():
+            if array.dtype.kind == "U":
+                raise ValueError(f"String attribute {key} cannot be exported to shared memory")
+            segment = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+            view[...] = array
+            _SHARED_SEGMENTS[segment.name] = segment
+            descriptors.append(describe_array(key, array, shm_name=segment.name))
+        target = None
+
+    return {
+        "format": fmt,
+        "path": target,
+        "arrays": descriptors,
+        "total_bytes": sum(d["nbytes"] for d in descriptors),
+    }
+
+
+def release_shared_memory(names: Optional[List[str]] = None) -> List[str]:
+    """Close and unlink exported shared-memory segments (all of them when names is None)."""
+    released = []
+    for name in list(names if names is not None else _SHARED_SEGMENTS):
+        segment = _SHARED_SEGMENTS.pop(name, None)
+        if segment is None:
+            continue
+        try:
+            segment.close()
+            segment.unlink()
+        except Exception:
+            pass
+        released.append(name)
+    return released
@@ -0,0 +1,46 @@
+from typing import Any, Optional
+import json
+
+from .cook_utils import EditSession
+
+TOOL_NAME = "begin_edit_session"
+IS_MUTATING = False
+
+send_command = None
+
+def begin_edit_session(label: str = "mcp edit") -> str:
+    """
+    Start a deferred-cook edit session.
+
+    Houdini switches to manual update mode so subsequent mutating commands
+    (set_parameter, connect_nodes, create_node, ...) queue without recooking.
+    Call end_edit_session() to restore the update mode and cook once.
+    """
+    result = send_command({
+        "type": "begin_edit_session",
+        "params": {"label": label},
+    })
+    return (
+        f"✏️ Edit session started: {result.get('label')}\n"
+        f"Update mode: manual until end_edit_session()"
+    )
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(begin_edit_session)
+
+
+def execute_plugin(params, server, hou):
+    """Open a deferred-cook edit session on the plugin server."""
+    if server is None:
+        raise ValueError("Edit sessions require the MCP plugin server")
+    if server.edit_session is not None:
+        raise ValueError(
+            f"Edit session already active: {server.edit_session.label}. "
+            "Call end_edit_session first."
+        )
+    server.edit_session = EditSession(str(params.get("label", "mcp edit")), hou)
+    return server.edit_session.describe()
@@ -1,13 +1,23 @@
 from typing import Any, Optional
 import json
 
+from .hda_utils import apply_parameter_bindings
+
 TOOL_NAME = "bind_internal_parameters"
 IS_MUTATING = True
 
 send_command = None
 
 def bind_internal_parameters(node_path: str, bindings: Any) -> str:
-    """Bind internal parameters using expression mappings."""
+    """
+    Bind internal parameters using expression mappings.
+
+    bindings is a list of {"target_node", "target_parm", "expression" or
+    "source_parm", "language"}; relative target_node paths resolve from
+    node_path. Expressions are validated first, bindings to the same parameter
+    are deduplicated (the last wins), parameters already holding the
+    expression are skipped, and all writes share one undo entry.
+    """
     result = send_command({
         "type": "bind_internal_parameters",
         "params": {
@@ -15,11 +25,15 @@ def bind_internal_parameters(node_path: str, bindings: Any) -> str:
             "bindings": bindings,
         }
     })
-    return (
-        f"✅ Bindings applied\n"
+    counts = result.get("counts", {})
+    output = (
+        f"{'⚠️' if counts.get('failed') else '✅'} Bindings applied\n"
         f"Node: {result.get('node_path')}\n"
-        f"Applied: {result.get('num_bindings_applied')}"
+        f"Applied: {counts.get('applied')} | Skipped: {counts.get('skipped')} | Failed: {counts.get('failed')}"
     )
+    for entry in result.get("failed", []):
+        output += f"\n- binding {entry['index']} {entry.get('parm', '')}: {entry['error']}"
+    return output
 
 
 def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
@@ -40,45 +54,9 @@ def execute_plugin(params, server, hou):
     if not isinstance(bindings, list):
         raise ValueError("bindings must be a list")
 
-    applied = 0
-    for binding in bindings:
-        target_node_ref = binding.get("target_node", "")
-        target_parm_name = binding.get("target_parm", "")
-        expression = binding.get("expression")
-        language_raw = str(binding.get("language", "hscript")).lower()
-        source_parm = binding.get("source_parm", "")
-
-        if not target_node_ref or not target_parm_name:
-            raise ValueError("Each binding requires target_node and target_parm")
-
-        if target_node_ref.startswith("/"):
-            target_node = hou.node(target_node_ref)
-        elif root:
-            target_node = root.node(target_node_ref)
-        else:
-            target_node = None
-
-        if target_node is None:
-            raise ValueError(f"Target node not found: {target_node_ref}")
-
-        target_parm = target_node.parm(target_parm_name)
-        if target_parm is None:
-            raise ValueError(f"Target parameter not found: {target_node.path()}.{target_parm_name}")
-
-        if expression is None:
-            if not source_parm:
-                raise ValueError("Each binding requires either expression or source_parm")
-            expression = f'ch("../{source_parm}")'
-
-        if language_raw == "python":
-            language = hou.exprLanguage.Python
-        else:
-            language = hou.exprLanguage.Hscript
-
-        target_parm.setExpression(str(expression), language)
-        applied += 1
-
-    return {
-        "node_path": root.path() if root else None,
-        "num_bindings_applied": applied,
-    }
+    result = apply_parameter_bindings(root, bindings, hou)
+    return dict(
+        result,
+        node_path=root.path() if root else None,
+        num_bindings_applied=result["counts"]["applied"],
+    )
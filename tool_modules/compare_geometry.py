@@ -0,0 +1,225 @@
+from typing import Any, Dict, List, Optional
+import json
+
+from .geometry_cache import cached_geometry_product
+from .geometry_utils import (
+    attribute_names,
+    cached_attribute_array,
+    element_count,
+    geometry_at_frame,
+    geometry_data_ids,
+    require_geometry_node,
+    topology_arrays,
+)
+
+TOOL_NAME = "compare_geometry"
+IS_MUTATING = False
+
+send_command = None
+
+
+def align_by_id(ids_a, ids_b):
+    """Return (index_a, index_b, unmatched_a, unmatched_b) pairing elements with equal ids."""
+    import numpy as np
+
+    ids_a = np.asarray(ids_a).reshape(-1)
+    ids_b = np.asarray(ids_b).reshape(-1)
+    if np.unique(ids_a).size != ids_a.size or np.unique(ids_b).size != ids_b.size:
+        raise ValueError("id attribute values must be unique to align elements")
+    _, index_a, index_b = np.intersect1d(ids_a, ids_b, assume_unique=True, return_indices=True)
+    return index_a, index_b, int(ids_a.size - index_a.size), int(ids_b.size - index_b.size)
+
+
+def compare_attribute_arrays(array_a, array_b, tolerance: float) -> Dict[str, Any]:
+    """Vectorized max/mean absolute difference between two aligned (N, tuple) arrays."""
+    import numpy as np
+
+    if array_a.shape != array_b.shape:
+        return {"equal": False, "reason": f"shape {list(array_a.shape)} != {list(array_b.shape)}"}
+    if array_a.dtype == object or array_b.dtype == object:
+        mismatched = int(np.count_nonzero(np.any(array_a != array_b, axis=1))) if array_a.size else 0
+        return {"equal": mismatched == 0, "mismatched_elements": mismatched}
+    if array_a.size == 0:
+        return {"equal": True, "max_abs_diff": 0.0, "mean_abs_diff": 0.0, "elements_over_tolerance": 0}
+    diff = np.abs(array_a.astype(np.float64) - array_b.astype(np.float64))
+    per_element = diff.max(axis=1)
+    over = int(np.count_nonzero(per_element > tolerance))
+    return {
+        "equal": over == 0,
+        "max_abs_diff": float(diff.max()),
+        "mean_abs_diff": float(diff.mean()),
+        "elements_over_tolerance": over,
+        "worst_element": int(per_element.argmax()),
+    }
+
+
+def compare_geometry(
+    node_a: str,
+    node_b: str,
+    attributes: Optional[List[str]] = None,
+    match_by: str = "index",
+    tolerance: float = 1e-5,
+    check_topology: bool = True,
+    frame: Optional[float] = None,
+) -> str:
+    """
+    Compare the cooked geometry of two SOPs.
+
+    Short-circuits when both sides share the same geometry data (matching
+    data ids, e.g. a pass-through node); otherwise reports topology
+    equality, bbox deltas and vectorized per-attribute max/mean absolute
+    differences against a tolerance.
+
+    Args:
+        node_a, node_b: SOPs (or networks whose display SOPs are compared)
+        attributes: Attribute refs to compare (default: all shared attributes)
+        match_by: 'index', or a point attribute name (e.g. 'id') to align points by value
+        tolerance: Absolute tolerance for numeric differences
+        check_topology: Compare prim vertex counts and vertex->point references
+        frame: Evaluate at this frame instead of the current one
+    """
+    result = send_command({
+        "type": "compare_geometry",
+        "params": {
+            "node_a": node_a,
+            "node_b": node_b,
+            "attributes": attributes,
+            "match_by": match_by,
+            "tolerance": tolerance,
+            "check_topology": check_topology,
+            "frame": frame,
+        }
+    })
+    lines = [
+        f"🔍 Geometry compare: {result.get('node_a')} vs {result.get('node_b')}",
+        f"Equal: {result.get('equal')}",
+        f"Shared data: {result.get('data_ids_match')}",
+    ]
+    if not result.get("data_ids_match"):
+        lines.append(f"Counts: {result.get('counts')}")
+        lines.append(f"Topology equal: {result.get('topology_equal')}")
+        lines.append(f"BBox delta min/max: {result.get('bbox_delta_min')} / {result.get('bbox_delta_max')}")
+        if result.get("alignment"):
+            lines.append(f"Alignment: {result['alignment']}")
+        for key, stats in result.get("attributes", {}).items():
+            lines.append(f"  {key}: {json.dumps(stats, default=str)}")
+        for note in result.get("notes", []):
+            lines.append(f"Note: {note}")
+    return "\n".join(lines)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(compare_geometry)
+
+
+def execute_plugin(params, server, hou):
+    """Compare two SOP geometries by shared data ids, topology, bbox and attribute values."""
+    import numpy as np
+
+    frame = params.get("frame")
+    tolerance = float(params.get("tolerance", 1e-5))
+    match_by = str(params.get("match_by", "index") or "index")
+
+    sides = []
+    for key in ("node_a", "node_b"):
+        node = hou.node(params.get(key, "") or "")
+        if node is None:
+            raise ValueError(f"Node not found: {params.get(key)}")
+        geometry_node = require_geometry_node(node)
+        sides.append((geometry_node, geometry_at_frame(geometry_node, frame, hou)))
+    (node_a, geo_a), (node_b, geo_b) = sides
+
+    data_ids = [geometry_data_ids(geo) for _, geo in sides]
+    result = {
+        "node_a": node_a.path(),
+        "node_b": node_b.path(),
+        "data_ids_match": data_ids[0] is not None and data_ids[0] == data_ids[1],
+    }
+    if result["data_ids_match"]:
+        result["equal"] = True
+        return result
+
+    notes = []
+    counts = {
+        attrib_class: [element_count(geo_a, attrib_class), element_count(geo_b, attrib_class)]
+        for attrib_class in ("point", "prim", "vertex")
+    }
+    result["counts"] = counts
+
+    bbox_a, bbox_b = geo_a.boundingBox(), geo_b.boundingBox()
+    result["bbox_delta_min"] = (np.asarray(bbox_b.minvec()) - np.asarray(bbox_a.minvec())).tolist()
+    result["bbox_delta_max"] = (np.asarray(bbox_b.maxvec()) - np.asarray(bbox_a.maxvec())).tolist()
+    bbox_equal = max(map(abs, result["bbox_delta_min"] + result["bbox_delta_max"])) <= tolerance
+
+    topology_equal = None
+    if bool(params.get("check_topology", True)):
+        topo_a = cached_geometry_product(node_a, frame, "topology", lambda: topology_arrays(geo_a, hou), hou)
+        topo_b = cached_geometry_product(node_b, frame, "topology", lambda: topology_arrays(geo_b, hou), hou)
+        topology_equal = all(
+            left.shape == right.shape and bool(np.array_equal(left, right))
+            for left, right in zip(topo_a, topo_b)
+        )
+    result["topology_equal"] = topology_equal
+
+    names_a, names_b = attribute_names(geo_a), attribute_names(geo_b)
+    requested = params.get("attributes")
+    if requested:
+        refs = list(requested)
+    else:
+        refs = [
+            f"{attrib_class}:{name}"
+            for attrib_class in ("point", "prim", "vertex", "detail")
+            for name in sorted(set(names_a[attrib_class]) & set(names_b[attrib_class]))
+        ]
+        only = {
+            attrib_class: sorted(set(names_a[attrib_class]) ^ set(names_b[attrib_class]))
+            for attrib_class in names_a
+        }
+        only = {attrib_class: names for attrib_class, names in only.items() if names}
+        if only:
+            notes.append(f"Attributes present on only one side: {only}")
+
+    point_alignment = None
+    if match_by != "index":
+        _, _, ids_a = cached_attribute_array(node_a, geo_a, frame, f"point:{match_by}", hou)
+        _, _, ids_b = cached_attribute_array(node_b, geo_b, frame, f"point:{match_by}", hou)
+        index_a, index_b, unmatched_a, unmatched_b = align_by_id(ids_a, ids_b)
+        point_alignment = (index_a, index_b)
+        result["alignment"] = {
+            "match_by": f"point:{match_by}",
+            "matched": int(index_a.size),
+            "unmatched_a": unmatched_a,
+            "unmatched_b": unmatched_b,
+        }
+
+    attribute_results = {}
+    for ref in refs:
+        try:
+            attrib_class, attrib, array_a = cached_attribute_array(node_a, geo_a, frame, ref, hou)
+            _, _, array_b = cached_attribute_array(node_b, geo_b, frame, ref, hou)
+        except ValueError as exc:
+            attribute_results[ref] = {"equal": False, "reason": str(exc)}
+            continue
+        key = f"{attrib_class}:{attrib.name()}"
+        if attrib_class == "point" and point_alignment is not None:
+            array_a, array_b = array_a[point_alignment[0]], array_b[point_alignment[1]]
+        elif array_a.shape[0] != array_b.shape[0] and attrib_class != "detail":
+            shared = min(array_a.shape[0], array_b.shape[0])
+            notes.append(f"{key}: element counts differ, compared the first {shared} by index")
+            array_a, array_b = array_a[:shared], array_b[:shared]
+        attribute_results[key] = compare_attribute_arrays(array_a, array_b, tolerance)
+    result["attributes"] = attribute_results
+
+    counts_equal = all(left == right for left, right in counts.values())
+    result["equal"] = bool(
+        counts_equal
+        and bbox_equal
+        and topology_equal is not False
+        and all(stats.get("equal") for stats in attribute_results.values())
+        and (point_alignment is None or (result["alignment"]["unmatched_a"] == 0 and result["alignment"]["unmatched_b"] == 0))
+    )
+    result["notes"] = notes
+    return result
@@ -0,0 +1,192 @@
+"""Shared helpers for deferring and batching cooks around scene edits."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import time
+from typing import Any, Callable, Dict, Iterable, List, Set
+
+
+@contextmanager
+def manual_update_mode(hou):
+    """Switch Houdini to manual update mode, restoring the previous mode on exit."""
+    previous = None
+    try:
+        previous = hou.updateModeSetting()
+        hou.setUpdateMode(hou.updateMode.Manual)
+    except Exception:
+        previous = None
+    try:
+        yield
+    finally:
+        if previous is not None:
+            try:
+                hou.setUpdateMode(previous)
+            except Exception:
+                pass
+
+
+def parse_frames(params: Dict[str, Any]) -> List[float]:
+    """Return frames from 'frames' or 'start_frame'/'end_frame'/'step' params, or []."""
+    frames = params.get("frames")
+    if frames:
+        return [float(f) for f in frames]
+    start = params.get("start_frame")
+    end = params.get("end_frame")
+    if start is None or end is None:
+        return []
+    step = float(params.get("step", 1) or 1)
+    if step <= 0:
+        raise ValueError("step must be positive")
+    values = []
+    frame = float(start)
+    while frame <= float(end) + 1e-6:
+        values.append(frame)
+        frame += step
+    return values
+
+
+def network_output_node(network):
+    """Return the display (or render) node of a network, or None."""
+    for attr_name in ("displayNode", "renderNode"):
+        resolver = getattr(network, attr_name, None)
+        if not callable(resolver):
+            continue
+        try:
+            output = resolver()
+        except Exception:
+            output = None
+        if output is not None:
+            return output
+    return None
+
+
+def cook_networks(node_paths: Iterable[str], hou) -> Dict[str, Any]:
+    """Cook the display output of each network touched by the given node paths once."""
+    networks = {}
+    for node_path in node_paths:
+        if not node_path:
+            continue
+        node = hou.node(node_path)
+        if node is None:
+            # Deleted nodes still dirty the network that contained them.
+            node = hou.node(node_path.rsplit("/", 1)[0] or "/")
+        if node is None:
+            continue
+        # A touched network node cooks its own display chain; a touched leaf
+        # cooks the display chain of the network that contains it.
+        for candidate in (node, node.parent()):
+            if candidate is None:
+                continue
+            output = network_output_node(candidate)
+            if output is not None:
+                networks[output.path()] = output
+                break
+
+    cooked: List[str] = []
+    errors: List[str] = []
+    for output_path, output in sorted(networks.items()):
+        try:
+            output.cook(force=False)
+            cooked.append(output_path)
+        except Exception as exc:
+            errors.append(f"{output_path}: {exc}")
+
+    try:
+        if hou.isUIAvailable():
+            hou.ui.triggerUpdate()
+    except Exception:
+        pass
+
+    return {"cooked": cooked, "errors": errors}
+
+
+NODE_PATH_PARAM_KEYS = (
+    "node_path",
+    "parent",
+    "parent_path",
+    "source_path",
+    "dest_path",
+    "hda_node_path",
+)
+
+
+def touched_node_paths(params: Dict[str, Any]) -> List[str]:
+    """Return absolute node paths referenced by a command's params."""
+    paths = []
+    for key in NODE_PATH_PARAM_KEYS:
+        value = params.get(key) if isinstance(params, dict) else None
+        if isinstance(value, str) and value.startswith("/"):
+            paths.append(value)
+    return paths
+
+
+class EditSession:
+    """Deferred-cook edit session: mutations queue in manual update mode, one cook at commit."""
+
+    # Batch wrappers dispatch their inner commands individually; count those instead.
+    UNTRACKED_COMMANDS = {"run_edit_batch"}
+
+    def __init__(self, label: str, hou):
+        self.label = label
+        self.started_at = time.time()
+        self.mutations = 0
+        self.command_counts: Dict[str, int] = {}
+        self.touched_paths: Set[str] = set()
+        self.deferred: Dict[str, Callable[[], Any]] = {}
+        self._previous_mode = None
+        try:
+            self._previous_mode = hou.updateModeSetting()
+            hou.setUpdateMode(hou.updateMode.Manual)
+        except Exception:
+            self._previous_mode = None
+
+    def record(self, cmd_type: str, params: Dict[str, Any]):
+        """Record one mutating command executed while the session is open."""
+        if cmd_type in self.UNTRACKED_COMMANDS:
+            return
+        self.mutations += 1
+        self.command_counts[cmd_type] = self.command_counts.get(cmd_type, 0) + 1
+        self.touched_paths.update(touched_node_paths(params))
+
+    def touch(self, node_path: str):
+        self.touched_paths.add(node_path)
+
+    def defer(self, key: str, action: Callable[[], Any]):
+        """Run `action` at commit; a later action with the same key replaces the earlier one."""
+        self.deferred.pop(key, None)
+        self.deferred[key] = action
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "elapsed_seconds": round(time.time() - self.started_at, 3),
+            "mutations": self.mutations,
+            "command_counts": dict(self.command_counts),
+            "touched_paths": sorted(self.touched_paths),
+            "deferred_actions": len(self.deferred),
+        }
+
+    def close(self, hou, cook: bool = True) -> Dict[str, Any]:
+        """Restore the update mode and cook every touched network once."""
+        if self._previous_mode is not None:
+            try:
+                hou.setUpdateMode(self._previous_mode)
+            except Exception:
+                pass
+        summary = self.describe()
+        summary["deferred"] = []
+        for key, action in self.deferred.items():
+            try:
+                summary["deferred"].append({"key": key, "result": action()})
+            except Exception as exc:
+                summary["deferred"].append({"key": key, "error": str(exc)})
+        result = {"cooked": [], "errors": []}
+        if cook and self.mutations:
+            result = cook_networks(sorted(self.touched_paths), hou)
+        summary["cooked"] = result["cooked"]
+        summary["cook_errors"] = result["errors"]
+        # In auto update mode every recorded mutation would have cooked the
+        # displayed outputs; the session cooked only these.
+        summary["cooks_avoided"] = max(0, self.mutations - len(result["cooked"]))
+        return summary
@@ -1,6 +1,9 @@
 from typing import Any, Optional
 import json
 
+from .hda_utils import invalidate_parm_template_cache
+from .node_type_index import invalidate_node_type_index
+
 TOOL_NAME = "create_digital_asset"
 IS_MUTATING = True
 
@@ -84,8 +87,10 @@ def execute_plugin(params, server, hou):
             new_menu_name=description if description else existing_def.description(),
         )
 
+    invalidate_node_type_index()
     definition = node.type().definition()
     definition.updateFromNode(node)
+    invalidate_parm_template_cache(definition)
 
     return {
         "node_path": node.path(),
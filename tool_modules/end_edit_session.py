@@ -0,0 +1,49 @@
+from typing import Any, Optional
+import json
+
+TOOL_NAME = "end_edit_session"
+IS_MUTATING = False
+
+send_command = None
+
+def end_edit_session(cook: bool = True) -> str:
+    """
+    Commit the active edit session: restore the update mode, run deferred
+    actions (such as HDA saves queued with defer=True) and cook each touched
+    network once. Set cook=False to restore the mode without cooking.
+    """
+    result = send_command({
+        "type": "end_edit_session",
+        "params": {"cook": cook},
+    })
+    output = (
+        f"✅ Edit session committed: {result.get('label')}\n"
+        f"Mutations: {result.get('mutations')}\n"
+        f"Cooked outputs: {len(result.get('cooked', []))}\n"
+        f"Cooks avoided: {result.get('cooks_avoided')}\n"
+        f"Elapsed: {result.get('elapsed_seconds')}s"
+    )
+    if result.get("deferred"):
+        output += f"\nDeferred actions run: {len(result['deferred'])}"
+        for entry in result["deferred"]:
+            if entry.get("error"):
+                output += f"\n- {entry['key']}: {entry['error']}"
+    if result.get("cook_errors"):
+        output += "\nCook errors:\n" + "\n".join(f"- {err}" for err in result["cook_errors"])
+    return output
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(end_edit_session)
+
+
+def execute_plugin(params, server, hou):
+    """Close the active edit session and run the single deferred cook."""
+    session = getattr(server, "edit_session", None)
+    if session is None:
+        raise ValueError("No active edit session. Call begin_edit_session first.")
+    server.edit_session = None
+    return session.close(hou, cook=bool(params.get("cook", True)))
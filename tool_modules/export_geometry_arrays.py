@@ -0,0 +1,90 @@
+from typing import Any, List, Optional
+import json
+
+from .array_utils import release_shared_memory, write_arrays
+from .geometry_utils import cached_attribute_array, geometry_at_frame, require_geometry_node
+
+TOOL_NAME = "export_geometry_arrays"
+IS_MUTATING = False
+
+send_command = None
+
+def export_geometry_arrays(
+    node_path: str = "",
+    attributes: Optional[List[str]] = None,
+    format: str = "npy",
+    output_path: str = "",
+    frame: Optional[float] = None,
+    float64: bool = False,
+    release_shm: Optional[List[str]] = None,
+) -> str:
+    """
+    Export cooked SOP attributes as typed arrays outside the socket.
+
+    Writes each attribute (e.g. ["P", "N", "prim:name", "vertex:uv", "detail:foo"])
+    as a typed array and returns only a descriptor with dtype, shape and location.
+
+    Formats:
+        npy   - one memory-mappable .npy per attribute in a directory (np.load(path, mmap_mode="r"))
+        npz   - single uncompressed .npz archive
+        arrow - one Arrow IPC file per attribute (requires pyarrow in Houdini)
+        shm   - POSIX shared-memory segments (numeric attributes only);
+                free them later with release_shm=[names]
+    """
+    result = send_command({
+        "type": "export_geometry_arrays",
+        "params": {
+            "node_path": node_path,
+            "attributes": attributes or ["P"],
+            "format": format,
+            "output_path": output_path,
+            "frame": frame,
+            "float64": float64,
+            "release_shm": release_shm or [],
+        }
+    })
+    return json.dumps(result, indent=2, default=str)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(export_geometry_arrays)
+
+
+def execute_plugin(params, server, hou):
+    """Write selected geometry attributes as typed arrays and return their descriptor."""
+    released = release_shared_memory(list(params.get("release_shm", []) or [])) if params.get("release_shm") else []
+    node_path = params.get("node_path", "")
+    if not node_path:
+        if released:
+            return {"released_shm": released}
+        raise ValueError("node_path is required")
+
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+    geometry_node = require_geometry_node(node)
+    geo = geometry_at_frame(geometry_node, params.get("frame"), hou)
+
+    attributes = params.get("attributes", ["P"]) or ["P"]
+    float64 = bool(params.get("float64", False))
+    arrays = {}
+    for ref in attributes:
+        attrib_class, attrib, array = cached_attribute_array(
+            geometry_node, geo, params.get("frame"), ref, hou, float64=float64
+        )
+        arrays[f"{attrib_class}:{attrib.name()}"] = array
+
+    descriptor = write_arrays(
+        arrays,
+        params.get("format", "npy"),
+        params.get("output_path") or None,
+        hou,
+    )
+    descriptor["node_path"] = geometry_node.path()
+    descriptor["frame"] = params.get("frame") if params.get("frame") is not None else hou.frame()
+    if released:
+        descriptor["released_shm"] = released
+    return descriptor
@@ -0,0 +1,73 @@
+from typing import List, Optional
+import json
+
+from .hda_library_index import configured_directories, get_hda_library_index
+
+TOOL_NAME = "find_hda_library"
+IS_MUTATING = False
+
+send_command = None
+
+
+def find_hda_library(
+    type_name: str,
+    category: Optional[str] = None,
+    directories: Optional[List[str]] = None,
+) -> str:
+    """
+    Find which library file defines an HDA type, without opening any library.
+
+    Answers from the scan_hda_libraries index, refreshing it incrementally
+    when the name is not found. Matches exact, case-insensitive and
+    namespace/version-stripped names, e.g. 'Sop/labs::edge_smooth::2.0' or 'edge_smooth'.
+
+    Args:
+        type_name: Type name, optionally category-qualified ('Sop/name')
+        category: Restrict matches to this category (e.g. 'Sop')
+        directories: Extra directories to include if a scan is needed
+    """
+    result = send_command({
+        "type": "find_hda_library",
+        "params": {
+            "type_name": type_name,
+            "category": category,
+            "directories": directories or [],
+        }
+    })
+    matches = result.get("matches", [])
+    if not matches:
+        return f"❌ No indexed library defines '{type_name}' ({result.get('libraries')} libraries indexed)"
+    output = f"📚 '{type_name}' found in {len(matches)} definition(s) ({matches[0].get('match')} match)\n"
+    for match in matches:
+        output += (
+            f"  • {match.get('category')}/{match.get('type_name')} v{match.get('version') or '-'}: "
+            f"{match.get('path')}\n"
+        )
+    return output.rstrip("\n")
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(find_hda_library)
+
+
+def execute_plugin(params, server, hou):
+    """Resolve a type name to library files from the persistent index."""
+    type_name = str(params.get("type_name", "")).strip()
+    if not type_name:
+        raise ValueError("type_name is required")
+    index = get_hda_library_index()
+    scanned = None
+    matches = index.find(type_name, params.get("category"))
+    if not matches:
+        # Unknown names may live in libraries added since the last scan; a refresh only stats unchanged files.
+        scanned = index.scan(configured_directories(params.get("directories", []) or []), hou)
+        matches = index.find(type_name, params.get("category"))
+    return {
+        "type_name": type_name,
+        "matches": matches,
+        "libraries": index.stats()["libraries"],
+        "scanned": scanned,
+    }
@@ -0,0 +1,317 @@
+"""Cook-aware LRU cache for products derived from cooked geometry.
+
+Entries are keyed by node sessionId, a stamp, frame, product name and file stamps. For
+time-independent nodes the stamp is the cook count, so a recook makes old
+entries unreachable. Time-dependent nodes recook on every frame evaluation,
+so their stamp is instead an edit generation, bumped by node event callbacks
+on the node, its input ancestors, the nodes any of them reference and the
+contents of unlocked subnets and HDAs among them; entries for every frame
+survive until one of those nodes is edited. Files read by those nodes are
+not covered by events, so their modification times at the cached frame are
+part of the key as well. Entries with an outdated stamp are purged when a
+newer one is stored, and LRU eviction keeps the total under a byte budget.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .plugin_metrics import register_metrics_source
+
+DEFAULT_BUDGET_MB = 256
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Approximate memory held by a cached value."""
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (list, tuple)) and value and all(hasattr(v, "nbytes") for v in value):
+        return sum(int(v.nbytes) for v in value)
+    try:
+        return len(json.dumps(value, default=str))
+    except Exception:
+        return 1024
+
+
+class GeometryCache:
+    """Byte-budgeted LRU keyed by (session_id, stamp, ...); only the first two fields are interpreted."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._latest_stamp: Dict[Hashable, Any] = {}
+        self._lock = threading.RLock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key: Tuple, value: Any, nbytes: Optional[int] = None):
+        nbytes = estimate_nbytes(value) if nbytes is None else int(nbytes)
+        if nbytes > self.max_bytes:
+            return
+        session_id, stamp = key[0], key[1]
+        with self._lock:
+            if self._latest_stamp.get(session_id) != stamp:
+                self._invalidate_session(session_id, keep_stamp=stamp)
+                self._latest_stamp[session_id] = stamp
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def _invalidate_session(self, session_id, keep_stamp=None):
+        for key in [k for k in self._entries if k[0] == session_id and k[1] != keep_stamp]:
+            self.current_bytes -= self._entries.pop(key)[1]
+            self.invalidations += 1
+
+    def invalidate(self, session_id=None):
+        """Drop entries for one node (or everything)."""
+        with self._lock:
+            if session_id is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._latest_stamp.clear()
+                self.current_bytes = 0
+            else:
+                self._invalidate_session(session_id)
+                self._latest_stamp.pop(session_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+_CACHE = GeometryCache(
+    int(float(os.environ.get("HOUDINI_MCP_GEOMETRY_CACHE_MB", DEFAULT_BUDGET_MB)) * 1024 * 1024)
+)
+register_metrics_source("geometry_cache", _CACHE.stats)
+
+
+def get_geometry_cache() -> GeometryCache:
+    return _CACHE
+
+
+def _cook_count(node) -> Optional[int]:
+    fn = getattr(node, "cookCount", None)
+    if not callable(fn):
+        return None
+    try:
+        return int(fn())
+    except Exception:
+        return None
+
+
+_EDIT_EVENTS = ("ParmTupleChanged", "InputRewired", "FlagChanged", "ChildCreated", "ChildDeleted", "BeingDeleted")
+_EDIT_LOCK = threading.RLock()
+# session id of a cached node -> {"generation", "nodes", "callback", "event_types", "stale"}
+_EDIT_WATCHES: Dict[Hashable, Dict[str, Any]] = {}
+
+
+def _is_open_network(node) -> bool:
+    """True for subnets and unlocked HDAs, whose children can be edited in place."""
+    try:
+        return not node.isLockedHDA()
+    except Exception:
+        return False
+
+
+def _watched_nodes(node):
+    """The node plus, transitively, input ancestors, references and open network contents."""
+    nodes = {}
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        if current.sessionId() in nodes:
+            continue
+        nodes[current.sessionId()] = current
+        getters = ["inputAncestors", "references"]
+        if _is_open_network(current):
+            getters.append("children")
+        for getter in getters:
+            try:
+                related = getattr(current, getter)()
+            except Exception:
+                continue
+            pending.extend(other for other in related if other.sessionId() not in nodes)
+    return list(nodes.values())
+
+
+def _file_parms(nodes, hou):
+    try:
+        file_reference = hou.stringParmType.FileReference
+    except AttributeError:
+        return []
+    found = []
+    for other in nodes:
+        try:
+            parms = other.parms()
+        except Exception:
+            continue
+        for parm in parms:
+            string_type = getattr(parm.parmTemplate(), "stringType", None)
+            if callable(string_type) and string_type() == file_reference:
+                found.append(parm)
+    return found
+
+
+def _files_stamp(session_id, frame: float) -> Tuple:
+    """(path, mtime, size) of every file the watched nodes read at `frame`."""
+    with _EDIT_LOCK:
+        watch = _EDIT_WATCHES.get(session_id)
+        parms = list(watch["file_parms"]) if watch is not None else []
+    stamps = set()
+    for parm in parms:
+        try:
+            path = parm.evalAtFrame(frame)
+        except Exception:
+            continue
+        if not path:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps.add((path, None, None))
+            continue
+        stamps.add((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(stamps, key=lambda item: item[0]))
+
+
+def _remove_callbacks(nodes, event_types, callback):
+    for other in nodes:
+        try:
+            other.removeEventCallback(event_types, callback)
+        except Exception:
+            pass
+
+
+def edit_stamp(node, hou) -> Optional[int]:
+    """Edit generation of `node`, bumped whenever it or an upstream/referenced node changes.
+
+    Returns None when event callbacks are unavailable.
+    """
+    session_id = node.sessionId()
+    with _EDIT_LOCK:
+        watch = _EDIT_WATCHES.get(session_id)
+        if watch is not None and not watch["stale"]:
+            return watch["generation"]
+        generation = 0
+        if watch is not None:
+            # A rewire changed the upstream set; watch the new one, keeping the generation.
+            _remove_callbacks(watch["nodes"], watch["event_types"], watch["callback"])
+            generation = watch["generation"]
+        try:
+            event_types = tuple(getattr(hou.nodeEventType, name) for name in _EDIT_EVENTS)
+        except AttributeError:
+            return None
+        # These change the set of watched nodes, so the watch is rebuilt on the next lookup.
+        rewired = (
+            hou.nodeEventType.InputRewired,
+            hou.nodeEventType.BeingDeleted,
+            hou.nodeEventType.ChildCreated,
+            hou.nodeEventType.ChildDeleted,
+        )
+
+        def on_edit(event_type=None, **kwargs):
+            with _EDIT_LOCK:
+                current = _EDIT_WATCHES.get(session_id)
+                if current is not None:
+                    current["generation"] += 1
+                    current["stale"] = current["stale"] or event_type in rewired
+
+        registered = []
+        watched = _watched_nodes(node)
+        try:
+            for other in watched:
+                other.addEventCallback(event_types, on_edit)
+                registered.append(other)
+        except Exception:
+            _remove_callbacks(registered, event_types, on_edit)
+            _EDIT_WATCHES.pop(session_id, None)
+            return None
+        _EDIT_WATCHES[session_id] = {
+            "generation": generation,
+            "nodes": registered,
+            "callback": on_edit,
+            "event_types": event_types,
+            "stale": False,
+            "file_parms": _file_parms(watched, hou),
+        }
+        return generation
+
+
+def _is_time_dependent(node) -> bool:
+    try:
+        return bool(node.isTimeDependent())
+    except Exception:
+        return True
+
+
+def cached_geometry_product(
+    node,
+    frame: Optional[float],
+    product: Hashable,
+    compute: Callable[[], Any],
+    hou,
+    prepare: Optional[Callable[[], Any]] = None,
+):
+    """Return `compute()` for a SOP's geometry, reusing the value until the node recooks.
+
+    Non-SOP nodes pass `prepare` (e.g. a LOP's `stage`) to cook them before the lookup.
+    Time-dependent nodes are cached per frame until an edit reaches them or a file they read changes.
+    """
+    session_id = node.sessionId()
+    if _is_time_dependent(node):
+        stamp = edit_stamp(node, hou)
+        if stamp is None:
+            return compute()
+        stamp = ("edit", stamp)
+        frame_key = round(float(hou.frame() if frame is None else frame), 6)
+        files = _files_stamp(session_id, frame_key)
+    else:
+        # Cook first so the cook count reflects the geometry compute() will read.
+        (prepare or node.geometry)()
+        cook_count = _cook_count(node)
+        if cook_count is None:
+            return compute()
+        stamp = ("cook", cook_count)
+        frame_key = None
+        files = ()
+
+    key = (session_id, stamp, frame_key, product, files)
+    hit, value = _CACHE.get(key)
+    if hit:
+        return value
+    value = compute()
+    _CACHE.put(key, value)
+    return value
@@ -0,0 +1,539 @@
+"""Shared helpers for bulk, NumPy-backed reads of cooked geometry."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .geometry_cache import cached_geometry_product
+
+ATTRIB_CLASSES = ("point", "prim", "vertex", "detail")
+
+_FIND_ATTRIB = {
+    "point": "findPointAttrib",
+    "prim": "findPrimAttrib",
+    "vertex": "findVertexAttrib",
+    "detail": "findGlobalAttrib",
+}
+_ELEMENT_PREFIX = {"point": "point", "prim": "prim", "vertex": "vertex"}
+
+
+def resolve_geometry_node(node):
+    """Return the node itself if it has cookable geometry, else its display/render SOP."""
+    candidates = [node]
+    for attr_name in ("displayNode", "renderNode"):
+        resolver = getattr(node, attr_name, None)
+        if callable(resolver):
+            try:
+                candidates.append(resolver())
+            except Exception:
+                pass
+    for candidate in candidates:
+        if candidate is None:
+            continue
+        geometry_fn = getattr(candidate, "geometry", None)
+        if not callable(geometry_fn):
+            continue
+        try:
+            geometry_fn()
+            return candidate
+        except Exception:
+            continue
+    return None
+
+
+def require_geometry_node(node):
+    geometry_node = resolve_geometry_node(node)
+    if geometry_node is None:
+        raise ValueError(f"Node has no cookable geometry: {node.path()}")
+    return geometry_node
+
+
+def geometry_at_frame(sop_node, frame: Optional[float], hou):
+    """Return the SOP's cooked geometry at a frame without moving the playbar when possible."""
+    if frame is None:
+        return sop_node.geometry()
+    at_frame = getattr(sop_node, "geometryAtFrame", None)
+    if callable(at_frame):
+        return at_frame(frame)
+    original = hou.frame()
+    try:
+        hou.setFrame(frame)
+        return sop_node.geometry().freeze()
+    finally:
+        hou.setFrame(original)
+
+
+def parse_attribute_ref(ref: str) -> Tuple[Optional[str], str]:
+    """Split 'point:P' style references into (class, name); the class may be omitted."""
+    if ":" in ref:
+        attrib_class, name = ref.split(":", 1)
+        attrib_class = attrib_class.strip().lower()
+        if attrib_class == "global":
+            attrib_class = "detail"
+        if attrib_class not in ATTRIB_CLASSES:
+            raise ValueError(f"Unknown attribute class '{attrib_class}' in '{ref}'")
+        return attrib_class, name.strip()
+    return None, ref.strip()
+
+
+def find_attribute(geo, ref: str):
+    """Resolve an attribute reference to (class, hou.Attrib), searching point/prim/vertex/detail."""
+    attrib_class, name = parse_attribute_ref(ref)
+    for candidate_class in ([attrib_class] if attrib_class else ATTRIB_CLASSES):
+        attrib = getattr(geo, _FIND_ATTRIB[candidate_class])(name)
+        if attrib is not None:
+            return candidate_class, attrib
+    raise ValueError(f"Attribute not found: {ref}")
+
+
+def element_count(geo, attrib_class: str) -> int:
+    if attrib_class == "point":
+        return int(geo.intrinsicValue("pointcount"))
+    if attrib_class == "prim":
+        return int(geo.intrinsicValue("primitivecount"))
+    if attrib_class == "vertex":
+        return int(geo.intrinsicValue("vertexcount"))
+    return 1
+
+
+def attribute_dtype_name(attrib, hou) -> str:
+    data_type = attrib.dataType()
+    if data_type == hou.attribData.Float:
+        return "float32"
+    if data_type == hou.attribData.Int:
+        return "int32"
+    if data_type == hou.attribData.String:
+        return "str"
+    raise ValueError(f"Unsupported attribute data type for {attrib.name()}: {data_type}")
+
+
+def attribute_array(geo, attrib_class: str, attrib, hou, float64: bool = False):
+    """Read one attribute as a NumPy array of shape (elements, tuple_size) via bulk HOM calls."""
+    import numpy as np
+
+    if attrib.isArrayType():
+        raise ValueError(f"Array attributes are not supported for bulk reads: {attrib.name()}")
+
+    name = attrib.name()
+    tuple_size = int(attrib.size())
+    dtype_name = attribute_dtype_name(attrib, hou)
+
+    if attrib_class == "detail":
+        value = geo.attribValue(name)
+        values = list(value) if isinstance(value, (list, tuple)) else [value]
+        if dtype_name == "str":
+            return np.array(values, dtype=object).reshape(1, -1)
+        dtype = np.float64 if (dtype_name == "float32" and float64) else np.dtype(dtype_name)
+        return np.asarray(values, dtype=dtype).reshape(1, tuple_size)
+
+    prefix = _ELEMENT_PREFIX[attrib_class]
+    if dtype_name == "str":
+        values = getattr(geo, f"{prefix}StringAttribValues")(name)
+        return np.array(values, dtype=object).reshape(-1, tuple_size)
+    if dtype_name == "float32":
+        numeric_type = hou.numericData.Float64 if float64 else hou.numericData.Float32
+        raw = getattr(geo, f"{prefix}FloatAttribValuesAsString")(name, float_type=numeric_type)
+        dtype = np.float64 if float64 else np.float32
+    else:
+        raw = getattr(geo, f"{prefix}IntAttribValuesAsString")(name, int_type=hou.numericData.Int32)
+        dtype = np.int32
+    return np.frombuffer(raw, dtype=dtype).reshape(-1, tuple_size)
+
+
+def cached_attribute_array(geometry_node, geo, frame: Optional[float], ref: str, hou, float64: bool = False):
+    """Resolve and read an attribute, reusing the array until the node recooks."""
+    attrib_class, attrib = find_attribute(geo, ref)
+    array = cached_geometry_product(
+        geometry_node,
+        frame,
+        ("attrib", attrib_class, attrib.name(), bool(float64)),
+        lambda: attribute_array(geo, attrib_class, attrib, hou, float64=float64),
+        hou,
+    )
+    return attrib_class, attrib, array
+
+
+def point_positions(geo, hou, float64: bool = False):
+    """Return P as an (N, 3) NumPy array."""
+    return attribute_array(geo, "point", geo.findPointAttrib("P"), hou, float64=float64)
+
+
+def numeric_summary(array) -> Dict[str, Any]:
+    """Per-component min/max/mean of a (N, tuple_size) numeric array."""
+    import numpy as np
+
+    if array.dtype == object:
+        return {"count": int(array.shape[0]), "unique": int(len(set(array.ravel().tolist())))}
+    if array.shape[0] == 0:
+        return {"count": 0, "min": None, "max": None, "mean": None}
+    values = array.astype(np.float64, copy=False)
+    return {
+        "count": int(array.shape[0]),
+        "min": values.min(axis=0).tolist(),
+        "max": values.max(axis=0).tolist(),
+        "mean": values.mean(axis=0).tolist(),
+    }
+
+
+def geometry_summary(geo, hou, attributes: Sequence[str] = ()) -> Dict[str, Any]:
+    """Counts, bounding box and per-attribute statistics of one geometry."""
+    bbox = geo.boundingBox()
+    summary = {
+        "points": element_count(geo, "point"),
+        "prims": element_count(geo, "prim"),
+        "vertices": element_count(geo, "vertex"),
+        "bbox_min": list(bbox.minvec()),
+        "bbox_max": list(bbox.maxvec()),
+        "attributes": {},
+    }
+    for ref in attributes:
+        attrib_class, attrib = find_attribute(geo, ref)
+        array = attribute_array(geo, attrib_class, attrib, hou)
+        summary["attributes"][f"{attrib_class}:{attrib.name()}"] = numeric_summary(array)
+    return summary
+
+
+def columnar_time_series(frames: Sequence[float], summaries: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Transpose per-frame geometry summaries into frame-aligned columns."""
+    columns: Dict[str, Any] = {
+        "frames": list(frames),
+        "points": [],
+        "prims": [],
+        "vertices": [],
+        "bbox_min": [],
+        "bbox_max": [],
+        "attributes": {},
+    }
+    for index, summary in enumerate(summaries):
+        for key in ("points", "prims", "vertices", "bbox_min", "bbox_max"):
+            columns[key].append(summary.get(key))
+        for attrib_key, stats in summary.get("attributes", {}).items():
+            attrib_columns = columns["attributes"].setdefault(attrib_key, {})
+            for stat_name, value in stats.items():
+                column = attrib_columns.setdefault(stat_name, [None] * len(summaries))
+                column[index] = value
+    return columns
+
+
+# Detail wrangle that packs the whole topology into two int arrays in one compiled pass.
+TOPOLOGY_SNIPPET = """
+int counts[];
+int points[];
+for (int prim = 0; prim < nprimitives(0); prim++) {
+    int prim_points[] = primpoints(0, prim);
+    append(counts, len(prim_points));
+    append(points, prim_points);
+}
+i[]@__mcp_vertex_counts = counts;
+i[]@__mcp_vertex_points = points;
+"""
+
+
+def topology_arrays(geo, hou):
+    """Return (vertex counts per prim, point number per vertex) as int64 arrays.
+
+    Runs an attribwrangle verb over the geometry instead of walking prims and
+    vertices in Python, then reads both arrays back in bulk.
+    """
+    import numpy as np
+
+    verb = hou.sopNodeTypeCategory().nodeVerb("attribwrangle")
+    verb.setParms({"class": 0, "snippet": TOPOLOGY_SNIPPET})
+    packed = hou.Geometry()
+    verb.execute(packed, [geo])
+    return (
+        np.asarray(packed.intListAttribValue("__mcp_vertex_counts"), dtype=np.int64),
+        np.asarray(packed.intListAttribValue("__mcp_vertex_points"), dtype=np.int64),
+    )
+
+
+def geometry_data_ids(geo) -> Optional[tuple]:
+    """Element counts plus the data ids of the topology, primitive list and every attribute.
+
+    Equal tuples mean two geometries share the same data (e.g. passed through
+    unchanged), so a compare can stop without reading any values. Returns None
+    when data ids are unavailable.
+    """
+    try:
+        ids = [
+            ("counts", tuple(element_count(geo, attrib_class) for attrib_class in ("point", "prim", "vertex"))),
+            ("topology", geo.topologyDataId()),
+            ("primitives", geo.primitiveListDataId()),
+        ]
+        for attrib_class, attribs in (
+            ("point", geo.pointAttribs()),
+            ("prim", geo.primAttribs()),
+            ("vertex", geo.vertexAttribs()),
+            ("detail", geo.globalAttribs()),
+        ):
+            ids.extend((f"{attrib_class}:{a.name()}", a.dataId()) for a in sorted(attribs, key=lambda a: a.name()))
+    except Exception:
+        return None
+    return tuple(ids)
+
+
+def attribute_names(geo) -> Dict[str, List[str]]:
+    return {
+        "point": [a.name() for a in geo.pointAttribs()],
+        "prim": [a.name() for a in geo.primAttribs()],
+        "vertex": [a.name() for a in geo.vertexAttribs()],
+        "detail": [a.name() for a in geo.globalAttribs()],
+    }
+
+
+def geometry_content_hash(geometry_node, geo, frame: Optional[float], hou) -> str:
+    """Digest of element counts, topology and every non-array attribute's values.
+
+    Reads every value, so it backs fingerprints that outlive the session; use
+    geometry_data_ids() to compare geometries within one session.
+    """
+    import hashlib
+
+    digest = hashlib.sha1()
+    for attrib_class in ("point", "prim", "vertex"):
+        digest.update(f"{attrib_class}={element_count(geo, attrib_class)};".encode("utf-8"))
+    counts, point_refs = cached_geometry_product(
+        geometry_node, frame, "topology", lambda: topology_arrays(geo, hou), hou
+    )
+    digest.update(counts.tobytes())
+    digest.update(point_refs.tobytes())
+    for attrib_class, names in attribute_names(geo).items():
+        for name in sorted(names):
+            ref = f"{attrib_class}:{name}"
+            try:
+                _, _, array = cached_attribute_array(geometry_node, geo, frame, ref, hou)
+            except ValueError:
+                digest.update(f"{ref}:unsupported;".encode("utf-8"))
+                continue
+            digest.update(f"{ref}:{array.dtype.str}:{array.shape};".encode("utf-8"))
+            if array.dtype == object:
+                digest.update("\0".join(str(v) for v in array.ravel().tolist()).encode("utf-8"))
+            else:
+                digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+PACKED_SOURCE_INTRINSICS = (
+    "filename",
+    "abcfilename",
+    "abcobjectpath",
+    "usdfilename",
+    "usdprimpath",
+    "objectpath",
+    "geometryid",
+)
+
+
+def usage_histogram(usage_counts: Sequence[int]) -> Dict[str, int]:
+    """Bucket per-source instance counts by powers of ten."""
+    buckets = {"1": 0, "2-9": 0, "10-99": 0, "100-999": 0, "1000+": 0}
+    for count in usage_counts:
+        if count <= 1:
+            buckets["1"] += 1
+        elif count < 10:
+            buckets["2-9"] += 1
+        elif count < 100:
+            buckets["10-99"] += 1
+        elif count < 1000:
+            buckets["100-999"] += 1
+        else:
+            buckets["1000+"] += 1
+    return buckets
+
+
+def packed_primitive_summary(geo, hou, top_n: int = 10, count_points: bool = True) -> Dict[str, Any]:
+    """Summarize packed primitives from their intrinsics without unpacking them."""
+    import numpy as np
+
+    by_type: Dict[str, int] = {}
+    source_usage: Dict[Tuple[str, str], int] = {}
+    source_points: Dict[Tuple[str, str], int] = {}
+    source_intrinsics: Dict[str, Tuple[str, ...]] = {}
+    transforms = []
+    packed_count = 0
+    instanced_points = 0
+
+    for prim in geo.iterPrims():
+        if not isinstance(prim, hou.PackedPrim):
+            continue
+        packed_count += 1
+        type_name = str(prim.intrinsicValue("typename"))
+        by_type[type_name] = by_type.get(type_name, 0) + 1
+
+        keys = source_intrinsics.get(type_name)
+        if keys is None:
+            available = set(prim.intrinsicNames())
+            keys = tuple(name for name in PACKED_SOURCE_INTRINSICS if name in available)
+            source_intrinsics[type_name] = keys
+        if keys:
+            source = "|".join(str(prim.intrinsicValue(name)) for name in keys)
+        else:
+            # No identifying intrinsic: fall back to a bounds signature of the packed contents.
+            source = "bounds:" + ",".join(f"{v:.6g}" for v in prim.intrinsicValue("packedbounds"))
+        source_key = (type_name, source)
+        source_usage[source_key] = source_usage.get(source_key, 0) + 1
+
+        if count_points:
+            if source_key not in source_points:
+                try:
+                    source_points[source_key] = int(prim.intrinsicValue("pointcount"))
+                except Exception:
+                    source_points[source_key] = 0
+            instanced_points += source_points[source_key]
+
+        transforms.append(prim.intrinsicValue("packedfulltransform"))
+
+    ranked = sorted(source_usage.items(), key=lambda item: item[1], reverse=True)
+    scale_array = None
+    if transforms:
+        # One batched determinant over the stacked (N, 3, 3) rotation/scale blocks.
+        matrices = np.asarray(transforms, dtype=np.float64).reshape(-1, 4, 4)
+        scale_array = np.cbrt(np.abs(np.linalg.det(matrices[:, :3, :3])))
+    return {
+        "packed_prims": packed_count,
+        "total_prims": element_count(geo, "prim"),
+        "packed_types": by_type,
+        "unique_sources": len(source_usage),
+        "instanced_points": instanced_points if count_points else None,
+        "usage_histogram": usage_histogram(list(source_usage.values())),
+        "top_sources": [
+            {
+                "type": type_name,
+                "source": source,
+                "instances": count,
+                "points_per_instance": source_points.get((type_name, source)),
+            }
+            for (type_name, source), count in ranked[:top_n]
+        ],
+        "uniform_scale": None if scale_array is None else {
+            "min": float(scale_array.min()),
+            "max": float(scale_array.max()),
+            "mean": float(scale_array.mean()),
+        },
+    }
+
+
+AUTO_STRIDE_VOXEL_BUDGET = 1 << 24
+
+
+def auto_voxel_stride(resolution: Sequence[int], budget: int = AUTO_STRIDE_VOXEL_BUDGET) -> int:
+    """Smallest uniform stride that keeps the sampled voxel count within budget."""
+    total = 1
+    for axis in resolution:
+        total *= max(1, int(axis))
+    stride = 1
+    while total / float(stride ** 3) > budget:
+        stride += 1
+    return stride
+
+
+def voxel_value_summary(values, bins: int = 16) -> Dict[str, Any]:
+    """min/max/mean, nonzero count and a fixed-bin histogram of sampled voxel values."""
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float32).reshape(-1)
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return {"sampled": int(values.size), "min": None, "max": None, "mean": None, "nonzero": 0, "histogram": None}
+    low, high = float(finite.min()), float(finite.max())
+    counts, edges = np.histogram(finite, bins=max(1, int(bins)), range=(low, high if high > low else low + 1.0))
+    return {
+        "sampled": int(values.size),
+        "min": low,
+        "max": high,
+        "mean": float(finite.mean(dtype=np.float64)),
+        "nonzero": int(np.count_nonzero(finite)),
+        "nonfinite": int(values.size - finite.size),
+        "histogram": {"edges": edges.tolist(), "counts": counts.tolist()},
+    }
+
+
+def _volume_samples(prim, resolution: Sequence[int], stride: int):
+    """Read a hou.Volume as float32 (z, y, x), stepping through z slices when strided."""
+    import numpy as np
+
+    rx, ry, rz = (int(axis) for axis in resolution)
+    if stride <= 1:
+        return np.frombuffer(prim.allVoxelsAsString(), dtype=np.float32).reshape(rz, ry, rx)
+    slices = [
+        np.frombuffer(prim.voxelSliceAsString("xy", z), dtype=np.float32).reshape(ry, rx)[::stride, ::stride]
+        for z in range(0, rz, stride)
+    ]
+    return np.stack(slices) if slices else np.zeros((0, 0, 0), dtype=np.float32)
+
+
+def _vdb_background(prim, lower: Sequence[int]) -> float:
+    """Background value of a VDB: what every inactive voxel reads back as."""
+    try:
+        return float(prim.backgroundValue())
+    except Exception:
+        # A voxel just outside the active bounding box is inactive by definition.
+        return float(prim.voxel((lower[0] - 1, lower[1] - 1, lower[2] - 1)))
+
+
+def _vdb_samples(prim, hou, stride: int):
+    """Read the active voxels of a hou.VDB's active bounding box, one strided z slab per call.
+
+    Returns (resolution, active values, sampled voxel count). Inactive voxels
+    read back as the background (negated inside an SDF) and are dropped.
+    """
+    import numpy as np
+
+    bbox = prim.activeVoxelBoundingBox()
+    lower = [int(round(v)) for v in bbox.minvec()]
+    upper = [int(round(v)) for v in bbox.maxvec()]
+    slabs = []
+    for z in range(lower[2], upper[2] + 1, max(1, stride)):
+        slab_box = hou.BoundingBox(lower[0], lower[1], z, upper[0], upper[1], z)
+        slab = np.asarray(prim.voxelRangeAsFloat(slab_box), dtype=np.float32)
+        slab = slab.reshape(upper[1] - lower[1] + 1, upper[0] - lower[0] + 1)
+        slabs.append(slab[::stride, ::stride])
+    resolution = [upper[axis] - lower[axis] + 1 for axis in range(3)]
+    values = np.stack(slabs).reshape(-1) if slabs else np.zeros(0, dtype=np.float32)
+    background = np.float32(_vdb_background(prim, lower))
+    inactive = np.abs(values) == abs(background) if prim.isSDF() else values == background
+    return resolution, values[~inactive], int(values.size)
+
+
+def volume_summary(geo, hou, stride: int = 1, bins: int = 16) -> List[Dict[str, Any]]:
+    """Per-volume resolution, voxel size, active voxels and value statistics from bulk voxel reads.
+
+    stride > 1 samples every stride-th voxel along each axis; stride 0 picks one automatically.
+    """
+    name_attrib = geo.findPrimAttrib("name")
+    volumes = []
+    for prim in geo.iterPrims():
+        is_vdb = isinstance(prim, hou.VDB)
+        if not is_vdb and not isinstance(prim, hou.Volume):
+            continue
+        entry: Dict[str, Any] = {
+            "prim": prim.number(),
+            "name": prim.attribValue(name_attrib) if name_attrib is not None else None,
+            "type": "vdb" if is_vdb else "volume",
+            "voxel_size": list(prim.voxelSize()),
+        }
+        if is_vdb:
+            entry["active_voxels"] = int(prim.activeVoxelCount())
+            entry["is_sdf"] = bool(prim.isSDF())
+            if prim.isEmpty():
+                entry.update({
+                    "resolution": [0, 0, 0], "stride": 1, "sampled_voxels": 0, "values": voxel_value_summary([], bins),
+                })
+                volumes.append(entry)
+                continue
+            bbox = prim.activeVoxelBoundingBox()
+            extent = [int(round(hi - lo)) + 1 for lo, hi in zip(bbox.minvec(), bbox.maxvec())]
+            step = stride or auto_voxel_stride(extent)
+            entry["resolution"], values, entry["sampled_voxels"] = _vdb_samples(prim, hou, step)
+        else:
+            entry["resolution"] = [int(axis) for axis in prim.resolution()]
+            step = stride or auto_voxel_stride(entry["resolution"])
+            values = _volume_samples(prim, entry["resolution"], step)
+            entry["sampled_voxels"] = int(values.size)
+        entry["stride"] = step
+        entry["values"] = voxel_value_summary(values, bins)
+        if not is_vdb:
+            # Dense volumes have no activity mask; nonzero voxels are the closest equivalent.
+            entry["active_voxels"] = entry["values"]["nonzero"] * step ** 3
+        volumes.append(entry)
+    return volumes
@@ -0,0 +1,172 @@
+from typing import Any, Dict, List, Optional
+import json
+
+TOOL_NAME = "get_cook_stats"
+IS_MUTATING = False
+
+send_command = None
+
+
+def _safe_call(node, method_name, *args, default=None):
+    fn = getattr(node, method_name, None)
+    if not callable(fn):
+        return default
+    try:
+        return fn(*args)
+    except Exception:
+        return default
+
+
+def _cached_geometry_memory(node):
+    """Return cached SOP geometry memory without triggering a cook."""
+    try:
+        if node.type().category().name() != "Sop":
+            return None
+    except Exception:
+        return None
+    if _safe_call(node, "needsToCook", default=True):
+        return None
+    geo = _safe_call(node, "geometry")
+    if geo is None:
+        return None
+    try:
+        return int(geo.intrinsicValue("memoryusage"))
+    except Exception:
+        return None
+
+
+def collect_node_cook_stats(node) -> Dict[str, Any]:
+    """Collect last cook time, cook count, time dependency, messages and memory for a node."""
+    errors = _safe_call(node, "errors", default=()) or ()
+    warnings = _safe_call(node, "warnings", default=()) or ()
+    last_cook_time = _safe_call(node, "lastCookTime", default=None)
+    return {
+        "path": node.path(),
+        "type": node.type().name(),
+        "last_cook_ms": float(last_cook_time) if last_cook_time is not None else None,
+        "cook_count": _safe_call(node, "cookCount", default=None),
+        "time_dependent": bool(_safe_call(node, "isTimeDependent", default=False)),
+        "num_errors": len(errors),
+        "num_warnings": len(warnings),
+        "first_error": errors[0] if errors else None,
+        "geometry_memory_bytes": _cached_geometry_memory(node),
+    }
+
+
+def summarize_cook_stats(rows: List[Dict[str, Any]], edges: List[List[str]], top_n: int) -> Dict[str, Any]:
+    """Rank per-node stats into top offenders and a time-dependent subgraph."""
+    def _top(key):
+        ranked = [row for row in rows if row.get(key)]
+        ranked.sort(key=lambda row: row[key], reverse=True)
+        return [{"path": row["path"], "type": row["type"], key: row[key]} for row in ranked[:top_n]]
+
+    time_dependent = {row["path"] for row in rows if row["time_dependent"]}
+    memory_values = [row["geometry_memory_bytes"] for row in rows if row["geometry_memory_bytes"]]
+    return {
+        "num_nodes": len(rows),
+        "total_last_cook_ms": round(sum(row["last_cook_ms"] or 0.0 for row in rows), 3),
+        "total_geometry_memory_bytes": sum(memory_values),
+        "top_by_cook_time": _top("last_cook_ms"),
+        "top_by_cook_count": _top("cook_count"),
+        "top_by_memory": _top("geometry_memory_bytes"),
+        "nodes_with_errors": [
+            {"path": row["path"], "error": row["first_error"]}
+            for row in rows if row["num_errors"]
+        ],
+        "nodes_with_warnings": [row["path"] for row in rows if row["num_warnings"]],
+        "time_dependent_subgraph": {
+            "nodes": sorted(time_dependent),
+            "edges": [edge for edge in edges if edge[0] in time_dependent and edge[1] in time_dependent],
+        },
+    }
+
+
+def get_cook_stats(
+    root_path: str = "/obj",
+    recursive: bool = True,
+    include_locked_assets: bool = False,
+    top_n: int = 10,
+) -> str:
+    """
+    Read-only cook statistics for every node under a network.
+
+    Reports top offenders by last cook time, cook count and cached geometry
+    memory, nodes with errors/warnings, and the time-dependent subgraph (nodes
+    that recook every frame and the connections between them). Never cooks.
+
+    Args:
+        root_path: Network to walk (e.g., '/obj', '/obj/geo1')
+        recursive: Walk all descendants instead of direct children
+        include_locked_assets: Also descend into locked HDA contents
+        top_n: Rows per ranking
+    """
+    result = send_command({
+        "type": "get_cook_stats",
+        "params": {
+            "root_path": root_path,
+            "recursive": recursive,
+            "include_locked_assets": include_locked_assets,
+            "top_n": top_n,
+        }
+    })
+    lines = [
+        f"🔥 Cook stats: {result.get('root_path')}",
+        f"Nodes: {result.get('num_nodes')}  Sum of last cooks: {result.get('total_last_cook_ms')} ms  "
+        f"Cached geometry: {result.get('total_geometry_memory_bytes')} bytes",
+        "",
+        "Slowest last cook:",
+    ]
+    lines.extend(f"  {row['last_cook_ms']:.2f} ms  {row['path']}" for row in result.get("top_by_cook_time", []))
+    lines.append("Most cooks:")
+    lines.extend(f"  {row['cook_count']:>6}  {row['path']}" for row in result.get("top_by_cook_count", []))
+    lines.append("Most cached geometry memory:")
+    lines.extend(
+        f"  {row['geometry_memory_bytes']:>12}  {row['path']}" for row in result.get("top_by_memory", [])
+    )
+    subgraph = result.get("time_dependent_subgraph", {})
+    lines.append(
+        f"Time-dependent: {len(subgraph.get('nodes', []))} nodes, {len(subgraph.get('edges', []))} edges"
+    )
+    lines.extend(f"  {path}" for path in subgraph.get("nodes", [])[:50])
+    if result.get("nodes_with_errors"):
+        lines.append("Errors:")
+        lines.extend(f"  {row['path']}: {row['error']}" for row in result["nodes_with_errors"])
+    if result.get("nodes_with_warnings"):
+        lines.append(f"Warnings on: {result['nodes_with_warnings']}")
+    return "\n".join(lines)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(get_cook_stats)
+
+
+def execute_plugin(params, server, hou):
+    """Walk a network once and aggregate cook statistics without cooking."""
+    root_path = params.get("root_path", "/obj")
+    root = hou.node(root_path)
+    if not root:
+        raise ValueError(f"Node not found: {root_path}")
+    top_n = max(1, int(params.get("top_n", 10) or 10))
+
+    if bool(params.get("recursive", True)):
+        nodes = root.allSubChildren(
+            recurse_in_locked_nodes=bool(params.get("include_locked_assets", False))
+        )
+    else:
+        nodes = root.children()
+
+    rows = []
+    edges = []
+    for node in nodes:
+        rows.append(collect_node_cook_stats(node))
+        for conn in node.inputConnections():
+            source = conn.inputNode()
+            if source is not None:
+                edges.append([source.path(), node.path()])
+
+    summary = summarize_cook_stats(rows, edges, top_n)
+    summary["root_path"] = root.path()
+    return summary
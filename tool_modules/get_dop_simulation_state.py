@@ -0,0 +1,211 @@
+from typing import Any, Dict, List, Optional
+import fnmatch
+import json
+import os
+import time
+
+from .cook_utils import parse_frames
+
+TOOL_NAME = "get_dop_simulation_state"
+IS_MUTATING = False
+
+MAX_FIELD_ITEMS = 16
+
+send_command = None
+
+
+def dop_value_to_json(value) -> Any:
+    """Convert a DOP record field (vectors, matrices, quaternions...) to JSON-friendly values."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    try:
+        items = list(value)
+    except TypeError:
+        return str(value)
+    if len(items) > MAX_FIELD_ITEMS:
+        return {"length": len(items), "head": [dop_value_to_json(item) for item in items[:MAX_FIELD_ITEMS]]}
+    return [dop_value_to_json(item) for item in items]
+
+
+def record_fields(record, field_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    names = field_names or list(record.fieldNames())
+    fields = {}
+    for name in names:
+        try:
+            fields[name] = dop_value_to_json(record.field(name))
+        except Exception:
+            continue
+    return fields
+
+
+def dop_data_tree(data, record_types: List[str], max_depth: int, depth: int = 0) -> Dict[str, Any]:
+    """Describe a DopData node: type, record types, selected record fields and subdata down to max_depth."""
+    node: Dict[str, Any] = {"data_type": data.dataType()}
+    available = list(data.recordTypes())
+    node["record_types"] = available
+    records = {}
+    for record_type in record_types:
+        if record_type in available:
+            records[record_type] = [record_fields(record) for record in data.records(record_type)]
+    if records:
+        node["records"] = records
+    subdata = data.subData()
+    if depth < max_depth:
+        node["subdata"] = {
+            name: dop_data_tree(child, record_types, max_depth, depth + 1)
+            for name, child in sorted(subdata.items())
+        }
+    elif subdata:
+        node["subdata_names"] = sorted(subdata)
+    return node
+
+
+def get_dop_simulation_state(
+    node_path: str,
+    frames: Optional[List[float]] = None,
+    start_frame: Optional[float] = None,
+    end_frame: Optional[float] = None,
+    step: float = 1,
+    objects: str = "*",
+    record_types: Optional[List[str]] = None,
+    max_depth: int = 1,
+    stream_path: Optional[str] = None,
+) -> str:
+    """
+    Inspect DOP simulation objects, their subdata trees and records over frames.
+
+    Frames are visited in ascending order so the simulation advances (or reads
+    its cache) once instead of resimulating, and the original frame is restored.
+    With stream_path, each frame is appended to an NDJSON file as soon as it
+    is evaluated and only a summary is returned.
+
+    Args:
+        node_path: DOP network (or any DOP node inside one)
+        frames: Explicit frames; otherwise start_frame/end_frame/step (default: current frame)
+        step: Frame stride for start_frame/end_frame
+        objects: Object name pattern (fnmatch, e.g. 'cloth*')
+        record_types: Records to read on every data node (default: ["Basic"])
+        max_depth: Levels of subdata to expand below each object
+        stream_path: NDJSON file written frame by frame
+    """
+    result = send_command({
+        "type": "get_dop_simulation_state",
+        "params": {
+            "node_path": node_path,
+            "frames": frames,
+            "start_frame": start_frame,
+            "end_frame": end_frame,
+            "step": step,
+            "objects": objects,
+            "record_types": record_types,
+            "max_depth": max_depth,
+            "stream_path": stream_path,
+        }
+    })
+    output = f"💥 DOP simulation: {result.get('node_path')}\n"
+    output += f"Frames: {len(result.get('frame_summaries', []))} | cache enabled: {result.get('cache_enabled')}\n"
+    if result.get("stream_path"):
+        output += f"Streamed to: {result['stream_path']} ({result.get('bytes_written')} bytes)\n"
+    for summary in result.get("frame_summaries", []):
+        output += (
+            f"  frame {summary['frame']}: {summary['object_count']} objects "
+            f"({summary['seconds']:.3f}s) {', '.join(summary['objects'][:10])}\n"
+        )
+    if result.get("frames") and not result.get("stream_path"):
+        output += json.dumps(result["frames"], default=str)
+    return output.rstrip("\n")
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(get_dop_simulation_state)
+
+
+def _is_dop_network(node) -> bool:
+    try:
+        return node.type().name() == "dopnet"
+    except Exception:
+        return False
+
+
+def resolve_dop_network(node):
+    """The DOP network `node` is or belongs to; every DOP node has simulation(), so check the type."""
+    if _is_dop_network(node):
+        return node
+    dop_net = getattr(node, "dopNetNode", None)
+    network = dop_net() if callable(dop_net) else None
+    parent = node.parent()
+    while network is None and parent is not None:
+        if _is_dop_network(parent):
+            network = parent
+        parent = parent.parent()
+    if network is None:
+        raise ValueError(f"Node {node.path()} is not a DOP network or DOP node")
+    return network
+
+
+def execute_plugin(params, server, hou):
+    """Walk DOP objects and data per frame, restoring the current frame afterwards."""
+    node_path = params.get("node_path", "")
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+    network = resolve_dop_network(node)
+
+    original_frame = hou.frame()
+    frames = sorted(set(parse_frames(params))) or [original_frame]
+    pattern = params.get("objects") or "*"
+    record_types = list(params.get("record_types") or ["Basic"])
+    max_depth = max(0, int(params.get("max_depth", 1)))
+    stream_path = params.get("stream_path")
+    cache_parm = network.parm("cacheenabled")
+
+    frame_states = []
+    summaries = []
+    stream = None
+    if stream_path:
+        stream_path = os.path.abspath(os.path.expanduser(stream_path))
+        os.makedirs(os.path.dirname(stream_path), exist_ok=True)
+        stream = open(stream_path, "w", encoding="utf-8")
+    try:
+        for frame in frames:
+            started = time.perf_counter()
+            hou.setFrame(frame)
+            simulation = network.simulation()
+            state_objects = {
+                dop_object.name(): dict(
+                    dop_data_tree(dop_object, record_types, max_depth),
+                    objid=dop_object.objid(),
+                )
+                for dop_object in simulation.objects()
+                if fnmatch.fnmatch(dop_object.name(), pattern)
+            }
+            state = {"frame": frame, "objects": state_objects}
+            summaries.append({
+                "frame": frame,
+                "object_count": len(state_objects),
+                "objects": sorted(state_objects),
+                "seconds": time.perf_counter() - started,
+            })
+            if stream is not None:
+                stream.write(json.dumps(state, default=str) + "\n")
+                stream.flush()
+            else:
+                frame_states.append(state)
+    finally:
+        if stream is not None:
+            stream.close()
+        hou.setFrame(original_frame)
+
+    result = {
+        "node_path": network.path(),
+        "cache_enabled": bool(cache_parm.eval()) if cache_parm is not None else None,
+        "frame_summaries": summaries,
+        "frames": frame_states,
+    }
+    if stream_path:
+        result["stream_path"] = stream_path
+        result["bytes_written"] = os.path.getsize(stream_path)
+    return result
@@ -22,7 +22,7 @@ def register_mcp_tool(mcp, send_command, legacy_bridge_functions=None, tool_deco
         - Start with "/" to see the root level
         - Use "/obj" to see all object-level nodes (default)
         - Use "/obj/geo1" to see inside a geometry node
-        - Use "/stage" for USD/Solaris nodes
+        - Use "/stage" for USD/Solaris nodes (get_usd_stage shows the composed stage)
         - Use "/ch" for channel operators
 
         This is NON-RECURSIVE - it only shows direct children, making it fast
@@ -1,7 +1,12 @@
 from typing import Any, Optional
 import json
 
-from .hda_utils import parm_template_to_dict, resolve_hda_definition
+from .hda_utils import (
+    definition_parm_templates,
+    project_template_names,
+    resolve_hda_definition,
+    select_template_subtree,
+)
 
 TOOL_NAME = "get_hda_parm_templates"
 IS_MUTATING = False
@@ -12,14 +17,31 @@ def get_hda_parm_templates(
     node_path: Optional[str] = None,
     type_name: Optional[str] = None,
     definition_name: Optional[str] = None,
+    names_only: bool = False,
+    folder_path: Optional[str] = None,
+    verify: bool = False,
 ) -> str:
-    """Get parameter templates from an HDA definition."""
+    """
+    Get parameter templates from an HDA definition.
+
+    Serialized templates are cached per definition until it is modified.
+
+    Args:
+        names_only: Return only name/type (and children) for each template
+        folder_path: Return only the contents of this folder, e.g. "Main/Advanced"
+                     (each level matches a folder name or label)
+        verify: Also hash the dialog script to catch edits that left the
+                definition's modification time unchanged
+    """
     result = send_command({
         "type": "get_hda_parm_templates",
         "params": {
             "node_path": node_path,
             "type_name": type_name,
             "definition_name": definition_name,
+            "names_only": names_only,
+            "folder_path": folder_path,
+            "verify": verify,
         }
     })
     return json.dumps(result, indent=2, default=str)
@@ -35,12 +57,16 @@ def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool
 def execute_plugin(params, server, hou):
     """Get parameter templates from an HDA definition."""
     _, definition = resolve_hda_definition(params, hou)
-    ptg = definition.parmTemplateGroup()
-    templates = [parm_template_to_dict(entry, hou) for entry in ptg.entries()]
+    templates = definition_parm_templates(definition, hou, verify=bool(params.get("verify", False)))
+    if params.get("folder_path"):
+        templates = select_template_subtree(templates, params["folder_path"])
+    if params.get("names_only"):
+        templates = project_template_names(templates)
 
     return {
         "definition_name": definition.nodeTypeName(),
         "library_file_path": definition.libraryFilePath(),
+        "folder_path": params.get("folder_path"),
         "num_top_level_templates": len(templates),
         "templates": templates,
     }
@@ -0,0 +1,29 @@
+from typing import Any, Optional
+import json
+
+from .plugin_metrics import collect_metrics
+
+TOOL_NAME = "get_plugin_metrics"
+IS_MUTATING = False
+
+send_command = None
+
+def get_plugin_metrics() -> str:
+    """Report plugin-side cache and index metrics (entries, bytes, hit ratio, evictions)."""
+    result = send_command({
+        "type": "get_plugin_metrics",
+        "params": {},
+    })
+    return json.dumps(result, indent=2, default=str)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(get_plugin_metrics)
+
+
+def execute_plugin(params, server, hou):
+    """Collect metrics from every registered plugin-side cache."""
+    return collect_metrics()
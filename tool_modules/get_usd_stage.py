@@ -0,0 +1,228 @@
+from typing import Any, Dict, List, Optional
+import json
+
+from .geometry_cache import cached_geometry_product
+
+TOOL_NAME = "get_usd_stage"
+IS_MUTATING = False
+
+MAX_PAGE_PRIMS = 10000
+MAX_ARRAY_ITEMS = 16
+
+send_command = None
+
+
+class StageTraversal:
+    """Flattened prim records of one traversal, stored column-wise for cheap paging."""
+
+    def __init__(self):
+        self.paths: List[str] = []
+        self.types: List[str] = []
+        self.depths: List[int] = []
+        self.active: List[bool] = []
+        self.instanceable: List[bool] = []
+        self.pruned_at_depth = 0
+
+    def append(self, path: str, type_name: str, depth: int, active: bool, instanceable: bool):
+        self.paths.append(path)
+        self.types.append(type_name)
+        self.depths.append(depth)
+        self.active.append(active)
+        self.instanceable.append(instanceable)
+
+    def __len__(self):
+        return len(self.paths)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(path) + len(type_name) for path, type_name in zip(self.paths, self.types)) + 48 * len(self)
+
+    def type_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for type_name in self.types:
+            counts[type_name] = counts.get(type_name, 0) + 1
+        return counts
+
+
+def traverse_stage(stage, root_path: str, max_depth: Optional[int]):
+    """Walk the stage below root_path (inclusive), pruning below max_depth."""
+    from pxr import Sdf, Usd
+
+    root = stage.GetPrimAtPath(Sdf.Path(root_path))
+    if not root or not root.IsValid():
+        raise ValueError(f"Prim not found on stage: {root_path}")
+    root_depth = root.GetPath().pathElementCount
+    traversal = StageTraversal()
+    iterator = iter(Usd.PrimRange(root, Usd.PrimAllPrimsPredicate))
+    for prim in iterator:
+        depth = prim.GetPath().pathElementCount - root_depth
+        traversal.append(
+            str(prim.GetPath()),
+            str(prim.GetTypeName()),
+            depth,
+            bool(prim.IsActive()),
+            bool(prim.IsInstanceable()),
+        )
+        if max_depth is not None and depth >= max_depth:
+            if prim.GetChildren():
+                traversal.pruned_at_depth += 1
+            iterator.PruneChildren()
+    return traversal
+
+
+def filter_traversal(traversal: StageTraversal, types: List[str], include_inactive: bool) -> List[int]:
+    """Indices of records matching the type filter (exact type names)."""
+    wanted = set(types)
+    return [
+        index
+        for index in range(len(traversal))
+        if (not wanted or traversal.types[index] in wanted)
+        and (include_inactive or traversal.active[index])
+    ]
+
+
+def usd_value_to_json(value) -> Any:
+    """Convert a USD attribute value to something json.dumps can emit."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    try:
+        items = list(value)
+    except TypeError:
+        return str(value)
+    if len(items) > MAX_ARRAY_ITEMS:
+        return {"length": len(items), "head": [usd_value_to_json(item) for item in items[:MAX_ARRAY_ITEMS]]}
+    return [usd_value_to_json(item) for item in items]
+
+
+def get_usd_stage(
+    node_path: str,
+    prim_path: str = "/",
+    types: Optional[List[str]] = None,
+    max_depth: Optional[int] = None,
+    include_inactive: bool = True,
+    attributes: Optional[List[str]] = None,
+    offset: int = 0,
+    limit: int = 500,
+) -> str:
+    """
+    Traverse the composed USD stage of a LOP node.
+
+    The traversal below prim_path is cached per LOP cook, so paging through a
+    large stage only re-reads the requested attribute values.
+
+    Args:
+        node_path: LOP node whose output stage is read (e.g. /stage/output0)
+        prim_path: Only prims at or below this path
+        types: Only prims with one of these type names (e.g. ["Mesh", "Xform"])
+        max_depth: Do not descend more than this many levels below prim_path
+        include_inactive: Also list deactivated prims
+        attributes: Attribute names whose values are read for each returned prim
+        offset: Index of the first matching prim to return
+        limit: Maximum prims to return (capped at 10000)
+    """
+    result = send_command({
+        "type": "get_usd_stage",
+        "params": {
+            "node_path": node_path,
+            "prim_path": prim_path,
+            "types": types or [],
+            "max_depth": max_depth,
+            "include_inactive": include_inactive,
+            "attributes": attributes or [],
+            "offset": offset,
+            "limit": limit,
+        }
+    })
+    output = f"🎬 USD stage: {result.get('node_path')} ({result.get('prim_path')})\n"
+    output += f"Prims traversed: {result.get('traversed')} | matching: {result.get('total_matches')}\n"
+    output += f"Types: {result.get('type_counts')}\n"
+    if result.get("next_offset") is not None:
+        output += f"Next offset: {result['next_offset']}\n"
+    for prim in result.get("prims", []):
+        flags = "".join([
+            "" if prim.get("active") else " [inactive]",
+            " [instanceable]" if prim.get("instanceable") else "",
+        ])
+        line = f"  {prim.get('path')} ({prim.get('type') or '-'}){flags}"
+        if prim.get("attributes"):
+            line += f" {json.dumps(prim['attributes'], default=str)}"
+        output += line + "\n"
+    return output.rstrip("\n")
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(get_usd_stage)
+
+
+def execute_plugin(params, server, hou):
+    """Return a filtered, paginated listing of a LOP node's composed stage."""
+    node_path = params.get("node_path", "")
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+    if not hasattr(node, "stage"):
+        raise ValueError(f"Node {node_path} is not a LOP node")
+
+    prim_path = params.get("prim_path") or "/"
+    max_depth = params.get("max_depth")
+    max_depth = None if max_depth is None else max(0, int(max_depth))
+    offset = max(0, int(params.get("offset", 0) or 0))
+    limit = max(1, min(MAX_PAGE_PRIMS, int(params.get("limit", 500) or 500)))
+
+    stage = node.stage()
+    if stage is None:
+        raise ValueError(f"LOP node {node_path} has no stage (check for cook errors)")
+    traversal = cached_geometry_product(
+        node,
+        None,
+        ("usd_traversal", prim_path, max_depth),
+        lambda: traverse_stage(stage, prim_path, max_depth),
+        hou,
+        prepare=node.stage,
+    )
+    matches = filter_traversal(
+        traversal, list(params.get("types", []) or []), bool(params.get("include_inactive", True))
+    )
+    page = matches[offset:offset + limit]
+
+    attribute_names = list(params.get("attributes", []) or [])
+    time_code = None
+    if attribute_names:
+        from pxr import Usd
+
+        time_code = Usd.TimeCode(hou.frame())
+
+    prims = []
+    for index in page:
+        record = {
+            "path": traversal.paths[index],
+            "type": traversal.types[index],
+            "depth": traversal.depths[index],
+            "active": traversal.active[index],
+            "instanceable": traversal.instanceable[index],
+        }
+        if attribute_names:
+            prim = stage.GetPrimAtPath(record["path"])
+            values = {}
+            for name in attribute_names:
+                attribute = prim.GetAttribute(name)
+                if attribute and attribute.HasValue():
+                    values[name] = usd_value_to_json(attribute.Get(time_code))
+            record["attributes"] = values
+        prims.append(record)
+
+    next_offset = offset + len(page)
+    return {
+        "node_path": node.path(),
+        "prim_path": prim_path,
+        "traversed": len(traversal),
+        "pruned_at_depth": traversal.pruned_at_depth,
+        "type_counts": traversal.type_counts(),
+        "total_matches": len(matches),
+        "offset": offset,
+        "prims": prims,
+        "next_offset": next_offset if next_offset < len(matches) else None,
+    }
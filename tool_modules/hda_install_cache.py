@@ -0,0 +1,151 @@
+"""Idempotent HDA library installs keyed by path, mtime and content hash.
+
+``hou.hda.installFile`` reloads a library every time it is called, even when
+nothing changed. The registry here remembers what this session installed and
+skips the call while the file is still loaded and unchanged: matching
+mtime/size skips without reading the file, and a touched-but-identical file
+is detected by its hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .node_type_index import invalidate_node_type_index
+from .plugin_metrics import register_metrics_source
+
+PREWARM_ENV = "HOUDINI_MCP_PREWARM_HDAS"
+
+_LOCK = threading.RLock()
+_INSTALLED: Dict[str, Dict[str, Any]] = {}
+_COUNTERS = {"installs": 0, "reloads": 0, "skipped": 0, "hashes": 0, "install_seconds": 0.0}
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    _COUNTERS["hashes"] += 1
+    return digest.hexdigest()
+
+
+def _loaded_files(hou) -> set:
+    try:
+        return {os.path.normcase(os.path.abspath(path)) for path in hou.hda.loadedFiles()}
+    except Exception:
+        return set()
+
+
+def _install(path: str, hou, change_oplibraries_file: bool, reload: bool):
+    started = time.perf_counter()
+    if reload and hasattr(hou.hda, "reloadFile"):
+        hou.hda.reloadFile(path)
+        _COUNTERS["reloads"] += 1
+    else:
+        hou.hda.installFile(path, change_oplibraries_file=change_oplibraries_file)
+        _COUNTERS["installs"] += 1
+    _COUNTERS["install_seconds"] += time.perf_counter() - started
+
+
+def ensure_installed(
+    path: str,
+    hou,
+    change_oplibraries_file: bool = False,
+    force: bool = False,
+    loaded: Optional[set] = None,
+    invalidate: bool = True,
+) -> Dict[str, Any]:
+    """Install (or reload) `path` unless this session already installed the same content.
+
+    Returns {"path", "action", "reason"} with action 'installed', 'reloaded' or 'skipped'.
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    if not os.path.isfile(path):
+        raise ValueError(f"HDA file not found: {path}")
+    stat = os.stat(path)
+    with _LOCK:
+        entry = _INSTALLED.get(path)
+        still_loaded = os.path.normcase(path) in (loaded if loaded is not None else _loaded_files(hou))
+        action, reason = "installed", "not installed by this session"
+        digest = None
+        if entry and not still_loaded:
+            reason = "no longer loaded"
+        elif entry and force:
+            action, reason = "reloaded", "forced"
+        elif entry:
+            if entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+                _COUNTERS["skipped"] += 1
+                return {"path": path, "action": "skipped", "reason": "unchanged mtime and size"}
+            digest = file_digest(path)
+            if digest == entry["hash"]:
+                entry.update(mtime=stat.st_mtime, size=stat.st_size)
+                _COUNTERS["skipped"] += 1
+                return {"path": path, "action": "skipped", "reason": "touched but content unchanged"}
+            action, reason = "reloaded", "content changed"
+
+        _install(path, hou, change_oplibraries_file, reload=action == "reloaded")
+        _INSTALLED[path] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "hash": digest or file_digest(path),
+            "installed_at": time.time(),
+        }
+        if loaded is not None:
+            # Callers reuse `loaded` across paths; keep it in step with what is now installed.
+            loaded.add(os.path.normcase(path))
+    if invalidate:
+        invalidate_node_type_index()
+    return {"path": path, "action": action, "reason": reason}
+
+
+def ensure_installed_many(
+    paths: Iterable[str],
+    hou,
+    change_oplibraries_file: bool = False,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """Install many libraries with one loadedFiles() query and one index invalidation.
+
+    Paths naming the same file are installed once.
+    """
+    loaded = _loaded_files(hou)
+    unique: Dict[str, str] = {}
+    for path in paths:
+        unique.setdefault(os.path.normcase(os.path.abspath(os.path.expanduser(path))), path)
+    results: List[Dict[str, Any]] = []
+    for path in unique.values():
+        try:
+            results.append(ensure_installed(
+                path, hou, change_oplibraries_file, force, loaded=loaded, invalidate=False
+            ))
+        except Exception as exc:
+            results.append({"path": path, "action": "failed", "reason": str(exc)})
+    changed = [result for result in results if result["action"] in ("installed", "reloaded")]
+    if changed:
+        invalidate_node_type_index()
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result["action"]] = counts.get(result["action"], 0) + 1
+    return {"results": results, "counts": counts}
+
+
+def prewarm_paths(paths: Optional[Iterable[str]] = None) -> List[str]:
+    """Explicit paths plus $HOUDINI_MCP_PREWARM_HDAS (os.pathsep separated)."""
+    combined = list(paths or [])
+    combined += [path for path in os.environ.get(PREWARM_ENV, "").split(os.pathsep) if path]
+    return combined
+
+
+def install_cache_stats() -> Dict[str, Any]:
+    with _LOCK:
+        stats = dict(_COUNTERS, tracked=len(_INSTALLED))
+    stats["install_seconds"] = round(stats["install_seconds"], 4)
+    return stats
+
+
+register_metrics_source("hda_install_cache", install_cache_stats)
@@ -0,0 +1,220 @@
+"""Persistent on-disk index of HDA libraries and the definitions they contain.
+
+Libraries are parsed with ``hou.hda.definitionsInFile`` only when their mtime
+or size changes; everything else is answered from a JSON index, so type names
+resolve to library files without opening (or installing) the libraries.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .node_type_index import split_type_name
+from .plugin_metrics import register_metrics_source
+
+INDEX_VERSION = 1
+LIBRARY_EXTENSIONS = (".hda", ".otl", ".hdanc", ".otlnc", ".hdalc", ".otllc")
+
+_REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLES_DIR = os.path.join(_REPO_DIR, "help", "examples", "nodes")
+
+
+def default_index_path() -> str:
+    """$HOUDINI_MCP_HDA_INDEX or ~/.cache/houdini_mcp/hda_library_index.json."""
+    return os.environ.get("HOUDINI_MCP_HDA_INDEX") or os.path.join(
+        os.path.expanduser("~"), ".cache", "houdini_mcp", "hda_library_index.json"
+    )
+
+
+def configured_directories(extra: Optional[Iterable[str]] = None, include_examples: bool = True) -> List[str]:
+    """Example libraries, $HOUDINI_MCP_HDA_DIRS (os.pathsep separated) and any extra directories."""
+    directories = [EXAMPLES_DIR] if include_examples else []
+    directories += [d for d in os.environ.get("HOUDINI_MCP_HDA_DIRS", "").split(os.pathsep) if d]
+    directories += list(extra or [])
+    seen = []
+    for directory in directories:
+        directory = os.path.abspath(os.path.expanduser(directory))
+        if directory not in seen:
+            seen.append(directory)
+    return seen
+
+
+def iter_library_files(directories: Iterable[str]) -> Iterable[str]:
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                if name.lower().endswith(LIBRARY_EXTENSIONS):
+                    yield os.path.join(root, name)
+
+
+def describe_definitions(path: str, hou) -> List[Dict[str, Any]]:
+    """Parse a library once and record what each definition provides."""
+    records = []
+    for definition in hou.hda.definitionsInFile(path):
+        type_name = definition.nodeTypeName()
+        namespace, base, version = split_type_name(type_name)
+        records.append({
+            "type_name": type_name,
+            "category": definition.nodeTypeCategory().name(),
+            "description": definition.description(),
+            "namespace": namespace,
+            "base_name": base,
+            "version": definition.version() or version,
+        })
+    return records
+
+
+class HdaLibraryIndex:
+    """path -> {mtime, size, definitions}, persisted as JSON and refreshed incrementally."""
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self._lock = threading.RLock()
+        self._files: Optional[Dict[str, Dict[str, Any]]] = None
+        self.parses = 0
+        self.reused = 0
+        self.last_scan: Optional[Dict[str, Any]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._files is None:
+            files: Dict[str, Dict[str, Any]] = {}
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as handle:
+                    data = json.load(handle)
+                if data.get("version") == INDEX_VERSION:
+                    files = data.get("files", {})
+            except (OSError, ValueError):
+                pass
+            self._files = files
+        return self._files
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump({"version": INDEX_VERSION, "files": self._files}, handle)
+        os.replace(temp_path, self.index_path)
+
+    def _refresh_file(self, path: str, hou, force: bool = False) -> bool:
+        """Reparse `path` if it changed since it was indexed; return True when it was parsed."""
+        entry = self._load().get(path)
+        try:
+            stat = os.stat(path)
+        except OSError as exc:
+            # Recorded like a parse error, so one missing or unreadable library does not abort a run.
+            self._files[path] = {"mtime": None, "size": None, "definitions": [], "error": str(exc)}
+            return True
+        if not force and entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            self.reused += 1
+            return False
+        try:
+            definitions, error = describe_definitions(path, hou), None
+        except Exception as exc:
+            definitions, error = [], str(exc)
+        self._files[path] = {"mtime": stat.st_mtime, "size": stat.st_size, "definitions": definitions}
+        if error:
+            self._files[path]["error"] = error
+        self.parses += 1
+        return True
+
+    def scan(self, directories: List[str], hou, force: bool = False) -> Dict[str, Any]:
+        """Index every library under `directories`, reparsing only changed files."""
+        started = time.perf_counter()
+        with self._lock:
+            files = self._load()
+            seen = set()
+            parsed = 0
+            for path in iter_library_files(directories):
+                seen.add(path)
+                parsed += self._refresh_file(path, hou, force)
+            roots = tuple(os.path.join(directory, "") for directory in directories)
+            removed = [path for path in files if path.startswith(roots) and path not in seen]
+            for path in removed:
+                del files[path]
+            if parsed or removed:
+                self._save()
+            self.last_scan = {
+                "directories": directories,
+                "libraries": len(seen),
+                "parsed": parsed,
+                "unchanged": len(seen) - parsed,
+                "removed": len(removed),
+                "definitions": sum(len(files[path]["definitions"]) for path in seen),
+                "errors": {path: files[path]["error"] for path in seen if "error" in files[path]},
+                "seconds": round(time.perf_counter() - started, 4),
+            }
+            return self.last_scan
+
+    def definitions_in_file(self, path: str, hou) -> List[Dict[str, Any]]:
+        """Indexed definitions of one library, reparsing it only if it changed."""
+        path = os.path.abspath(path)
+        with self._lock:
+            if self._refresh_file(path, hou):
+                self._save()
+            return list(self._files[path]["definitions"])
+
+    def library_error(self, path: str) -> Optional[str]:
+        """Why the last read of a library failed (missing, unreadable or unparsable), if it did."""
+        with self._lock:
+            return self._load().get(os.path.abspath(path), {}).get("error")
+
+    def find(self, type_name: str, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Libraries defining `type_name` (exact, category-qualified, lowercase or base name)."""
+        wanted = str(type_name)
+        if "/" in wanted and category is None:
+            category, wanted = wanted.split("/", 1)
+        lowered = wanted.lower()
+        base = split_type_name(wanted)[1].lower()
+        tiers: Dict[str, List[Dict[str, Any]]] = {"exact": [], "lowercase": [], "base_name": []}
+        with self._lock:
+            for path, entry in sorted(self._load().items()):
+                for definition in entry["definitions"]:
+                    if category and definition["category"].lower() != category.lower():
+                        continue
+                    if definition["type_name"] == wanted:
+                        tier = "exact"
+                    elif definition["type_name"].lower() == lowered:
+                        tier = "lowercase"
+                    elif definition["base_name"].lower() == base:
+                        tier = "base_name"
+                    else:
+                        continue
+                    tiers[tier].append(dict(definition, path=path, match=tier))
+        for matches in tiers.values():
+            if matches:
+                return matches
+        return []
+
+    def stats(self) -> Dict[str, Any]:
+        files = self._files or {}
+        return {
+            "index_path": self.index_path,
+            "libraries": len(files),
+            "definitions": sum(len(entry["definitions"]) for entry in files.values()),
+            "parses": self.parses,
+            "reused": self.reused,
+            "last_scan_seconds": (self.last_scan or {}).get("seconds"),
+        }
+
+
+_INDEX: Optional[HdaLibraryIndex] = None
+
+
+def get_hda_library_index() -> HdaLibraryIndex:
+    global _INDEX
+    index_path = default_index_path()
+    if _INDEX is None or _INDEX.index_path != index_path:
+        _INDEX = HdaLibraryIndex(index_path)
+        register_metrics_source("hda_library_index", _INDEX.stats)
+    return _INDEX
+
+
+def library_definition_names(path: str, hou) -> List[str]:
+    """Type names defined in a library, from the index when the file is unchanged."""
+    return [definition["type_name"] for definition in get_hda_library_index().definitions_in_file(path, hou)]
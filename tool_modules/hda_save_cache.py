@@ -0,0 +1,340 @@
+"""Content-aware HDA saves.
+
+``HDADefinition.updateFromNode`` rewrites the whole library file on every call,
+even when the instance holds exactly what was last saved. Before saving, the
+instance's interface and contents are digested; the write is skipped while the
+digest matches what this session last saved and the library still holds that
+save (matching mtime/size, or a matching digest of the definition sections
+when the file was only touched). Several saves of one definition in a batch
+collapse into a single write.
+
+Before the first save of a definition, the contents the library holds are
+learned from a locked instance that matches it: tools that unlock an
+instance record its digest first (``remember_locked_contents``), and
+otherwise the definition's other instances are searched. Records are
+persisted per library path, mtime and size, so they survive a restart.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .hda_utils import invalidate_parm_template_cache
+from .plugin_metrics import register_metrics_source
+
+DIGESTS_VERSION = 1
+
+_LOCK = threading.RLock()
+# {"path": persisted file the entries were loaded from, "entries": definition key -> record}
+_STORE: Dict[str, Any] = {"path": None, "entries": {}}
+_COUNTERS = {"saves": 0, "skipped": 0, "coalesced": 0, "digests": 0, "library_bytes": 0, "save_seconds": 0.0}
+
+
+def default_digests_path() -> str:
+    """$HOUDINI_MCP_HDA_DIGESTS or ~/.cache/houdini_mcp/hda_save_digests.json."""
+    return os.environ.get("HOUDINI_MCP_HDA_DIGESTS") or os.path.join(
+        os.path.expanduser("~"), ".cache", "houdini_mcp", "hda_save_digests.json"
+    )
+
+
+def _saved() -> Dict[str, Dict[str, Any]]:
+    path = default_digests_path()
+    if _STORE["path"] != path:
+        entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("version") == DIGESTS_VERSION:
+                entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+        _STORE.update(path=path, entries=entries)
+    return _STORE["entries"]
+
+
+def _persist():
+    path = _STORE["path"]
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump({"version": DIGESTS_VERSION, "entries": _STORE["entries"]}, handle)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def definition_key(definition) -> str:
+    try:
+        category = definition.nodeTypeCategory().name()
+    except Exception:
+        category = ""
+    return f"{definition.libraryFilePath()}|{category}/{definition.nodeTypeName()}"
+
+
+def _as_bytes(value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode("utf-8", "surrogateescape")
+
+
+def _contents_bytes(node) -> bytes:
+    """Serialized child network of `node`, as a .cpio via saveItemsToFile or as asCode()."""
+    items = list(node.allItems()) if hasattr(node, "allItems") else list(node.children())
+    if not items:
+        return b""
+    if hasattr(node, "saveItemsToFile"):
+        handle, path = tempfile.mkstemp(suffix=".cpio")
+        os.close(handle)
+        try:
+            node.saveItemsToFile(items, path)
+            with open(path, "rb") as stream:
+                return stream.read()
+        except Exception:
+            pass
+        finally:
+            os.remove(path)
+    return _as_bytes(node.asCode(recurse=True))
+
+
+def instance_digest(node) -> str:
+    """Digest of what updateFromNode would store: the interface plus the child network."""
+    digest = hashlib.sha1()
+    digest.update(_as_bytes(node.parmTemplateGroup().asDialogScript()))
+    digest.update(b"\0")
+    digest.update(_contents_bytes(node))
+    _COUNTERS["digests"] += 1
+    return digest.hexdigest()
+
+
+def sections_digest(definition) -> str:
+    """Digest of every section stored in the definition, in name order."""
+    digest = hashlib.sha1()
+    for name, section in sorted(definition.sections().items()):
+        digest.update(_as_bytes(name) + b"\0")
+        try:
+            digest.update(_as_bytes(section.contents()))
+        except Exception:
+            digest.update(_as_bytes(section.size()))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _stat(path: str):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None, None
+    return stat.st_mtime, stat.st_size
+
+
+def _record(key: str, definition, digest: str) -> Dict[str, Any]:
+    mtime, size = _stat(definition.libraryFilePath())
+    entry = {
+        "instance_digest": digest,
+        "sections_digest": sections_digest(definition),
+        "mtime": mtime,
+        "size": size,
+        "saved_at": time.time(),
+    }
+    _saved()[key] = entry
+    _persist()
+    return entry
+
+
+def _matches_library(node) -> bool:
+    try:
+        return bool(node.isLockedHDA() and node.matchesCurrentDefinition())
+    except Exception:
+        return False
+
+
+def remember_locked_contents(node) -> bool:
+    """Record the library's contents from `node` before a tool unlocks it.
+
+    A locked instance that matches its definition holds exactly what the
+    library stores, so its digest tells a later save whether anything changed.
+    Returns True when a record was made.
+    """
+    definition = node.type().definition()
+    if definition is None or not _matches_library(node):
+        return False
+    key = definition_key(definition)
+    with _LOCK:
+        entry = _saved().get(key)
+        if entry and _library_holds(entry, definition):
+            return False
+        _record(key, definition, instance_digest(node))
+    return True
+
+
+def _learn_library_contents(definition, exclude) -> Optional[Dict[str, Any]]:
+    """Record the library's contents from another locked instance of the definition, if any."""
+    try:
+        instances = definition.nodeType().instances()
+    except Exception:
+        return None
+    for other in instances:
+        if other is not exclude and _matches_library(other):
+            return _record(definition_key(definition), definition, instance_digest(other))
+    return None
+
+
+def _library_holds(entry: Dict[str, Any], definition) -> bool:
+    """True when the library still contains the contents recorded by the last save."""
+    mtime, size = _stat(definition.libraryFilePath())
+    if mtime == entry["mtime"] and size == entry["size"]:
+        return True
+    if sections_digest(definition) != entry["sections_digest"]:
+        return False
+    entry.update(mtime=mtime, size=size)
+    _persist()
+    return True
+
+
+def save_from_node(node, force: bool = False, relock: bool = False) -> Dict[str, Any]:
+    """Save `node` into its definition unless the library already holds the same content.
+
+    Returns {"node_path", "definition_name", "library_file_path", "action", "reason",
+    "library_size", "seconds"} with action 'saved' or 'skipped'. updateFromNode
+    rewrites the whole library, so library_size is also what a save wrote.
+    """
+    started = time.perf_counter()
+    definition = node.type().definition()
+    if definition is None:
+        raise ValueError(f"Node is not a digital asset instance: {node.path()}")
+    key = definition_key(definition)
+    library_path = definition.libraryFilePath()
+    result = {
+        "node_path": node.path(),
+        "definition_name": definition.nodeTypeName(),
+        "library_file_path": library_path,
+        "library_size": 0,
+    }
+    with _LOCK:
+        if not force and node.isLockedHDA() and node.matchesCurrentDefinition():
+            _COUNTERS["skipped"] += 1
+            return dict(result, action="skipped", reason="locked instance already matches the definition",
+                        seconds=round(time.perf_counter() - started, 4))
+        digest = instance_digest(node)
+        entry = None if force else _saved().get(key)
+        if entry is not None and not _library_holds(entry, definition):
+            # The library changed under the record; learn its contents again if possible.
+            entry = _learn_library_contents(definition, node) or entry
+        elif entry is None and not force:
+            entry = _learn_library_contents(definition, node)
+        if entry and entry["instance_digest"] == digest and _library_holds(entry, definition):
+            _COUNTERS["skipped"] += 1
+            if relock:
+                node.matchCurrentDefinition()
+            return dict(result, action="skipped", reason="contents unchanged since last save",
+                        seconds=round(time.perf_counter() - started, 4))
+        if force:
+            reason = "forced"
+        elif entry is None:
+            reason = "library contents unknown"
+        elif entry["instance_digest"] != digest:
+            reason = "contents changed"
+        else:
+            reason = "library changed since last save"
+
+        definition.updateFromNode(node)
+        if relock:
+            node.matchCurrentDefinition()
+        invalidate_parm_template_cache(definition)
+        size = _record(key, definition, digest)["size"] or 0
+        seconds = time.perf_counter() - started
+        _COUNTERS["saves"] += 1
+        _COUNTERS["library_bytes"] += size
+        _COUNTERS["save_seconds"] += seconds
+    return dict(result, action="saved", reason=reason, library_size=size, seconds=round(seconds, 4))
+
+
+def save_instances(node_paths: Iterable[str], hou, force: bool = False, relock: bool = False) -> Dict[str, Any]:
+    """Save many instances, writing each definition once and grouping writes by library.
+
+    When several listed instances share a definition, the last one listed is
+    saved and the others are reported as 'coalesced'.
+    """
+    started = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    chosen: Dict[str, Any] = {}
+    for node_path in node_paths:
+        node = hou.node(node_path)
+        if node is None:
+            results.append({"node_path": node_path, "action": "failed", "reason": f"Node not found: {node_path}"})
+            continue
+        definition = node.type().definition()
+        if definition is None:
+            results.append({"node_path": node_path, "action": "failed",
+                            "reason": f"Node is not a digital asset instance: {node_path}"})
+            continue
+        key = definition_key(definition)
+        previous = chosen.pop(key, None)
+        if previous is not None:
+            results.append({"node_path": previous.path(), "action": "coalesced",
+                            "reason": f"superseded by {node.path()}"})
+            _COUNTERS["coalesced"] += 1
+        chosen[key] = node
+
+    for key, node in sorted(chosen.items(), key=lambda item: item[0].split("|", 1)[0]):
+        try:
+            results.append(save_from_node(node, force=force, relock=relock))
+        except Exception as exc:
+            results.append({"node_path": node.path(), "action": "failed", "reason": str(exc)})
+
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result["action"]] = counts.get(result["action"], 0) + 1
+    saved = [result for result in results if result["action"] == "saved"]
+    return {
+        "results": results,
+        "counts": counts,
+        "libraries_written": sorted({result["library_file_path"] for result in saved}),
+        "library_bytes": sum(result["library_size"] for result in saved),
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+
+
+def save_or_defer(params: Dict[str, Any], server, hou, relock_default: bool) -> Dict[str, Any]:
+    """Shared execute_plugin body of the save tools; queues saves on an open edit session when asked."""
+    node_paths = list(params.get("node_paths") or [])
+    if params.get("node_path"):
+        node_paths.insert(0, params["node_path"])
+    if not node_paths:
+        raise ValueError("node_path or node_paths is required")
+    force = bool(params.get("force", False))
+    relock = bool(params.get("relock", relock_default))
+
+    session = getattr(server, "edit_session", None)
+    if bool(params.get("defer", False)) and session is not None:
+        deferred = []
+        for node_path in node_paths:
+            node = hou.node(node_path)
+            if node is None:
+                raise ValueError(f"Node not found: {node_path}")
+            definition = node.type().definition()
+            if definition is None:
+                raise ValueError(f"Node is not a digital asset instance: {node_path}")
+            # Keyed by definition, so repeated saves during the session collapse into one.
+            session.defer(
+                f"save_hda|{definition_key(definition)}",
+                lambda path=node.path(): save_instances([path], hou, force=force, relock=relock),
+            )
+            deferred.append(node.path())
+        return {"deferred": deferred, "session": session.label, "results": [], "counts": {}}
+    return save_instances(node_paths, hou, force=force, relock=relock)
+
+
+def save_cache_stats() -> Dict[str, Any]:
+    with _LOCK:
+        stats = dict(_COUNTERS, tracked=len(_saved()))
+    stats["save_seconds"] = round(stats["save_seconds"], 4)
+    return stats
+
+
+register_metrics_source("hda_save_cache", save_cache_stats)
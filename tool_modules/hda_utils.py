@@ -2,8 +2,22 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+import copy
+import difflib
+import hashlib
 from typing import Any, Dict, List, Optional, Tuple
 
+from .node_type_index import resolve_node_type
+from .plugin_metrics import register_metrics_source
+
+# (category, type name, library) -> [modification time, dialog script digest or None, serialized templates]
+_TEMPLATE_CACHE: Dict[Tuple[str, str, str], List[Any]] = {}
+_TEMPLATE_CACHE_STATS = {"hits": 0, "misses": 0, "invalidations": 0}
+register_metrics_source(
+    "parm_template_cache", lambda: dict(_TEMPLATE_CACHE_STATS, entries=len(_TEMPLATE_CACHE))
+)
+
 
 def resolve_hda_definition(params: Dict[str, Any], hou) -> Tuple[Optional[Any], Any]:
     """Resolve (optional node, required definition) from node_path/type/definition."""
@@ -33,23 +47,14 @@ def resolve_hda_definition(params: Dict[str, Any], hou) -> Tuple[Optional[Any],
     return None, definition
 
 
-def find_node_type(type_name: str, hou):
-    """Find node type by bare name, category-qualified name, or case-insensitive match."""
-    wanted = str(type_name)
-    for category in hou.nodeTypeCategories().values():
-        node_types = category.nodeTypes()
-        direct = node_types.get(wanted)
-        if direct is not None:
-            return direct
-        for candidate_name, candidate in node_types.items():
-            if candidate_name.lower() == wanted.lower():
-                return candidate
-            try:
-                if candidate.nameWithCategory() == wanted:
-                    return candidate
-            except Exception:
-                pass
-    return None
+def find_node_type(type_name: str, hou, category=None):
+    """Find node type by bare name, category-qualified name, or case-insensitive match.
+
+    Lookups go through the cached node-type index; `category` prefers types
+    from that hou.NodeTypeCategory when a name exists in several.
+    """
+    node_type, _ = resolve_node_type(type_name, hou, category)
+    return node_type
 
 
 def parm_template_to_dict(template, hou) -> Dict[str, Any]:
@@ -110,6 +115,76 @@ def parm_template_to_dict(template, hou) -> Dict[str, Any]:
     return data
 
 
+def _definition_key(definition) -> Tuple[str, str, str]:
+    return (definition.nodeTypeCategory().name(), definition.nodeTypeName(), definition.libraryFilePath())
+
+
+def _dialog_script_digest(definition) -> str:
+    return hashlib.sha1(definition.parmTemplateGroup().asDialogScript().encode("utf-8")).hexdigest()
+
+
+def definition_parm_templates(definition, hou, verify: bool = False) -> List[Dict[str, Any]]:
+    """parm_template_to_dict() of every top-level template, memoized per definition.
+
+    Entries are reused while the definition's modification time is unchanged;
+    tools that write a definition call invalidate_parm_template_cache(). With
+    verify=True the dialog script is also hashed, catching edits that did not
+    bump the modification time. Callers receive their own copy.
+    """
+    key = _definition_key(definition)
+    modified = definition.modificationTime()
+    entry = _TEMPLATE_CACHE.get(key)
+    if entry is not None and entry[0] == modified:
+        # An entry stored without a digest cannot vouch for the script; reserialize once.
+        if not verify or (entry[1] is not None and entry[1] == _dialog_script_digest(definition)):
+            _TEMPLATE_CACHE_STATS["hits"] += 1
+            return copy.deepcopy(entry[2])
+    _TEMPLATE_CACHE_STATS["misses"] += 1
+    ptg = definition.parmTemplateGroup()
+    templates = [parm_template_to_dict(template, hou) for template in ptg.entries()]
+    digest = hashlib.sha1(ptg.asDialogScript().encode("utf-8")).hexdigest() if verify else None
+    _TEMPLATE_CACHE[key] = [modified, digest, templates]
+    return copy.deepcopy(templates)
+
+
+def invalidate_parm_template_cache(definition=None):
+    """Forget the serialized templates of one definition (or all); call after writing a definition."""
+    try:
+        key = None if definition is None else _definition_key(definition)
+    except Exception:
+        key = None
+    if key is None:
+        _TEMPLATE_CACHE.clear()
+    else:
+        _TEMPLATE_CACHE.pop(key, None)
+    _TEMPLATE_CACHE_STATS["invalidations"] += 1
+
+
+def project_template_names(templates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Names-and-types-only view of a serialized template tree."""
+    projected = []
+    for template in templates:
+        item = {"name": template["name"], "type": template["type"]}
+        if "children" in template:
+            item["children"] = project_template_names(template["children"])
+        projected.append(item)
+    return projected
+
+
+def select_template_subtree(templates: List[Dict[str, Any]], folder_path: str) -> List[Dict[str, Any]]:
+    """Children of the folder at 'Outer/Inner' (each level matched by folder name or label)."""
+    current = templates
+    for part in [p for p in str(folder_path).split("/") if p]:
+        folder = next(
+            (t for t in current if "children" in t and part in (t.get("name"), t.get("label"))),
+            None,
+        )
+        if folder is None:
+            raise ValueError(f"Folder not found in parm templates: {folder_path} (at '{part}')")
+        current = folder["children"]
+    return current
+
+
 def create_parm_template_from_tree(spec: Dict[str, Any], hou):
     """Create hou.ParmTemplate from a dictionary tree."""
     if not isinstance(spec, dict):
@@ -173,6 +248,75 @@ def create_parm_template_from_tree(spec: Dict[str, Any], hou):
     return template
 
 
+def validate_hda_instance(node, rules: Dict[str, Any]) -> Dict[str, Any]:
+    """Check an HDA instance against validate_hda rules; returns valid/errors/warnings/checks."""
+    errors = []
+    warnings = []
+    checks = []
+
+    definition = node.type().definition()
+    require_definition = bool(rules.get("require_definition", True))
+    if require_definition and definition is None:
+        errors.append("Node is not an HDA instance")
+    checks.append({"check": "is_hda_instance", "ok": definition is not None})
+
+    require_match = bool(rules.get("require_match_definition", False))
+    matches_definition = node.matchesCurrentDefinition() if definition else False
+    if require_match and not matches_definition:
+        errors.append("Node does not match current definition")
+    checks.append({"check": "matches_current_definition", "ok": matches_definition})
+
+    required_parameters = rules.get("required_parameters", [])
+    for parm_name in required_parameters:
+        ok = node.parm(parm_name) is not None
+        checks.append({"check": f"has_parameter:{parm_name}", "ok": ok})
+        if not ok:
+            errors.append(f"Missing parameter: {parm_name}")
+
+    required_internal_nodes = rules.get("required_internal_nodes", [])
+    for rel_path in required_internal_nodes:
+        internal = node.node(rel_path)
+        ok = internal is not None
+        checks.append({"check": f"has_internal_node:{rel_path}", "ok": ok})
+        if not ok:
+            errors.append(f"Missing internal node: {rel_path}")
+
+    expected_output_indices = rules.get("expected_output_indices", [])
+    for entry in expected_output_indices:
+        rel_node = entry.get("node", "")
+        expected = int(entry.get("index", 0))
+        internal = node.node(rel_node)
+        ok = False
+        if internal is not None and internal.parm("outputidx") is not None:
+            ok = (internal.parm("outputidx").eval() == expected)
+        checks.append({"check": f"output_index:{rel_node}", "ok": ok})
+        if not ok:
+            errors.append(f"Output index mismatch for {rel_node}, expected {expected}")
+
+    primitive_type_expectations = rules.get("primitive_type_expectations", [])
+    for entry in primitive_type_expectations:
+        rel_node = entry.get("node", "")
+        expected_token = str(entry.get("token", ""))
+        internal = node.node(rel_node)
+        ok = False
+        if internal is not None and internal.parm("type") is not None:
+            ok = (internal.parm("type").evalAsString() == expected_token)
+        checks.append({"check": f"primitive_type:{rel_node}", "ok": ok})
+        if not ok:
+            errors.append(f"Primitive type mismatch for {rel_node}, expected {expected_token}")
+
+    if definition and not definition.libraryFilePath():
+        warnings.append("Definition has no library file path")
+
+    return {
+        "node_path": node.path(),
+        "valid": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+        "checks": checks,
+    }
+
+
 def geometry_stats(node, hou) -> Dict[str, Any]:
     """Return basic geometry stats from a node or its display/render SOP."""
     probe = node
@@ -217,3 +361,295 @@ def geometry_stats(node, hou) -> Dict[str, Any]:
         "prim_attributes": prim_attrs,
         "detail_attributes": detail_attrs,
     }
+
+
+PARM_TEMPLATE_SETTERS = {
+    "label": "setLabel",
+    "help": "setHelp",
+    "min": "setMinValue",
+    "max": "setMaxValue",
+    "min_is_strict": "setMinIsStrict",
+    "max_is_strict": "setMaxIsStrict",
+    "join_with_next": "setJoinWithNext",
+    "menu_items": "setMenuItems",
+    "menu_labels": "setMenuLabels",
+}
+
+
+def set_parm_template_attributes(template, attributes: Dict[str, Any], hou):
+    """Apply attribute edits (label, default_value, range, help, hidden, tags, conditionals...) in place."""
+    for key, value in attributes.items():
+        if key == "default_value":
+            template.setDefaultValue(tuple(value) if isinstance(value, (list, tuple)) else (value,))
+        elif key == "hidden":
+            template.hide(bool(value))
+        elif key == "tags":
+            tags = dict(template.tags())
+            tags.update({str(k): str(v) for k, v in dict(value).items()})
+            template.setTags(tags)
+        elif key in ("disable_when", "hide_when"):
+            cond_type = hou.parmCondType.DisableWhen if key == "disable_when" else hou.parmCondType.HideWhen
+            template.setConditional(cond_type, str(value))
+        elif key in PARM_TEMPLATE_SETTERS and hasattr(template, PARM_TEMPLATE_SETTERS[key]):
+            getattr(template, PARM_TEMPLATE_SETTERS[key])(value)
+        else:
+            raise ValueError(f"Cannot set '{key}' on parm template '{template.name()}'")
+
+
+def _require_template(ptg, name: str):
+    template = ptg.find(name)
+    if template is None:
+        raise ValueError(f"Parm template not found: {name}")
+    return template
+
+
+def apply_parm_template_patch(ptg, operations: List[Dict[str, Any]], hou) -> List[str]:
+    """Apply patch operations to a ParmTemplateGroup in order; returns one summary line per op.
+
+    Operations: insert_before/insert_after (anchor, template), replace (name, template),
+    remove (name), move (name, before|after anchor, or to the end), set (name, attributes)
+    and append (template, optional folder label).
+    """
+    applied = []
+    for index, operation in enumerate(operations):
+        op = str(operation.get("op", "")).lower()
+        name = operation.get("name")
+        if op in ("insert_before", "insert_after"):
+            anchor = operation.get("anchor")
+            _require_template(ptg, anchor)
+            template = create_parm_template_from_tree(operation.get("template", {}), hou)
+            (ptg.insertBefore if op == "insert_before" else ptg.insertAfter)(anchor, template)
+            applied.append(f"{op} {template.name()} @ {anchor}")
+        elif op == "replace":
+            _require_template(ptg, name)
+            ptg.replace(name, create_parm_template_from_tree(operation.get("template", {}), hou))
+            applied.append(f"replace {name}")
+        elif op == "remove":
+            _require_template(ptg, name)
+            ptg.remove(name)
+            applied.append(f"remove {name}")
+        elif op == "move":
+            template = _require_template(ptg, name)
+            anchor = operation.get("before") or operation.get("after")
+            if anchor == name:
+                raise ValueError(f"Cannot move '{name}' relative to itself")
+            if anchor:
+                _require_template(ptg, anchor)
+            ptg.remove(name)
+            if operation.get("before"):
+                ptg.insertBefore(anchor, template)
+            elif operation.get("after"):
+                ptg.insertAfter(anchor, template)
+            else:
+                ptg.append(template)
+            applied.append(f"move {name} {'before ' + anchor if operation.get('before') else 'after ' + anchor if anchor else 'to end'}")
+        elif op == "set":
+            template = _require_template(ptg, name)
+            set_parm_template_attributes(template, dict(operation.get("attributes", {})), hou)
+            ptg.replace(name, template)
+            applied.append(f"set {name}: {sorted(operation.get('attributes', {}))}")
+        elif op == "append":
+            template = create_parm_template_from_tree(operation.get("template", {}), hou)
+            folder = operation.get("folder")
+            if folder:
+                ptg.appendToFolder(folder, template)
+            else:
+                ptg.append(template)
+            applied.append(f"append {template.name()}" + (f" to {folder}" if folder else ""))
+        else:
+            raise ValueError(f"Operation {index}: unsupported op '{operation.get('op')}'")
+    return applied
+
+
+def flatten_parm_templates(templates, hou, folder: Tuple[str, ...] = ()) -> List[Tuple[str, Tuple[str, ...], Dict[str, Any]]]:
+    """(name, folder path, serialized template without children) in dialog order."""
+    rows = []
+    for template in templates:
+        data = parm_template_to_dict(template, hou)
+        children = data.pop("children", None)
+        rows.append((template.name(), folder, data))
+        if children is not None:
+            rows.extend(flatten_parm_templates(template.parmTemplates(), hou, folder + (template.name(),)))
+    return rows
+
+
+def diff_parm_template_rows(before, after) -> Dict[str, Any]:
+    """Added/removed/modified/moved template names between two flatten_parm_templates() results."""
+    old = {name: (folder, data) for name, folder, data in before}
+    new = {name: (folder, data) for name, folder, data in after}
+    common_old = [name for name, _, _ in before if name in new]
+    common_new = [name for name, _, _ in after if name in old]
+    # Names outside the longest common subsequence are the ones that moved.
+    matcher = difflib.SequenceMatcher(None, common_old, common_new, autojunk=False)
+    in_order = {
+        name
+        for block in matcher.get_matching_blocks()
+        for name in common_new[block.b:block.b + block.size]
+    }
+    modified = {}
+    for name in common_new:
+        changes = {
+            key: {"from": old[name][1].get(key), "to": new[name][1].get(key)}
+            for key in sorted(set(old[name][1]) | set(new[name][1]))
+            if old[name][1].get(key) != new[name][1].get(key)
+        }
+        if changes:
+            modified[name] = changes
+    return {
+        "added": [name for name, _, _ in after if name not in old],
+        "removed": [name for name, _, _ in before if name not in new],
+        "modified": modified,
+        "moved": [name for name in common_new if old[name][0] != new[name][0] or name not in in_order],
+    }
+
+
+_HSCRIPT_PAIRS = {")": "(", "]": "[", "}": "{"}
+
+
+def binding_expression_error(expression: str, language: str) -> Optional[str]:
+    """Why `expression` would not evaluate, or None; checked before anything is written."""
+    if not expression.strip():
+        return "empty expression"
+    if language == "python":
+        try:
+            compile(expression, "<binding>", "eval")
+        except SyntaxError:
+            # Multi-line Python parm expressions are function bodies.
+            body = "\n".join(f"  {line}" for line in expression.splitlines())
+            try:
+                compile(f"def _binding():\n{body}", "<binding>", "exec")
+            except SyntaxError as exc:
+                return f"Python syntax error: {exc.msg}"
+        return None
+    stack: List[str] = []
+    quote = None
+    escaped = False
+    for char in expression:
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'`":
+            quote = char
+        elif char in "([{":
+            stack.append(char)
+        elif char in _HSCRIPT_PAIRS:
+            if not stack or stack.pop() != _HSCRIPT_PAIRS[char]:
+                return f"unbalanced '{char}'"
+    if quote:
+        return f"unterminated {quote} quote"
+    if stack:
+        return f"unclosed '{stack[-1]}'"
+    return None
+
+
+def normalize_binding(binding: Dict[str, Any]) -> Dict[str, Any]:
+    """Target node/parm, expression and language of one binding spec.
+
+    Accepts target_node/target_parm or internal_node/internal_parm; without an
+    expression, source_parm becomes ch("../<source_parm>").
+    """
+    target_node = binding.get("target_node") or binding.get("internal_node") or ""
+    target_parm = binding.get("target_parm") or binding.get("internal_parm") or ""
+    if not target_node or not target_parm:
+        raise ValueError("Each binding requires target_node and target_parm")
+    expression = binding.get("expression")
+    if expression is None:
+        if not binding.get("source_parm"):
+            raise ValueError("Each binding requires either expression or source_parm")
+        expression = f'ch("../{binding["source_parm"]}")'
+    language = "python" if str(binding.get("language", "hscript")).lower() == "python" else "hscript"
+    return {"target_node": str(target_node), "target_parm": str(target_parm),
+            "expression": str(expression), "language": language}
+
+
+def apply_parameter_bindings(root, bindings: List[Dict[str, Any]], hou) -> Dict[str, Any]:
+    """Apply expression bindings in one validated, deduplicated pass under a single undo group.
+
+    Target nodes are resolved once per reference (absolute, or relative to
+    `root`). Bindings whose parameter already holds the same expression are
+    skipped, a later binding for the same parameter supersedes earlier ones,
+    and every write is read back after the pass. Returns {"counts", "applied",
+    "skipped", "failed"}.
+    """
+    languages = {"python": hou.exprLanguage.Python, "hscript": hou.exprLanguage.Hscript}
+    nodes: Dict[str, Any] = {}
+    planned: Dict[str, Dict[str, Any]] = {}
+    skipped: List[Dict[str, Any]] = []
+    failed: List[Dict[str, Any]] = []
+
+    for index, raw in enumerate(bindings):
+        try:
+            binding = normalize_binding(raw)
+        except ValueError as exc:
+            failed.append({"index": index, "error": str(exc)})
+            continue
+        ref = binding["target_node"]
+        if ref not in nodes:
+            nodes[ref] = hou.node(ref) if ref.startswith("/") else (root.node(ref) if root is not None else None)
+        node = nodes[ref]
+        if node is None:
+            failed.append({"index": index, "error": f"Target node not found: {ref}"})
+            continue
+        parm = node.parm(binding["target_parm"])
+        if parm is None:
+            failed.append({"index": index, "error": f"Target parameter not found: {node.path()}.{binding['target_parm']}"})
+            continue
+        error = binding_expression_error(binding["expression"], binding["language"])
+        if error:
+            failed.append({"index": index, "parm": parm.path(), "error": error})
+            continue
+        previous = planned.pop(parm.path(), None)
+        if previous is not None:
+            same = (previous["expression"], previous["language"]) == (binding["expression"], binding["language"])
+            skipped.append({"index": previous["index"], "parm": parm.path(),
+                            "reason": "duplicate" if same else f"superseded by binding {index}"})
+        planned[parm.path()] = dict(binding, index=index, parm=parm)
+
+    writes = []
+    for path, binding in planned.items():
+        parm = binding["parm"]
+        try:
+            current = (parm.expression(), parm.expressionLanguage())
+        except Exception:
+            current = None
+        if current == (binding["expression"], languages[binding["language"]]):
+            skipped.append({"index": binding["index"], "parm": path, "reason": "already bound"})
+        else:
+            writes.append(binding)
+
+    undo_group = hou.undos.group("Bind internal parameters") if hasattr(hou, "undos") else nullcontext()
+    with undo_group:
+        for binding in writes:
+            try:
+                binding["parm"].setExpression(binding["expression"], languages[binding["language"]])
+            except Exception as exc:
+                binding["error"] = str(exc)
+
+    applied: List[Dict[str, Any]] = []
+    for binding in writes:
+        path = binding["parm"].path()
+        error = binding.get("error")
+        if error is None:
+            try:
+                read_back = (binding["parm"].expression(), binding["parm"].expressionLanguage())
+            except Exception:
+                read_back = None
+            if read_back != (binding["expression"], languages[binding["language"]]):
+                error = "read-back verification failed"
+        entry = {"index": binding["index"], "parm": path, "expression": binding["expression"],
+                 "language": binding["language"]}
+        if error:
+            failed.append(dict(entry, error=error))
+        else:
+            applied.append(entry)
+
+    return {
+        "counts": {"applied": len(applied), "skipped": len(skipped), "failed": len(failed)},
+        "applied": applied,
+        "skipped": sorted(skipped, key=lambda entry: entry["index"]),
+        "failed": sorted(failed, key=lambda entry: entry["index"]),
+    }
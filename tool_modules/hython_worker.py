@@ -0,0 +1,38 @@
+"""Entry point for headless hython workers started by tool_modules.worker_pool.
+
+Usage: hython hython_worker.py <request.json> <result.json>
+"""
+
+import importlib
+import json
+import os
+import sys
+import traceback
+
+
+def main(argv):
+    request_path, result_path = argv[1], argv[2]
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+    try:
+        import hou
+
+        with open(request_path, "r", encoding="utf-8") as handle:
+            request = json.load(handle)
+        if request.get("hip_file"):
+            hou.hipFile.load(request["hip_file"], suppress_save_prompt=True, ignore_load_warnings=True)
+        module = importlib.import_module(request["module"])
+        result = getattr(module, request["function"])(request.get("payload", {}), hou)
+        response = {"status": "success", "result": result}
+    except Exception:
+        response = {"status": "error", "error": traceback.format_exc()}
+
+    with open(result_path, "w", encoding="utf-8") as handle:
+        json.dump(response, handle, default=str)
+    return 0 if response["status"] == "success" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
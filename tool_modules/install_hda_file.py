@@ -1,5 +1,8 @@
 import os
 
+from .hda_library_index import library_definition_names
+from .hda_install_cache import ensure_installed
+
 TOOL_NAME = "install_hda_file"
 IS_MUTATING = True
 
@@ -13,7 +16,11 @@ def register_mcp_tool(mcp, send_command, legacy_bridge_functions=None, tool_deco
         change_oplibraries_file: bool = False,
         force_reload: bool = False,
     ) -> str:
-        """Install an HDA/OTL file into the current Houdini session."""
+        """Install an HDA/OTL file into the current Houdini session.
+
+        Skips the install when this session already installed the file and it
+        is unchanged (same mtime/size or content hash); force_reload reloads anyway.
+        """
         result = send_command(
             {
                 "type": TOOL_NAME,
@@ -26,8 +33,9 @@ def register_mcp_tool(mcp, send_command, legacy_bridge_functions=None, tool_deco
         )
 
         lines = [
-            "✅ HDA file installed",
+            "✅ HDA file installed" if result.get("action") != "skipped" else "✅ HDA file already installed",
             f"File: {result.get('hda_file_path')}",
+            f"Action: {result.get('action')} ({result.get('reason')})",
             f"Definitions: {result.get('definition_count', 0)}",
         ]
         for name in result.get("definition_names", []):
@@ -47,27 +55,17 @@ def execute_plugin(params, server, hou):
     change_oplibraries_file = bool(params.get("change_oplibraries_file", False))
     force_reload = bool(params.get("force_reload", False))
 
-    if force_reload and hasattr(hou.hda, "reloadFile"):
-        try:
-            hou.hda.reloadFile(path)
-        except Exception:
-            pass
-
-    hou.hda.installFile(path, change_oplibraries_file=change_oplibraries_file)
+    install = ensure_installed(path, hou, change_oplibraries_file, force=force_reload)
 
-    definition_names = []
-    if hasattr(hou.hda, "definitionsInFile"):
-        try:
-            defs = hou.hda.definitionsInFile(path)
-            definition_names = [
-                d.nodeTypeName() if hasattr(d, "nodeTypeName") else str(d)
-                for d in defs
-            ]
-        except Exception:
-            definition_names = []
+    try:
+        definition_names = library_definition_names(path, hou)
+    except Exception:
+        definition_names = []
 
     return {
         "hda_file_path": path,
+        "action": install["action"],
+        "reason": install["reason"],
         "definition_count": len(definition_names),
         "definition_names": definition_names,
     }
@@ -0,0 +1,46 @@
+from typing import List
+
+from .hda_install_cache import ensure_installed_many
+
+TOOL_NAME = "install_hda_files"
+IS_MUTATING = True
+
+
+def register_mcp_tool(mcp, send_command, legacy_bridge_functions=None, tool_decorator=None):
+    decorator = tool_decorator or mcp.tool
+
+    @decorator()
+    def install_hda_files(
+        hda_file_paths: List[str],
+        change_oplibraries_file: bool = False,
+        force_reload: bool = False,
+    ) -> str:
+        """Install many HDA/OTL files in one call, skipping ones already installed and unchanged."""
+        result = send_command(
+            {
+                "type": TOOL_NAME,
+                "params": {
+                    "hda_file_paths": hda_file_paths,
+                    "change_oplibraries_file": change_oplibraries_file,
+                    "force_reload": force_reload,
+                },
+            }
+        )
+
+        counts = result.get("counts", {})
+        lines = ["✅ HDA files processed: " + ", ".join(f"{action} {count}" for action, count in sorted(counts.items()))]
+        for entry in result.get("results", []):
+            lines.append(f"- {entry.get('action')}: {entry.get('path')} ({entry.get('reason')})")
+        return "\n".join(lines)
+
+
+def execute_plugin(params, server, hou):
+    paths = [str(path).strip() for path in params.get("hda_file_paths", []) or [] if str(path).strip()]
+    if not paths:
+        raise ValueError("hda_file_paths is required")
+    return ensure_installed_many(
+        paths,
+        hou,
+        change_oplibraries_file=bool(params.get("change_oplibraries_file", False)),
+        force=bool(params.get("force_reload", False)),
+    )
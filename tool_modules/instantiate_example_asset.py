@@ -1,5 +1,7 @@
 import os
 
+from .hda_install_cache import ensure_installed
+from .hda_library_index import library_definition_names
 from .hda_utils import find_node_type
 
 TOOL_NAME = "instantiate_example_asset"
@@ -59,21 +61,12 @@ def execute_plugin(params, server, hou):
     if parent is None:
         raise ValueError(f"Parent not found: {parent_path}")
 
-    hou.hda.installFile(path, change_oplibraries_file=False)
+    install = ensure_installed(path, hou)
 
     type_name = requested_type_name
-    definition_names = []
-    if hasattr(hou.hda, "definitionsInFile"):
-        defs = hou.hda.definitionsInFile(path)
-        definition_names = [
-            d.nodeTypeName() if hasattr(d, "nodeTypeName") else str(d)
-            for d in defs
-        ]
-        if not type_name and defs:
-            try:
-                type_name = defs[0].nodeTypeName()
-            except Exception:
-                type_name = ""
+    definition_names = library_definition_names(path, hou)
+    if definition_names and not type_name:
+        type_name = definition_names[0]
 
     if not type_name:
         raise ValueError("Unable to resolve type_name from file; provide type_name explicitly")
@@ -105,4 +98,5 @@ def execute_plugin(params, server, hou):
         "type_name": type_name,
         "definition_names": definition_names,
         "node_path": node.path(),
+        "install_action": install["action"],
     }
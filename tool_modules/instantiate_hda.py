@@ -1,7 +1,7 @@
 from typing import Any, Optional
 import json
 
-from .hda_utils import find_node_type
+from .node_type_index import resolve_node_type
 
 TOOL_NAME = "instantiate_hda"
 IS_MUTATING = True
@@ -26,12 +26,16 @@ def instantiate_hda(
             "set_display": set_display,
         }
     })
-    return (
+    output = (
         f"✅ HDA instantiated\n"
         f"Node: {result.get('node_path')}\n"
         f"Type: {result.get('node_type')}\n"
         f"Definition: {result.get('definition_name')}"
     )
+    match = result.get("type_match") or {}
+    if match.get("ambiguous"):
+        output += f"\n⚠️ '{type_name or definition_name}' matched several types ({match.get('match')}): {match.get('candidates')}"
+    return output
 
 
 def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
@@ -54,7 +58,7 @@ def execute_plugin(params, server, hou):
     if not type_name:
         raise ValueError("type_name or definition_name is required")
 
-    node_type = find_node_type(type_name, hou)
+    node_type, match = resolve_node_type(type_name, hou, parent.childTypeCategory())
     if node_type is None:
         raise ValueError(f"HDA type not found: {type_name}")
 
@@ -75,4 +79,5 @@ def execute_plugin(params, server, hou):
         "node_path": node.path(),
         "node_type": node.type().nameWithCategory(),
         "definition_name": node.type().definition().nodeTypeName() if node.type().definition() else None,
+        "type_match": match,
     }
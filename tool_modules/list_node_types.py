@@ -1,36 +1,133 @@
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
+import difflib
 import json
 
+from .node_type_index import node_type_catalog
+
 TOOL_NAME = "list_node_types"
 IS_MUTATING = False
 
+BEST_MATCH_RESULTS = 5
+FUZZY_CUTOFF = 0.4
+
 send_command = None
 
-def list_node_types(category: str = "Sop") -> str:
+def search_catalog(
+    entries: List[Dict[str, Any]],
+    query: str = "",
+    fuzzy: bool = True,
+    namespace: Optional[str] = None,
+    min_inputs: Optional[int] = None,
+    max_inputs: Optional[int] = None,
+    is_hda: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """Filter catalog entries and, when a query is given, rank them best first (adds 'score')."""
+    filtered = [
+        entry for entry in entries
+        if (namespace is None or entry["namespace"] == namespace)
+        and (min_inputs is None or entry["max_inputs"] >= min_inputs)
+        and (max_inputs is None or entry["min_inputs"] <= max_inputs)
+        and (is_hda is None or entry["is_hda"] == is_hda)
+    ]
+    query = (query or "").strip().lower()
+    if not query:
+        return filtered
+
+    ranked = []
+    for entry in filtered:
+        name = entry["name"].lower()
+        base = entry["base_name"].lower()
+        description = entry["description"].lower()
+        if query in (name, base):
+            score = 1.0
+        elif description == query:
+            score = 0.95
+        elif base.startswith(query) or name.startswith(query):
+            score = 0.9
+        elif query in name:
+            score = 0.8
+        elif query in description:
+            score = 0.7
+        elif fuzzy:
+            score = 0.65 * max(
+                difflib.SequenceMatcher(None, query, base).ratio(),
+                difflib.SequenceMatcher(None, query, description).ratio(),
+            )
+            if score < FUZZY_CUTOFF:
+                continue
+        else:
+            continue
+        ranked.append(dict(entry, score=round(score, 3)))
+    ranked.sort(key=lambda entry: (-entry["score"], entry["is_hda"], len(entry["name"]), entry["name"]))
+    return ranked
+
+
+def list_node_types(
+    category: str = "Sop",
+    query: str = "",
+    fuzzy: bool = True,
+    namespace: Optional[str] = None,
+    min_inputs: Optional[int] = None,
+    max_inputs: Optional[int] = None,
+    is_hda: Optional[bool] = None,
+    best_match: bool = False,
+    offset: int = 0,
+    limit: int = 50,
+) -> str:
     """
-    List all node types available in a specific category
+    List or search node types available in a specific category
+
+    The catalog is cached in the plugin and refreshed when HDA libraries change.
 
     Args:
         category: Node category (e.g., 'Sop', 'Object', 'Dop', 'Chop', 'Cop2', 'Vop', 'Lop', 'Top')
+        query: Substring matched against names and descriptions, ranked best first
+        fuzzy: Also return close misspellings of the query (difflib)
+        namespace: Only types in this namespace (e.g. 'labs'; '' for un-namespaced)
+        min_inputs: Only types that accept at least this many inputs
+        max_inputs: Only types that need at most this many inputs
+        is_hda: Only digital assets (True) or only built-in types (False)
+        best_match: Return just the top-ranked type and a few runners-up
+        offset: Index of the first result to return
+        limit: Maximum results to return
 
     Returns:
-        List of all node types in the category with descriptions
+        Matching node types with descriptions, inputs, namespace/version and HDA flag
     """
     result = send_command({
         "type": "list_node_types",
-        "params": {"category": category}
+        "params": {
+            "category": category,
+            "query": query,
+            "fuzzy": fuzzy,
+            "namespace": namespace,
+            "min_inputs": min_inputs,
+            "max_inputs": max_inputs,
+            "is_hda": is_hda,
+            "best_match": best_match,
+            "offset": offset,
+            "limit": limit,
+        }
     })
 
-    output = f"📦 Node Types in {result['category']}: {result['num_node_types']}\n\n"
+    output = f"📦 Node Types in {result['category']}: {result['num_node_types']}"
+    if result.get("total_matches") != result["num_node_types"]:
+        output += f" ({result['total_matches']} matching)"
+    output += "\n\n"
 
-    # Show first 50 node types
-    for node_type in result['node_types'][:50]:
+    for node_type in result['node_types']:
         desc = node_type['description'][:60] + "..." if len(node_type['description']) > 60 else node_type['description']
-        output += f"  • {node_type['name']}: {desc}\n"
-
-    if result['num_node_types'] > 50:
-        output += f"\n... and {result['num_node_types'] - 50} more node types\n"
-        output += "\nTip: Use get_node_documentation() to see detailed info for a specific node type\n"
+        extras = []
+        if node_type.get("is_hda"):
+            extras.append("HDA")
+        extras.append(f"inputs {node_type['min_inputs']}-{node_type['max_inputs']}")
+        if "score" in node_type:
+            extras.append(f"score {node_type['score']}")
+        output += f"  • {node_type['name']}: {desc} [{', '.join(extras)}]\n"
+
+    if result.get("next_offset") is not None:
+        output += f"\n... more results: call again with offset={result['next_offset']}\n"
+        output += "\nTip: Use query= to search, or get_node_documentation() for a specific node type\n"
 
     return output
 
@@ -43,7 +140,7 @@ def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool
 
 
 def execute_plugin(params, server, hou):
-    """List all node types in a specific category"""
+    """List or search node types in a specific category from the cached catalog"""
     category_name = params.get("category", "Sop")
 
     try:
@@ -71,21 +168,30 @@ def execute_plugin(params, server, hou):
             if not category:
                 raise ValueError(f"Unknown category: {category_name}")
 
-        # Get all node types
-        node_types = category.nodeTypes()
-
-        node_type_list = []
-        for name, node_type in node_types.items():
-            node_type_list.append({
-                "name": name,
-                "description": node_type.description() if node_type.description() else "",
-                "category": category.name()
-            })
+        entries = search_catalog(
+            node_type_catalog(category, hou),
+            query=params.get("query", ""),
+            fuzzy=bool(params.get("fuzzy", True)),
+            namespace=params.get("namespace"),
+            min_inputs=params.get("min_inputs"),
+            max_inputs=params.get("max_inputs"),
+            is_hda=params.get("is_hda"),
+        )
+        if params.get("best_match"):
+            offset, limit = 0, BEST_MATCH_RESULTS
+        else:
+            offset = max(0, int(params.get("offset", 0) or 0))
+            limit = max(1, int(params.get("limit", 50) or 50))
+        page = entries[offset:offset + limit]
+        next_offset = offset + len(page)
 
         return {
             "category": category.name(),
-            "num_node_types": len(node_type_list),
-            "node_types": node_type_list
+            "num_node_types": len(node_type_catalog(category, hou)),
+            "total_matches": len(entries),
+            "offset": offset,
+            "next_offset": next_offset if next_offset < len(entries) and not params.get("best_match") else None,
+            "node_types": page
         }
 
     except Exception as e:
@@ -0,0 +1,201 @@
+"""Cached lookup index over every node type, invalidated on HDA library events.
+
+One pass over ``hou.nodeTypeCategories()`` maps exact, lowercase,
+category-qualified and namespace/version-stripped names to node types, so a
+lookup is a few dict probes instead of a scan of every category. Per-category
+catalogs of searchable type records for list_node_types share the same
+invalidation.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .plugin_metrics import register_metrics_source
+
+# Lookup tiers, most specific first.
+MATCH_KINDS = ("exact", "qualified", "lowercase", "qualified_lowercase", "base_name")
+
+
+def split_type_name(name: str) -> Tuple[str, str, str]:
+    """Split 'scope::namespace::name::version' style names into (namespace, base, version)."""
+    parts = str(name).split("::")
+    if len(parts) == 1:
+        return "", parts[0], ""
+    version = ""
+    if len(parts) >= 2 and parts[-1] and parts[-1][0].isdigit():
+        version = parts.pop()
+    base = parts.pop()
+    return "::".join(parts), base, version
+
+
+def catalog_entry(name: str, node_type, category_name: str) -> Dict[str, Any]:
+    namespace, base, version = split_type_name(name)
+    return {
+        "name": name,
+        "description": node_type.description() or "",
+        "category": category_name,
+        "namespace": namespace,
+        "base_name": base,
+        "version": version,
+        "min_inputs": node_type.minNumInputs(),
+        "max_inputs": node_type.maxNumInputs(),
+        "is_hda": node_type.definition() is not None,
+    }
+
+
+class NodeTypeIndex:
+    """Name -> [node types] tables built from one pass over every category."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tables: Optional[Dict[str, Dict[str, List[Any]]]] = None
+        self._catalogs: Dict[str, List[Dict[str, Any]]] = {}
+        self.catalog_builds = 0
+        self.builds = 0
+        self.build_seconds = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.type_count = 0
+
+    def invalidate(self, *args, **kwargs):
+        """Drop the tables and catalogs; also usable directly as an hou.hda event callback."""
+        with self._lock:
+            if self._tables is not None or self._catalogs:
+                self.invalidations += 1
+            self._tables = None
+            self._catalogs = {}
+
+    def catalog(self, category) -> List[Dict[str, Any]]:
+        """Per-category list of searchable node-type records, built once per invalidation."""
+        key = category.name()
+        with self._lock:
+            entries = self._catalogs.get(key)
+            if entries is None:
+                entries = [catalog_entry(name, node_type, key) for name, node_type in sorted(category.nodeTypes().items())]
+                self._catalogs[key] = entries
+                self.catalog_builds += 1
+            return entries
+
+    def _build(self, hou) -> Dict[str, Dict[str, List[Any]]]:
+        started = time.perf_counter()
+        tables: Dict[str, Dict[str, List[Any]]] = {kind: {} for kind in MATCH_KINDS}
+        count = 0
+        for category_name, category in hou.nodeTypeCategories().items():
+            for name, node_type in category.nodeTypes().items():
+                count += 1
+                qualified = f"{category_name}/{name}"
+                keys = {
+                    "exact": name,
+                    "qualified": qualified,
+                    "lowercase": name.lower(),
+                    "qualified_lowercase": qualified.lower(),
+                    "base_name": split_type_name(name)[1].lower(),
+                }
+                for kind, key in keys.items():
+                    tables[kind].setdefault(key, []).append(node_type)
+        self.builds += 1
+        self.type_count = count
+        self.build_seconds = time.perf_counter() - started
+        return tables
+
+    def tables(self, hou) -> Dict[str, Dict[str, List[Any]]]:
+        with self._lock:
+            if self._tables is None:
+                self._tables = self._build(hou)
+            return self._tables
+
+    def resolve(self, type_name: str, hou, category=None) -> Tuple[Optional[Any], Dict[str, Any]]:
+        """Return (node_type or None, diagnostics) for the first tier with a match.
+
+        Diagnostics name the tier that matched and list every candidate when
+        the match is ambiguous; `category` (a hou.NodeTypeCategory) breaks ties.
+        """
+        wanted = str(type_name)
+        keys = {
+            "exact": wanted,
+            "qualified": wanted,
+            "lowercase": wanted.lower(),
+            "qualified_lowercase": wanted.lower(),
+            "base_name": split_type_name(wanted)[1].lower(),
+        }
+        for attempt in range(2):
+            tables = self.tables(hou)
+            for kind in MATCH_KINDS:
+                candidates = tables[kind].get(keys[kind])
+                if not candidates:
+                    continue
+                try:
+                    if category is not None:
+                        in_category = [c for c in candidates if c.category() == category]
+                        candidates = in_category or candidates
+                    names = [candidate.nameWithCategory() for candidate in candidates]
+                except hou.ObjectWasDeleted:
+                    # A library was uninstalled without an event reaching us.
+                    if attempt == 0:
+                        self.invalidate()
+                        break
+                    raise
+                self.hits += 1
+                return candidates[0], {
+                    "match": kind,
+                    "ambiguous": len(candidates) > 1,
+                    "candidates": names,
+                }
+            else:
+                break
+        self.misses += 1
+        return None, {"match": None, "ambiguous": False, "candidates": []}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "built": self._tables is not None,
+            "types": self.type_count,
+            "builds": self.builds,
+            "last_build_seconds": round(self.build_seconds, 4),
+            "catalogs": sorted(self._catalogs),
+            "catalog_builds": self.catalog_builds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+_INDEX = NodeTypeIndex()
+_CALLBACK_REGISTERED = False
+register_metrics_source("node_type_index", _INDEX.stats)
+
+_INVALIDATING_EVENTS = ("AssetCreated", "AssetDeleted", "LibraryInstalled", "LibraryUninstalled")
+
+
+def _register_hda_callback(hou):
+    global _CALLBACK_REGISTERED
+    if _CALLBACK_REGISTERED:
+        return
+    try:
+        event_types = [getattr(hou.hdaEventType, name) for name in _INVALIDATING_EVENTS if hasattr(hou.hdaEventType, name)]
+        hou.hda.addEventCallback(event_types, _INDEX.invalidate)
+    except Exception:
+        return
+    _CALLBACK_REGISTERED = True
+
+
+def get_node_type_index(hou) -> NodeTypeIndex:
+    _register_hda_callback(hou)
+    return _INDEX
+
+
+def resolve_node_type(type_name: str, hou, category=None) -> Tuple[Optional[Any], Dict[str, Any]]:
+    return get_node_type_index(hou).resolve(type_name, hou, category)
+
+
+def node_type_catalog(category, hou) -> List[Dict[str, Any]]:
+    return get_node_type_index(hou).catalog(category)
+
+
+def invalidate_node_type_index():
+    """Call after anything that adds or removes node types outside HDA events."""
+    _INDEX.invalidate()
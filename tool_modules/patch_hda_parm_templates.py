@@ -0,0 +1,121 @@
+from typing import Any, Optional
+import json
+
+from .hda_utils import (
+    apply_parm_template_patch,
+    diff_parm_template_rows,
+    flatten_parm_templates,
+    invalidate_parm_template_cache,
+    resolve_hda_definition,
+)
+
+TOOL_NAME = "patch_hda_parm_templates"
+IS_MUTATING = True
+
+send_command = None
+
+def patch_hda_parm_templates(
+    operations: Any,
+    node_path: Optional[str] = None,
+    type_name: Optional[str] = None,
+    definition_name: Optional[str] = None,
+    dry_run: bool = False,
+    sync_instance: bool = True,
+) -> str:
+    """
+    Apply incremental edits to an HDA's parameter interface in one write.
+
+    All operations are applied in order to a single ParmTemplateGroup, which is
+    written with one setParmTemplateGroup call. Nothing is written when the
+    result is identical to the current interface, or when dry_run is set.
+
+    Operations (list of dicts, applied in order):
+        {"op": "insert_before", "anchor": "scale", "template": {...}}
+        {"op": "insert_after", "anchor": "scale", "template": {...}}
+        {"op": "replace", "name": "scale", "template": {...}}
+        {"op": "remove", "name": "old_parm"}
+        {"op": "move", "name": "seed", "before": "scale"}   (or "after", or neither for the end)
+        {"op": "set", "name": "scale", "attributes": {"label": "Size", "default_value": [2.0],
+                                                        "min": 0, "max": 10, "help": "...", "hidden": false,
+                                                        "disable_when": "{ enable == 0 }", "tags": {...}}}
+        {"op": "append", "template": {...}, "folder": "Advanced"}
+    Template specs use the same format as set_hda_parm_templates.
+    """
+    result = send_command({
+        "type": "patch_hda_parm_templates",
+        "params": {
+            "node_path": node_path,
+            "type_name": type_name,
+            "definition_name": definition_name,
+            "operations": operations,
+            "dry_run": dry_run,
+            "sync_instance": sync_instance,
+        }
+    })
+    diff = result.get("diff", {})
+    if result.get("written"):
+        header = "✅ HDA parameter interface patched"
+    elif result.get("dry_run"):
+        header = "🔍 Dry run (nothing written)"
+    else:
+        header = "✅ No changes; definition left untouched"
+    lines = [
+        header,
+        f"Definition: {result.get('definition_name')}",
+        f"Operations: {len(result.get('applied', []))}",
+    ]
+    for entry in result.get("applied", []):
+        lines.append(f"  • {entry}")
+    for key in ("added", "removed", "moved"):
+        if diff.get(key):
+            lines.append(f"{key.capitalize()}: {diff[key]}")
+    if diff.get("modified"):
+        lines.append(f"Modified: {json.dumps(diff['modified'], default=str)}")
+    return "\n".join(lines)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(patch_hda_parm_templates)
+
+
+def execute_plugin(params, server, hou):
+    """Apply patch operations to an HDA ParmTemplateGroup with a single write."""
+    node, definition = resolve_hda_definition(params, hou)
+    operations = params.get("operations", [])
+    if isinstance(operations, str):
+        try:
+            operations = json.loads(operations)
+        except json.JSONDecodeError as exc:
+            raise ValueError("operations must be a list or JSON list string") from exc
+    if isinstance(operations, dict):
+        operations = [operations]
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("operations must be a non-empty list")
+
+    ptg = definition.parmTemplateGroup()
+    before_script = ptg.asDialogScript()
+    before = flatten_parm_templates(ptg.entries(), hou)
+    applied = apply_parm_template_patch(ptg, operations, hou)
+    changed = ptg.asDialogScript() != before_script
+    diff = diff_parm_template_rows(before, flatten_parm_templates(ptg.entries(), hou)) if changed else {}
+
+    dry_run = bool(params.get("dry_run", False))
+    written = changed and not dry_run
+    if written:
+        definition.setParmTemplateGroup(ptg)
+        invalidate_parm_template_cache(definition)
+        if node is not None and bool(params.get("sync_instance", True)):
+            node.matchCurrentDefinition()
+
+    return {
+        "definition_name": definition.nodeTypeName(),
+        "library_file_path": definition.libraryFilePath(),
+        "applied": applied,
+        "changed": changed,
+        "dry_run": dry_run,
+        "written": written,
+        "diff": diff,
+    }
@@ -0,0 +1,22 @@
+"""Registry of plugin-side metrics sources (caches, indexes) reported by get_plugin_metrics."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+_SOURCES: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def register_metrics_source(name: str, fn: Callable[[], Dict[str, Any]]):
+    """Register (or replace) a zero-argument callable returning a metrics dict."""
+    _SOURCES[name] = fn
+
+
+def collect_metrics() -> Dict[str, Any]:
+    metrics = {}
+    for name, fn in sorted(_SOURCES.items()):
+        try:
+            metrics[name] = fn()
+        except Exception as exc:
+            metrics[name] = {"error": str(exc)}
+    return metrics
@@ -1,19 +1,103 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 import json
 
+from .cook_utils import parse_frames
+from .geometry_cache import cached_geometry_product
+from .geometry_utils import (
+    columnar_time_series,
+    geometry_at_frame,
+    geometry_summary,
+    packed_primitive_summary,
+    volume_summary,
+    require_geometry_node,
+    resolve_geometry_node,
+)
 from .hda_utils import geometry_stats
+from .worker_pool import pool_unavailable_reason, run_worker_shards, shard
 
 TOOL_NAME = "probe_geometry"
 IS_MUTATING = False
 
 send_command = None
 
-def probe_geometry(node_path: str) -> str:
-    """Probe geometry output metrics for a SOP node."""
+def probe_geometry(
+    node_path: str,
+    frames: Optional[List[float]] = None,
+    start_frame: Optional[float] = None,
+    end_frame: Optional[float] = None,
+    step: float = 1,
+    attributes: Optional[List[str]] = None,
+    workers: int = 1,
+    mode: str = "stats",
+    top_n: int = 10,
+    stride: int = 1,
+    bins: int = 16,
+    frame: Optional[float] = None,
+) -> str:
+    """
+    Probe geometry output metrics for a SOP node.
+
+    Without frames, reports counts and attribute names at the current frame.
+    With frames or start_frame/end_frame, evaluates every frame in the plugin
+    and returns a columnar time series of counts, bbox and min/max/mean of the
+    selected attributes (e.g. ["P", "prim:density"]). workers > 1 shards the
+    frames across headless hython processes when the hip file is saved.
+
+    mode="packed" summarizes packed primitives from their intrinsics without
+    unpacking: packed types, unique sources (files, object paths, embedded
+    geometry), instanced point totals, an instance-usage histogram, the top_n
+    most instanced sources and the uniform-scale range of the transforms.
+
+    mode="volume" reports, per Volume/VDB primitive, resolution, voxel size,
+    active-voxel count, sampled-voxel count, value min/max/mean and a histogram
+    with `bins` bins. VDB statistics cover active voxels only.
+    Voxels are read in bulk; stride > 1 samples every stride-th voxel per
+    axis and stride=0 picks a stride that keeps the sample under ~16M voxels.
+
+    frame evaluates the packed and volume modes at that frame instead of the
+    current one.
+    """
     result = send_command({
         "type": "probe_geometry",
-        "params": {"node_path": node_path}
+        "params": {
+            "node_path": node_path,
+            "frames": frames,
+            "start_frame": start_frame,
+            "end_frame": end_frame,
+            "step": step,
+            "attributes": attributes or [],
+            "workers": workers,
+            "mode": mode,
+            "top_n": top_n,
+            "stride": stride,
+            "bins": bins,
+            "frame": frame,
+        }
     })
+    if "packed" in result:
+        return f"📦 Packed primitives: {result.get('node_path')}\n" + json.dumps(
+            result["packed"], indent=2, default=str
+        )
+    if "volumes" in result:
+        output = f"🌫️ Volumes: {result.get('node_path')} ({len(result['volumes'])} found)\n"
+        for volume in result["volumes"]:
+            values = volume.get("values", {})
+            output += (
+                f"  [{volume.get('prim')}] {volume.get('name') or volume.get('type')}: "
+                f"res={volume.get('resolution')} voxel={volume.get('voxel_size')} "
+                f"active={volume.get('active_voxels')} sampled={volume.get('sampled_voxels')} "
+                f"stride={volume.get('stride')} "
+                f"min={values.get('min')} max={values.get('max')} mean={values.get('mean')}\n"
+            )
+        return output + json.dumps(result["volumes"], default=str)
+    if "series" in result:
+        series = result["series"]
+        output = f"📈 Geometry time series: {result.get('node_path')}\n"
+        output += f"Frames: {len(series.get('frames', []))} ({result.get('execution')})\n"
+        if result.get("pool_note"):
+            output += f"Note: {result['pool_note']}\n"
+        return output + json.dumps(series, default=str)
+
     stats = result.get("stats", {})
     output = f"📊 Geometry probe: {result.get('node_path')}\n"
     output += f"Points: {stats.get('points')}\n"
@@ -32,15 +116,102 @@ def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool
     decorator()(probe_geometry)
 
 
+def probe_frames(payload, hou):
+    """Summarize a node's geometry at each frame; also the hython worker entry point."""
+    node_path = payload.get("node_path", "")
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+    geometry_node = require_geometry_node(node)
+    attributes = payload.get("attributes", []) or []
+    return [
+        cached_geometry_product(
+            geometry_node,
+            frame,
+            ("summary", tuple(attributes)),
+            lambda frame=frame: geometry_summary(geometry_at_frame(geometry_node, frame, hou), hou, attributes),
+            hou,
+        )
+        for frame in payload.get("frames", [])
+    ]
+
+
 def execute_plugin(params, server, hou):
-    """Probe geometry output metrics for a node."""
+    """Probe geometry output metrics for a node, optionally across frames."""
     node_path = params.get("node_path", "")
     node = hou.node(node_path)
     if not node:
         raise ValueError(f"Node not found: {node_path}")
 
-    stats = geometry_stats(node, hou)
+    mode = str(params.get("mode", "stats") or "stats").lower()
+    if mode == "packed":
+        geometry_node = require_geometry_node(node)
+        top_n = max(1, int(params.get("top_n", 10) or 10))
+        frame = params.get("frame")
+        packed = cached_geometry_product(
+            geometry_node,
+            frame,
+            ("packed", top_n),
+            lambda: packed_primitive_summary(geometry_at_frame(geometry_node, frame, hou), hou, top_n),
+            hou,
+        )
+        return {"node_path": geometry_node.path(), "packed": packed}
+    if mode == "volume":
+        geometry_node = require_geometry_node(node)
+        stride = max(0, int(params.get("stride") or 0))
+        bins = max(1, int(params.get("bins", 16) or 16))
+        frame = params.get("frame")
+        volumes = cached_geometry_product(
+            geometry_node,
+            frame,
+            ("volume", stride, bins),
+            lambda: volume_summary(geometry_at_frame(geometry_node, frame, hou), hou, stride, bins),
+            hou,
+        )
+        return {"node_path": geometry_node.path(), "volumes": volumes}
+    if mode != "stats":
+        raise ValueError(f"Unsupported probe mode: {mode}")
+
+    frames = parse_frames(params)
+    if not frames:
+        geometry_node = resolve_geometry_node(node)
+        if geometry_node is None:
+            stats = geometry_stats(node, hou)
+        else:
+            stats = cached_geometry_product(
+                geometry_node, None, "stats", lambda: geometry_stats(geometry_node, hou), hou
+            )
+        return {
+            "node_path": node.path(),
+            "stats": stats,
+        }
+
+    payload = {"node_path": node.path(), "attributes": params.get("attributes", []) or []}
+    workers = max(1, int(params.get("workers", 1) or 1))
+    execution = "in_process"
+    pool_note = None
+    summaries = None
+    if workers > 1 and len(frames) > 1:
+        pool_note = pool_unavailable_reason(hou)
+        if pool_note is None:
+            chunks = shard(frames, workers)
+            shard_results = run_worker_shards(
+                "tool_modules.probe_geometry",
+                "probe_frames",
+                [dict(payload, frames=chunk) for chunk in chunks],
+                len(chunks),
+                hou,
+            )
+            summaries = [summary for chunk in shard_results for summary in chunk]
+            execution = f"{len(chunks)} workers"
+        else:
+            pool_note = f"Worker pool unavailable, ran in process: {pool_note}"
+    if summaries is None:
+        summaries = probe_frames(dict(payload, frames=frames), hou)
+
     return {
         "node_path": node.path(),
-        "stats": stats,
+        "execution": execution,
+        "pool_note": pool_note,
+        "series": columnar_time_series(frames, summaries),
     }
@@ -0,0 +1,236 @@
+from typing import Any, Dict, List, Optional
+import json
+import os
+import time
+
+from .cook_utils import network_output_node, parse_frames
+
+TOOL_NAME = "profile_cook"
+IS_MUTATING = False
+
+send_command = None
+
+# hou.PerfMonProfile.stats() reports cook statistics as a table: "cookStats"
+# holds the column "headers" and one row of values per node path, already
+# aggregated over every cook in the profile.
+COOK_STATS_SECTION = "cookStats"
+COOK_STATS_COLUMNS = {
+    "cook_count": "Cook Count",
+    "self_ms": "Self Cook Time",
+    "total_ms": "Total Cook Time",
+    "memory_growth_bytes": "Self Memory Growth",
+}
+
+
+def aggregate_profile_stats(stats) -> Dict[str, Dict[str, float]]:
+    """Per-node self/total/count/memory columns from the perfMon cookStats table.
+
+    Returns {} when the table or its time columns are missing, so the caller
+    falls back to HOM timings.
+    """
+    table = stats.get(COOK_STATS_SECTION) if isinstance(stats, dict) else None
+    if not isinstance(table, dict):
+        return {}
+    headers = table.get("headers") or []
+    columns = {field: headers.index(header) for field, header in COOK_STATS_COLUMNS.items() if header in headers}
+    if "self_ms" not in columns and "total_ms" not in columns:
+        return {}
+
+    rows: Dict[str, Dict[str, float]] = {}
+    for path, values in table.items():
+        if not path.startswith("/") or not isinstance(values, list):
+            continue
+        row = {}
+        for field, column in columns.items():
+            value = values[column] if column < len(values) else None
+            row[field] = float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else 0.0
+        row.setdefault("self_ms", row.get("total_ms", 0.0))
+        row.setdefault("total_ms", row["self_ms"])
+        row["cook_count"] = int(row.get("cook_count", 0))
+        row.setdefault("memory_growth_bytes", 0.0)
+        rows[path] = row
+    return rows
+
+
+def _watched_nodes(target):
+    nodes = {target.path(): target}
+    for ancestor in target.inputAncestors():
+        nodes[ancestor.path()] = ancestor
+    for child in target.allSubChildren():
+        nodes[child.path()] = child
+    return nodes
+
+
+def _safe_call(node, method_name, default=None):
+    fn = getattr(node, method_name, None)
+    if not callable(fn):
+        return default
+    try:
+        return fn()
+    except Exception:
+        return default
+
+
+def profile_cook(
+    node_path: str,
+    start_frame: Optional[float] = None,
+    end_frame: Optional[float] = None,
+    step: float = 1,
+    frames: Optional[List[float]] = None,
+    top_n: int = 15,
+    sort_by: str = "self",
+    save_path: str = "",
+) -> str:
+    """
+    Profile force-cooks of a node over a frame range with the Houdini performance monitor.
+
+    Returns a compact table of the top-N nodes by self or total cook time with
+    cook counts and memory growth. Without a range the current frame is used.
+
+    Args:
+        node_path: Node to cook (SOP, or a network whose display node is cooked)
+        start_frame/end_frame/step: Frame range to cook
+        frames: Explicit frame list (overrides the range)
+        top_n: Number of rows to return
+        sort_by: 'self' or 'total'
+        save_path: Optional .hperf path to save the raw profile for later inspection
+    """
+    result = send_command({
+        "type": "profile_cook",
+        "params": {
+            "node_path": node_path,
+            "start_frame": start_frame,
+            "end_frame": end_frame,
+            "step": step,
+            "frames": frames,
+            "top_n": top_n,
+            "sort_by": sort_by,
+            "save_path": save_path,
+        }
+    })
+    lines = [
+        f"⏱️ Cook profile: {result.get('node_path')}",
+        f"Frames: {result.get('num_frames')}  Wall time: {result.get('wall_time_ms')} ms  Source: {result.get('stats_source')}",
+    ]
+    if result.get("saved_profile"):
+        lines.append(f"Profile saved: {result['saved_profile']}")
+    lines.append("")
+    lines.append(f"{'self ms':>10} {'total ms':>10} {'cooks':>6} {'mem Δ':>12}  node")
+    for row in result.get("top_nodes", []):
+        lines.append(
+            f"{row['self_ms']:>10.2f} {row['total_ms']:>10.2f} {row['cook_count']:>6} "
+            f"{int(row['memory_growth_bytes']):>12}  {row['path']}"
+        )
+    return "\n".join(lines)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(profile_cook)
+
+
+def execute_plugin(params, server, hou):
+    """Profile force-cooks over a frame range and aggregate per-node timings."""
+    node_path = params.get("node_path", "")
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+
+    sort_by = str(params.get("sort_by", "self")).lower()
+    if sort_by not in ("self", "total"):
+        raise ValueError("sort_by must be 'self' or 'total'")
+    top_n = max(1, int(params.get("top_n", 15) or 15))
+    frames = parse_frames(params) or [hou.frame()]
+
+    target = network_output_node(node) or node
+    watched = _watched_nodes(target)
+    cook_counts_before = {path: _safe_call(n, "cookCount", 0) or 0 for path, n in watched.items()}
+    hom_rows = {path: {"self_ms": 0.0, "cook_count": 0} for path in watched}
+
+    options = hou.PerfMonRecordOptions(
+        cook_stats=True,
+        solve_stats=True,
+        draw_stats=False,
+        gpu_draw_stats=False,
+        viewport_stats=False,
+        script_stats=False,
+        render_stats=False,
+        thread_stats=False,
+        frame_stats=False,
+        memory_stats=True,
+        errors=True,
+    )
+    original_frame = hou.frame()
+    profile = hou.perfMon.startProfile(f"MCP profile_cook {target.path()}", options)
+    started = time.perf_counter()
+    try:
+        for frame in frames:
+            hou.setFrame(frame)
+            target.cook(force=True)
+            # Per-node HOM timings back the table if the perfMon stats are unreadable.
+            for path, watched_node in watched.items():
+                count = _safe_call(watched_node, "cookCount", 0) or 0
+                if count != cook_counts_before[path] + hom_rows[path]["cook_count"]:
+                    hom_rows[path]["cook_count"] = count - cook_counts_before[path]
+                    hom_rows[path]["self_ms"] += float(_safe_call(watched_node, "lastCookTime", 0.0) or 0.0)
+    finally:
+        wall_time_ms = (time.perf_counter() - started) * 1000.0
+        profile.stop()
+        hou.setFrame(original_frame)
+
+    saved_profile = None
+    save_path = str(params.get("save_path", "") or "").strip()
+    if save_path:
+        saved_profile = os.path.abspath(os.path.expanduser(save_path))
+        if not saved_profile.endswith(".hperf"):
+            saved_profile += ".hperf"
+        profile.save(saved_profile)
+
+    rows = {}
+    stats_source = "perfMon"
+    try:
+        stats = profile.stats()
+        if isinstance(stats, str):
+            stats = json.loads(stats)
+        rows = aggregate_profile_stats(stats)
+    except Exception:
+        rows = {}
+    if not rows:
+        stats_source = "hom"
+        rows = {
+            path: {
+                "self_ms": row["self_ms"],
+                "total_ms": row["self_ms"],
+                "cook_count": row["cook_count"],
+                "memory_growth_bytes": 0.0,
+            }
+            for path, row in hom_rows.items()
+            if row["cook_count"]
+        }
+
+    try:
+        # Release the in-session profile; the .hperf copy, if any, is already on disk.
+        profile.cancel()
+    except Exception:
+        pass
+
+    sort_key = "self_ms" if sort_by == "self" else "total_ms"
+    table = [
+        dict(row, path=path, self_ms=round(row["self_ms"], 3), total_ms=round(row["total_ms"], 3))
+        for path, row in rows.items()
+    ]
+    table.sort(key=lambda row: row[sort_key], reverse=True)
+
+    return {
+        "node_path": node.path(),
+        "cooked_path": target.path(),
+        "frames": frames,
+        "num_frames": len(frames),
+        "wall_time_ms": round(wall_time_ms, 3),
+        "stats_source": stats_source,
+        "num_profiled_nodes": len(table),
+        "top_nodes": table[:top_n],
+        "saved_profile": saved_profile,
+    }
@@ -0,0 +1,136 @@
+from typing import Any, List, Optional
+import json
+
+from .geometry_cache import cached_geometry_product
+from .geometry_utils import geometry_at_frame, point_positions, require_geometry_node
+from .spatial_index import UniformGridIndex
+
+TOOL_NAME = "query_geometry_spatial"
+IS_MUTATING = False
+
+QUERY_TYPES = ("nearest", "radius", "bbox")
+
+send_command = None
+
+
+def _coerce_points(value):
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError as exc:
+            raise ValueError("points must be a JSON array of [x, y, z]") from exc
+    if value is None:
+        return []
+    if value and isinstance(value[0], (int, float)):
+        value = [value]
+    for point in value:
+        if len(point) != 3:
+            raise ValueError(f"Query points must have 3 components: {point}")
+    return value
+
+
+def query_geometry_spatial(
+    node_path: str,
+    query: str = "nearest",
+    points: Optional[Any] = None,
+    k: int = 1,
+    radius: float = 0.0,
+    bbox_min: Optional[List[float]] = None,
+    bbox_max: Optional[List[float]] = None,
+    max_results: int = 1000,
+    frame: Optional[float] = None,
+) -> str:
+    """
+    Spatial queries over a SOP's cooked points without per-point Python loops.
+
+    A NumPy uniform grid over P is built once per cook and cached. Returns only
+    point indices and distances.
+
+    Args:
+        node_path: SOP (or network whose display SOP is used)
+        query: 'nearest' (k nearest to each query point), 'radius' (points within
+               radius of each query point) or 'bbox' (points inside bbox_min/bbox_max)
+        points: Query positions, e.g. [[0, 1, 0], [2, 0, 0]] (nearest/radius)
+        k: Neighbour count for 'nearest'
+        radius: Search radius for 'radius'
+        bbox_min/bbox_max: Box corners for 'bbox'
+        max_results: Cap on indices returned per query
+        frame: Evaluate at this frame instead of the current one
+    """
+    result = send_command({
+        "type": "query_geometry_spatial",
+        "params": {
+            "node_path": node_path,
+            "query": query,
+            "points": points,
+            "k": k,
+            "radius": radius,
+            "bbox_min": bbox_min,
+            "bbox_max": bbox_max,
+            "max_results": max_results,
+            "frame": frame,
+        }
+    })
+    return json.dumps(result, default=str)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(query_geometry_spatial)
+
+
+def execute_plugin(params, server, hou):
+    """Answer nearest/radius/bbox queries against a cached grid over cooked points."""
+    node_path = params.get("node_path", "")
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+    query = str(params.get("query", "nearest")).lower()
+    if query not in QUERY_TYPES:
+        raise ValueError(f"query must be one of {QUERY_TYPES}")
+    max_results = max(0, int(params.get("max_results", 1000) or 0))
+    frame = params.get("frame")
+
+    geometry_node = require_geometry_node(node)
+    index = cached_geometry_product(
+        geometry_node,
+        frame,
+        "spatial_grid",
+        lambda: UniformGridIndex(point_positions(geometry_at_frame(geometry_node, frame, hou), hou)),
+        hou,
+    )
+
+    result = {
+        "node_path": geometry_node.path(),
+        "query": query,
+        "num_points": int(index.points.shape[0]),
+    }
+    if query == "bbox":
+        if params.get("bbox_min") is None or params.get("bbox_max") is None:
+            raise ValueError("bbox query requires bbox_min and bbox_max")
+        indices = index.bbox(params["bbox_min"], params["bbox_max"])
+        result["total_matches"] = int(indices.size)
+        result["indices"] = indices[:max_results].tolist() if max_results else indices.tolist()
+        return result
+
+    query_points = _coerce_points(params.get("points"))
+    if not query_points:
+        raise ValueError(f"{query} query requires points")
+    matches = []
+    for point in query_points:
+        if query == "nearest":
+            indices, distances = index.nearest(point, int(params.get("k", 1) or 1))
+        else:
+            radius = float(params.get("radius", 0.0) or 0.0)
+            if radius <= 0:
+                raise ValueError("radius query requires radius > 0")
+            indices, distances = index.radius(point, radius)
+        matches.append({
+            "total_matches": int(indices.size),
+            "indices": indices[:max_results].tolist() if max_results else indices.tolist(),
+            "distances": distances[:max_results].tolist() if max_results else distances.tolist(),
+        })
+    result["results"] = matches
+    return result
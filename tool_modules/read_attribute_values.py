@@ -0,0 +1,130 @@
+from typing import Any, List, Optional
+import json
+
+from .array_utils import pack_array
+from .geometry_utils import cached_attribute_array, geometry_at_frame, require_geometry_node
+
+TOOL_NAME = "read_attribute_values"
+IS_MUTATING = False
+
+MAX_PAGE_ELEMENTS = 1_000_000
+
+send_command = None
+
+
+def slice_elements(array, offset: int = 0, count: int = 1000, stride: int = 1, indices=None):
+    """Return (element_indices, values) for a contiguous/strided page or an explicit index list."""
+    import numpy as np
+
+    total = array.shape[0]
+    if indices is not None:
+        element_indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        if element_indices.size and (element_indices.min() < 0 or element_indices.max() >= total):
+            raise ValueError(f"indices out of range for {total} elements")
+    else:
+        if offset < 0 or stride < 1 or count < 0:
+            raise ValueError("offset and count must be >= 0 and stride >= 1")
+        stop = min(total, offset + count * stride)
+        element_indices = np.arange(offset, stop, stride, dtype=np.int64)
+    if element_indices.size > MAX_PAGE_ELEMENTS:
+        raise ValueError(f"Page too large ({element_indices.size} elements); max is {MAX_PAGE_ELEMENTS}")
+    return element_indices, array[element_indices]
+
+
+def read_attribute_values(
+    node_path: str,
+    attribute: str,
+    offset: int = 0,
+    count: int = 1000,
+    stride: int = 1,
+    indices: Optional[List[int]] = None,
+    frame: Optional[float] = None,
+    float64: bool = False,
+) -> str:
+    """
+    Read a page of one attribute's values as a packed typed array.
+
+    Numeric values come back base64-encoded (little-endian) with dtype, shape
+    and tuple_size; decode with numpy.frombuffer(base64.b64decode(data), dtype).
+    String attributes come back as plain lists.
+
+    Args:
+        node_path: SOP (or network whose display SOP is read)
+        attribute: Attribute reference, e.g. "P", "prim:name", "vertex:uv", "detail:foo"
+        offset/count/stride: Contiguous or strided page of elements
+        indices: Explicit element indices (overrides offset/count/stride)
+        frame: Evaluate at this frame instead of the current one
+        float64: Read float attributes at double precision
+    """
+    result = send_command({
+        "type": "read_attribute_values",
+        "params": {
+            "node_path": node_path,
+            "attribute": attribute,
+            "offset": offset,
+            "count": count,
+            "stride": stride,
+            "indices": indices,
+            "frame": frame,
+            "float64": float64,
+        }
+    })
+    return json.dumps(result, default=str)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(read_attribute_values)
+
+
+def execute_plugin(params, server, hou):
+    """Read a slice of one attribute via bulk accessors and return it packed."""
+    node_path = params.get("node_path", "")
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+    attribute = str(params.get("attribute", "") or "").strip()
+    if not attribute:
+        raise ValueError("attribute is required")
+
+    geometry_node = require_geometry_node(node)
+    geo = geometry_at_frame(geometry_node, params.get("frame"), hou)
+    attrib_class, attrib, array = cached_attribute_array(
+        geometry_node,
+        geo,
+        params.get("frame"),
+        attribute,
+        hou,
+        float64=bool(params.get("float64", False)),
+    )
+
+    count = params.get("count")
+    stride = int(params.get("stride", 1) or 1)
+    element_indices, values = slice_elements(
+        array,
+        offset=int(params.get("offset", 0) or 0),
+        count=1000 if count is None else int(count),
+        stride=stride,
+        indices=params.get("indices"),
+    )
+
+    result = {
+        "node_path": geometry_node.path(),
+        "attribute": f"{attrib_class}:{attrib.name()}",
+        "tuple_size": int(array.shape[1]),
+        "total_elements": int(array.shape[0]),
+        "returned_elements": int(element_indices.size),
+    }
+    if params.get("indices") is None:
+        next_offset = int(element_indices[-1]) + stride if element_indices.size else None
+        result["next_offset"] = next_offset if next_offset is not None and next_offset < array.shape[0] else None
+    else:
+        result["indices"] = element_indices.tolist()
+
+    if values.dtype == object:
+        result["values"] = values.tolist()
+    else:
+        result.update(pack_array(values))
+    return result
@@ -0,0 +1,101 @@
+from typing import Any, List, Optional
+import fnmatch
+import json
+
+from .array_utils import pack_array, write_arrays
+
+TOOL_NAME = "read_chop_channels"
+IS_MUTATING = False
+
+DEFAULT_INLINE_BYTES = 4 * 1024 * 1024
+
+send_command = None
+
+
+def select_tracks(track_names: List[str], patterns: Optional[List[str]]) -> List[str]:
+    """Track names matching any pattern, in CHOP order (all tracks without patterns)."""
+    if not patterns:
+        return list(track_names)
+    return [name for name in track_names if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)]
+
+
+def read_chop_channels(
+    node_path: str,
+    channels: Optional[List[str]] = None,
+    inline_limit_bytes: int = DEFAULT_INLINE_BYTES,
+    output_path: str = "",
+    float64: bool = False,
+) -> str:
+    """
+    Read every sample of selected CHOP channels in one call.
+
+    Channels are stacked into a (channels, samples) array. Small clips are
+    returned inline as a base64 packed array (decode with
+    np.frombuffer(base64.b64decode(data), dtype).reshape(shape)); clips above
+    inline_limit_bytes (or when output_path is given) are written to a
+    memory-mappable .npy instead. Sample rate, sample range and start/end
+    times are always included.
+
+    Args:
+        node_path: CHOP node path
+        channels: Channel names or patterns (e.g. ["tx", "r*"]); default all
+        inline_limit_bytes: Largest array returned inline
+        output_path: Directory for the .npy file (default: export temp dir)
+        float64: Keep double precision instead of float32
+    """
+    result = send_command({
+        "type": "read_chop_channels",
+        "params": {
+            "node_path": node_path,
+            "channels": channels or [],
+            "inline_limit_bytes": inline_limit_bytes,
+            "output_path": output_path,
+            "float64": float64,
+        }
+    })
+    return json.dumps(result, indent=2, default=str)
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(read_chop_channels)
+
+
+def execute_plugin(params, server, hou):
+    """Bulk-read CHOP track samples as a typed (channels, samples) array."""
+    import numpy as np
+
+    node_path = params.get("node_path", "")
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+    if not hasattr(node, "tracks"):
+        raise ValueError(f"Node {node_path} is not a CHOP node")
+
+    tracks = {track.name(): track for track in node.tracks()}
+    names = select_tracks(list(tracks), list(params.get("channels", []) or []))
+    if not names:
+        raise ValueError(f"No channels matched {params.get('channels')} on {node_path}")
+
+    dtype = np.float64 if params.get("float64") else np.float32
+    samples = np.stack([np.asarray(tracks[name].allSamples(), dtype=dtype) for name in names])
+    start, end = node.sampleRange()
+    result: Any = {
+        "node_path": node.path(),
+        "channels": names,
+        "sample_rate": node.sampleRate(),
+        "sample_range": [start, end],
+        "start_time": node.samplesToTime(start),
+        "end_time": node.samplesToTime(end),
+        "num_samples": int(samples.shape[1]),
+    }
+
+    inline_limit = int(params.get("inline_limit_bytes", DEFAULT_INLINE_BYTES) or 0)
+    if samples.nbytes <= inline_limit and not params.get("output_path"):
+        result["data"] = pack_array(samples)
+    else:
+        descriptor = write_arrays({"channels": samples}, "npy", params.get("output_path") or None, hou)
+        result["file"] = descriptor["arrays"][0]
+    return result
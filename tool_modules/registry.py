@@ -3,14 +3,22 @@
 import importlib
 
 from . import (
+    apply_network_spec,
+    begin_edit_session,
     bind_internal_parameters,
+    compare_geometry,
     connect_nodes,
     create_digital_asset,
     create_node,
     delete_node,
     edit_parameter_interface,
+    end_edit_session,
     execute_hscript,
     execute_python,
+    export_geometry_arrays,
+    find_hda_library,
+    get_cook_stats,
+    get_dop_simulation_state,
     get_folder_info,
     get_hda_definition_info,
     get_hda_parm_templates,
@@ -21,10 +29,13 @@ from . import (
     get_node_parameters,
     get_parameter_overrides,
     get_parameter_info,
+    get_plugin_metrics,
     get_python_documentation,
     get_scene_info,
     get_sticky_notes,
+    get_usd_stage,
     install_hda_file,
+    install_hda_files,
     instantiate_example_asset,
     instantiate_hda,
     list_example_nodes,
@@ -33,11 +44,19 @@ from . import (
     list_python_commands,
     load_example,
     open_help_browser,
+    patch_hda_parm_templates,
     probe_geometry,
+    profile_cook,
+    query_geometry_spatial,
+    read_attribute_values,
+    read_chop_channels,
     read_documentation_file,
     remove_connection,
+    run_edit_batch,
+    run_hda_regression,
     save_hda_definition,
     save_hda_from_instance,
+    scan_hda_libraries,
     search_documentation_files,
     search_python_documentation,
     set_hda_internal_binding,
@@ -51,17 +70,26 @@ from . import (
     set_primitive_type_by_token,
     validate_hda,
     validate_hda_behavior,
+    validate_hda_library,
 )
 
 TOOL_MODULES = [
+    apply_network_spec,
+    begin_edit_session,
     bind_internal_parameters,
+    compare_geometry,
     connect_nodes,
     create_digital_asset,
     create_node,
     delete_node,
     edit_parameter_interface,
+    end_edit_session,
     execute_hscript,
     execute_python,
+    export_geometry_arrays,
+    find_hda_library,
+    get_cook_stats,
+    get_dop_simulation_state,
     get_folder_info,
     get_hda_definition_info,
     get_hda_parm_templates,
@@ -72,10 +100,13 @@ TOOL_MODULES = [
     get_node_parameters,
     get_parameter_overrides,
     get_parameter_info,
+    get_plugin_metrics,
     get_python_documentation,
     get_scene_info,
     get_sticky_notes,
+    get_usd_stage,
     install_hda_file,
+    install_hda_files,
     instantiate_example_asset,
     instantiate_hda,
     list_example_nodes,
@@ -84,11 +115,19 @@ TOOL_MODULES = [
     list_python_commands,
     load_example,
     open_help_browser,
+    patch_hda_parm_templates,
     probe_geometry,
+    profile_cook,
+    query_geometry_spatial,
+    read_attribute_values,
+    read_chop_channels,
     read_documentation_file,
     remove_connection,
+    run_edit_batch,
+    run_hda_regression,
     save_hda_definition,
     save_hda_from_instance,
+    scan_hda_libraries,
     search_documentation_files,
     search_python_documentation,
     set_hda_internal_binding,
@@ -102,6 +141,7 @@ TOOL_MODULES = [
     set_primitive_type_by_token,
     validate_hda,
     validate_hda_behavior,
+    validate_hda_library,
 ]
 
 def _iter_tool_modules(reload_modules: bool = False):
@@ -0,0 +1,115 @@
+from typing import Any, Optional
+import json
+
+from .cook_utils import EditSession
+
+TOOL_NAME = "run_edit_batch"
+IS_MUTATING = True
+
+# The batch owns (or joins) the edit session; these would close or replace it mid-batch.
+SESSION_COMMANDS = {"begin_edit_session", "end_edit_session"}
+
+send_command = None
+
+
+def _coerce_commands(value):
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError as exc:
+            raise ValueError("commands must be a JSON array or list") from exc
+    if not isinstance(value, list) or not value:
+        raise ValueError("commands must be a non-empty list")
+    for command in value:
+        if not isinstance(command, dict) or not command.get("type"):
+            raise ValueError("Each command must be a dict with 'type' and optional 'params'")
+        if command["type"] == TOOL_NAME:
+            raise ValueError("run_edit_batch cannot be nested")
+        if command["type"] in SESSION_COMMANDS:
+            raise ValueError(f"{command['type']} cannot run inside run_edit_batch")
+    return value
+
+
+def run_edit_batch(commands: Any, cook: bool = True, stop_on_error: bool = True) -> str:
+    """
+    Run several tool commands as one batch: one undo group, no intermediate
+    cooks, and a single cook of the touched networks at the end.
+
+    Args:
+        commands: List of {"type": <tool name>, "params": {...}}
+        cook: Cook touched networks once after the batch
+        stop_on_error: Stop at the first failing command
+    """
+    result = send_command({
+        "type": "run_edit_batch",
+        "params": {
+            "commands": commands,
+            "cook": cook,
+            "stop_on_error": stop_on_error,
+        }
+    })
+    output = (
+        f"✅ Edit batch finished\n"
+        f"Commands run: {result.get('commands_run')}/{result.get('commands_total')}\n"
+        f"Cooked outputs: {len(result.get('cooked', []))}\n"
+        f"Cooks avoided: {result.get('cooks_avoided')}"
+    )
+    if result.get("errors"):
+        output += "\nErrors:\n" + "\n".join(f"- {err}" for err in result["errors"])
+    return output
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(run_edit_batch)
+
+
+def execute_plugin(params, server, hou):
+    """Dispatch a list of commands inside one deferred-cook edit session."""
+    if server is None:
+        raise ValueError("Edit batches require the MCP plugin server")
+    commands = _coerce_commands(params.get("commands", []))
+    stop_on_error = bool(params.get("stop_on_error", True))
+
+    # Join an already open session; otherwise the batch owns a transient one.
+    owns_session = server.edit_session is None
+    if owns_session:
+        server.edit_session = EditSession(f"batch of {len(commands)}", hou)
+    session = server.edit_session
+
+    results = []
+    errors = []
+    succeeded = 0
+    try:
+        for index, command in enumerate(commands):
+            try:
+                results.append(server._execute_command({
+                    "type": command["type"],
+                    "params": command.get("params", {}) or {},
+                }))
+                succeeded += 1
+            except Exception as exc:
+                errors.append(f"[{index}] {command['type']}: {exc}")
+                results.append(None)
+                if stop_on_error:
+                    break
+    finally:
+        if owns_session and server.edit_session is session:
+            server.edit_session = None
+            summary = session.close(hou, cook=bool(params.get("cook", True)))
+        else:
+            summary = session.describe()
+            # The enclosing session cooks, and accounts for avoided cooks, at commit.
+            summary.update({"cooked": [], "cook_errors": [], "cooks_avoided": 0})
+
+    return {
+        "commands_total": len(commands),
+        "commands_run": succeeded,
+        "results": results,
+        "errors": errors + summary["cook_errors"],
+        "cooked": summary["cooked"],
+        "mutations": summary["mutations"],
+        "cooks_avoided": summary["cooks_avoided"],
+    }
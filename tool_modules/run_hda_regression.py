@@ -0,0 +1,381 @@
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+import time
+
+from .geometry_cache import cached_geometry_product
+from .geometry_utils import (
+    geometry_at_frame,
+    geometry_content_hash,
+    geometry_summary,
+    require_geometry_node,
+    resolve_geometry_node,
+)
+from .worker_pool import pool_unavailable_reason, run_worker_shards, shard
+
+TOOL_NAME = "run_hda_regression"
+IS_MUTATING = False
+
+SNAPSHOT_FORMAT = 1
+
+send_command = None
+
+
+def _coerce_list(value, name):
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{name} must be a JSON array or list") from exc
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError(f"{name} must be a list")
+    return value
+
+
+def _close(expected, actual, tolerance: float) -> bool:
+    if isinstance(expected, (list, tuple)) and isinstance(actual, (list, tuple)):
+        return len(expected) == len(actual) and all(_close(e, a, tolerance) for e, a in zip(expected, actual))
+    if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+        return abs(float(expected) - float(actual)) <= tolerance
+    return expected == actual
+
+
+def diff_fingerprints(expected: Dict[str, Any], actual: Dict[str, Any], tolerance: float) -> List[str]:
+    """Human-readable differences between two case fingerprints (empty when they match)."""
+    if expected.get("content_hash") and expected.get("content_hash") == actual.get("content_hash"):
+        return []
+    differences = []
+    for key in ("points", "prims", "vertices"):
+        if expected.get(key) != actual.get(key):
+            differences.append(f"{key}: {expected.get(key)} -> {actual.get(key)}")
+    for key in ("bbox_min", "bbox_max"):
+        if not _close(expected.get(key), actual.get(key), tolerance):
+            differences.append(f"{key}: {expected.get(key)} -> {actual.get(key)}")
+    expected_attributes = expected.get("attributes", {})
+    actual_attributes = actual.get("attributes", {})
+    for ref in sorted(set(expected_attributes) | set(actual_attributes)):
+        if ref not in actual_attributes:
+            differences.append(f"{ref}: missing")
+            continue
+        if ref not in expected_attributes:
+            differences.append(f"{ref}: new attribute")
+            continue
+        for stat in sorted(set(expected_attributes[ref]) | set(actual_attributes[ref])):
+            before, after = expected_attributes[ref].get(stat), actual_attributes[ref].get(stat)
+            if not _close(before, after, tolerance):
+                differences.append(f"{ref}.{stat}: {before} -> {after}")
+    return differences
+
+
+def _evaluated_parms(node, overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Current value of every parameter on the node, with the case's overrides applied."""
+    values = {}
+    for parm in node.parms():
+        try:
+            values[parm.name()] = parm.eval()
+        except Exception as exc:
+            values[parm.name()] = f"<unevaluable: {exc}>"
+    values.update(overrides)
+    return values
+
+
+def _upstream_hash(other, frame: float, hou):
+    """Content hash of an upstream node's geometry at `frame`, or its evaluated parms if it has none."""
+    geometry_node = resolve_geometry_node(other)
+    if geometry_node is None:
+        return [other.path(), _evaluated_parms(other, {})]
+    return cached_geometry_product(
+        geometry_node,
+        frame,
+        "content_hash",
+        lambda: geometry_content_hash(geometry_node, geometry_at_frame(geometry_node, frame, hou), frame, hou),
+        hou,
+    )
+
+
+def case_input_hash(node, case: Dict[str, Any], attributes: List[str], hou) -> str:
+    """Digest of everything a case's output depends on.
+
+    Covers every evaluated parameter (with the case overrides), the frame,
+    the HDA definition, upstream geometry at the case frame, nodes referenced
+    by the node or its contents (e.g. object_merge sources) and the Houdini
+    version.
+    """
+    definition = node.type().definition()
+    frame = hou.frame() if case.get("frame") is None else case["frame"]
+    inputs = [None if other is None else _upstream_hash(other, frame, hou) for other in node.inputs()]
+    try:
+        inside = node.path() + "/"
+        references = sorted(
+            (other for other in node.references() if not other.path().startswith(inside)),
+            key=lambda other: other.path(),
+        )
+    except Exception:
+        references = []
+    payload = {
+        "case": case,
+        "parms": _evaluated_parms(node, case.get("set_parameters", {})),
+        "frame": frame,
+        "attributes": attributes,
+        "node_type": node.type().nameWithCategory(),
+        "definition": [definition.libraryFilePath(), definition.modificationTime()] if definition else None,
+        "houdini": hou.applicationVersionString(),
+        "inputs": inputs,
+        "references": [[other.path(), _upstream_hash(other, frame, hou)] for other in references],
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def cases_skippable(node) -> bool:
+    """Input hashes only describe a locked instance that matches its saved definition."""
+    try:
+        return bool(node.isLockedHDA() and node.matchesCurrentDefinition())
+    except Exception:
+        return False
+
+
+def fingerprint_cases(payload: Dict[str, Any], hou) -> List[Dict[str, Any]]:
+    """Apply each case's parameters, fingerprint the output, restore parameters; also the worker entry point."""
+    node = hou.node(payload["node_path"])
+    if node is None:
+        raise ValueError(f"Node not found: {payload['node_path']}")
+    attributes = payload.get("attributes", []) or []
+    cases = payload.get("cases", [])
+    saved = {}
+    for case in cases:
+        for parm_name in case.get("set_parameters", {}):
+            parm = node.parm(parm_name)
+            if parm is None:
+                raise ValueError(f"Parameter not found on node: {parm_name}")
+            saved.setdefault(parm_name, parm.eval())
+
+    results = []
+    try:
+        for case in cases:
+            started = time.perf_counter()
+            for parm_name, value in case.get("set_parameters", {}).items():
+                node.parm(parm_name).set(value)
+            frame = case.get("frame")
+            geometry_node = require_geometry_node(node)
+            geo = geometry_at_frame(geometry_node, frame, hou)
+            fingerprint = geometry_summary(geo, hou, attributes)
+            fingerprint["content_hash"] = geometry_content_hash(geometry_node, geo, frame, hou)
+            results.append({
+                "name": case["name"],
+                "fingerprint": fingerprint,
+                "seconds": round(time.perf_counter() - started, 4),
+            })
+    finally:
+        for parm_name, value in saved.items():
+            node.parm(parm_name).set(value)
+    return results
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    if not os.path.isfile(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _write_json(path: str, data: Dict[str, Any]):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True, default=str)
+    os.replace(temp_path, path)
+
+
+def run_hda_regression(
+    node_path: str,
+    cases: Any,
+    snapshot_path: str,
+    mode: str = "check",
+    attributes: Optional[List[str]] = None,
+    tolerance: float = 1e-5,
+    workers: int = 1,
+    force: bool = False,
+) -> str:
+    """
+    Record or check golden geometry snapshots for a matrix of HDA parameter cases.
+
+    Each case ({"name", "set_parameters", optional "frame"}) is fingerprinted
+    (counts, bbox, min/max/mean of `attributes`, content hash). mode="record"
+    writes the fingerprints to a versioned snapshot JSON; mode="check" diffs
+    against it within `tolerance`. Cases whose inputs (case parameters, HDA
+    definition, upstream and referenced geometry at the case frame, Houdini
+    version) are unchanged since they were last recorded or passed at the same
+    tolerance are not re-cooked unless force=True. workers > 1
+    cooks cases in parallel hython processes when the hip file is saved.
+
+    Args:
+        node_path: HDA instance (SOP or network with a display SOP)
+        cases: List of case dicts
+        snapshot_path: Golden snapshot JSON file
+        mode: 'record' or 'check'
+        attributes: Attribute refs to fingerprint (default ["P"])
+        tolerance: Absolute tolerance for bbox and attribute statistics
+        workers: Parallel hython workers
+        force: Re-cook every case
+    """
+    result = send_command({
+        "type": "run_hda_regression",
+        "params": {
+            "node_path": node_path,
+            "cases": cases,
+            "snapshot_path": snapshot_path,
+            "mode": mode,
+            "attributes": attributes or ["P"],
+            "tolerance": tolerance,
+            "workers": workers,
+            "force": force,
+        }
+    })
+    output = (
+        f"🧪 HDA regression ({result.get('mode')})\n"
+        f"Node: {result.get('node_path')}\n"
+        f"Snapshot: {result.get('snapshot_path')} (revision {result.get('revision')})\n"
+        f"Cases: {len(result.get('cases', {}))} | cooked {result.get('cooked')} | skipped {result.get('skipped')}\n"
+        f"Execution: {result.get('execution')}\n"
+    )
+    if result.get("pool_note"):
+        output += f"Note: {result['pool_note']}\n"
+    if result.get("mode") == "check":
+        output += f"Passed: {result.get('passed')}\n"
+    for name, case in result.get("cases", {}).items():
+        if case.get("differences"):
+            output += f"\n❌ {name}:\n" + "\n".join(f"  - {d}" for d in case["differences"][:20]) + "\n"
+        elif case.get("status") not in ("passed", "recorded", "unchanged"):
+            output += f"\n⚠️ {name}: {case.get('status')}\n"
+    return output.strip()
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(run_hda_regression)
+
+
+def execute_plugin(params, server, hou):
+    """Fingerprint parameter cases and record or diff them against a golden snapshot."""
+    node_path = params.get("node_path", "")
+    node = hou.node(node_path)
+    if not node:
+        raise ValueError(f"Node not found: {node_path}")
+    mode = str(params.get("mode", "check")).lower()
+    if mode not in ("record", "check"):
+        raise ValueError("mode must be 'record' or 'check'")
+    cases = _coerce_list(params.get("cases", []), "cases")
+    if not cases:
+        raise ValueError("cases must be a non-empty list")
+    names = [case.get("name", "") for case in cases]
+    if not all(names) or len(set(names)) != len(names):
+        raise ValueError("Each case requires a unique, non-empty name")
+    snapshot_path = params.get("snapshot_path") or ""
+    if not snapshot_path:
+        raise ValueError("snapshot_path is required")
+    snapshot_path = os.path.abspath(os.path.expanduser(snapshot_path))
+    attributes = list(params.get("attributes") or ["P"])
+    tolerance = float(params.get("tolerance", 1e-5))
+    force = bool(params.get("force", False))
+
+    snapshot = _read_json(snapshot_path)
+    if snapshot and snapshot.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported snapshot format {snapshot.get('format')} in {snapshot_path}")
+    if mode == "check" and not snapshot:
+        raise ValueError(f"Snapshot not found: {snapshot_path} (run with mode='record' first)")
+    golden = snapshot.get("cases", {})
+    # Remember which input hashes already passed a check so unchanged cases are not re-cooked.
+    check_state_path = f"{snapshot_path}.check.json"
+    check_state = {}
+    if mode == "check":
+        state = _read_json(check_state_path)
+        # A pass at one tolerance says nothing about a stricter one.
+        if state.get("revision") == snapshot.get("revision") and state.get("tolerance") == tolerance:
+            check_state = state.get("passed", {})
+
+    input_hashes = {case["name"]: case_input_hash(node, case, attributes, hou) for case in cases}
+    # Unlocked or locally edited contents are not captured by the hash; always cook those.
+    skippable = not force and cases_skippable(node)
+    to_cook = []
+    case_reports: Dict[str, Dict[str, Any]] = {}
+    for case in cases:
+        name = case["name"]
+        known = golden.get(name, {}).get("input_hash") if mode == "record" else check_state.get(name)
+        if skippable and known == input_hashes[name] and (mode == "record" or name in golden):
+            case_reports[name] = {"status": "unchanged" if mode == "record" else "passed", "cooked": False}
+        else:
+            to_cook.append(case)
+
+    payload = {"node_path": node.path(), "attributes": attributes}
+    workers = max(1, int(params.get("workers", 1) or 1))
+    execution = "in_process"
+    pool_note = None
+    fingerprints = None
+    if workers > 1 and len(to_cook) > 1:
+        pool_note = pool_unavailable_reason(hou)
+        if pool_note is None:
+            chunks = shard(to_cook, workers)
+            shard_results = run_worker_shards(
+                "tool_modules.run_hda_regression",
+                "fingerprint_cases",
+                [dict(payload, cases=chunk) for chunk in chunks],
+                len(chunks),
+                hou,
+            )
+            fingerprints = [entry for chunk in shard_results for entry in chunk]
+            execution = f"{len(chunks)} workers"
+        else:
+            pool_note = f"Worker pool unavailable, ran in process: {pool_note}"
+    if fingerprints is None:
+        fingerprints = fingerprint_cases(dict(payload, cases=to_cook), hou) if to_cook else []
+
+    for entry in fingerprints:
+        name = entry["name"]
+        report = {"cooked": True, "seconds": entry["seconds"]}
+        if mode == "record":
+            golden[name] = {"input_hash": input_hashes[name], "fingerprint": entry["fingerprint"]}
+            report["status"] = "recorded"
+        elif name not in golden:
+            report["status"] = "missing_from_snapshot"
+        else:
+            differences = diff_fingerprints(golden[name]["fingerprint"], entry["fingerprint"], tolerance)
+            report["status"] = "failed" if differences else "passed"
+            report["differences"] = differences
+            if differences:
+                check_state.pop(name, None)
+            else:
+                check_state[name] = input_hashes[name]
+        case_reports[name] = report
+
+    revision = snapshot.get("revision", 0)
+    if mode == "record" and fingerprints:
+        revision += 1
+        _write_json(snapshot_path, {
+            "format": SNAPSHOT_FORMAT,
+            "revision": revision,
+            "node_type": node.type().nameWithCategory(),
+            "houdini_version": hou.applicationVersionString(),
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "attributes": attributes,
+            "cases": golden,
+        })
+    elif mode == "check":
+        _write_json(check_state_path, {"revision": revision, "tolerance": tolerance, "passed": check_state})
+
+    return {
+        "node_path": node.path(),
+        "mode": mode,
+        "snapshot_path": snapshot_path,
+        "revision": revision,
+        "execution": execution,
+        "pool_note": pool_note,
+        "cooked": len(fingerprints),
+        "skipped": len(cases) - len(fingerprints),
+        "passed": all(report["status"] == "passed" for report in case_reports.values()) if mode == "check" else None,
+        "cases": {name: case_reports[name] for name in names},
+    }
@@ -1,23 +1,48 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 import json
 
+from .hda_save_cache import save_or_defer
+
 TOOL_NAME = "save_hda_definition"
 IS_MUTATING = True
 
 send_command = None
 
-def save_hda_definition(node_path: str) -> str:
-    """Save an HDA definition from an instance."""
+def save_hda_definition(
+    node_path: str = "",
+    node_paths: Optional[List[str]] = None,
+    force: bool = False,
+    defer: bool = False,
+) -> str:
+    """
+    Save an HDA definition from an instance.
+
+    Unchanged contents are not rewritten (force=True always writes); see
+    save_hda_from_instance for node_paths batching and defer.
+    """
     result = send_command({
         "type": "save_hda_definition",
-        "params": {"node_path": node_path}
+        "params": {
+            "node_path": node_path,
+            "node_paths": node_paths or [],
+            "force": force,
+            "defer": defer,
+        }
     })
-    return (
+    if result.get("deferred"):
+        return f"⏳ Save deferred to end of edit session '{result.get('session')}': {result['deferred']}"
+    output = (
         f"✅ Definition saved\n"
-        f"Node: {result.get('node_path')}\n"
-        f"Definition: {result.get('definition_name')}\n"
-        f"File: {result.get('hda_file_path')}"
+        f"Results: {result.get('counts')}\n"
+        f"Libraries rewritten: {len(result.get('libraries_written', []))} "
+        f"({result.get('library_bytes')} bytes) | {result.get('seconds')}s\n"
     )
+    for entry in result.get("results", []):
+        output += f"- [{entry['action']}] {entry['node_path']}: {entry.get('reason', '')}"
+        if entry.get("library_file_path"):
+            output += f" ({entry.get('definition_name')} → {entry['library_file_path']})"
+        output += "\n"
+    return output.strip()
 
 
 def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
@@ -28,21 +53,5 @@ def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool
 
 
 def execute_plugin(params, server, hou):
-    """Save the current node contents/parameters back into its HDA definition."""
-    node_path = params.get("node_path", "")
-
-    node = hou.node(node_path)
-    if not node:
-        raise ValueError(f"Node not found: {node_path}")
-
-    definition = node.type().definition()
-    if definition is None:
-        raise ValueError(f"Node is not a digital asset instance: {node_path}")
-
-    definition.updateFromNode(node)
-
-    return {
-        "node_path": node.path(),
-        "definition_name": definition.nodeTypeName(),
-        "hda_file_path": definition.libraryFilePath(),
-    }
+    """Save the current node contents/parameters back into its HDA definition, skipping no-op writes."""
+    return save_or_defer(params, server, hou, relock_default=False)
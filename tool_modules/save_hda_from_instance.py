@@ -1,27 +1,52 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 import json
 
+from .hda_save_cache import save_or_defer
+
 TOOL_NAME = "save_hda_from_instance"
 IS_MUTATING = True
 
 send_command = None
 
-def save_hda_from_instance(node_path: str, relock: bool = True) -> str:
-    """Save HDA definition from an instance and optionally relock."""
+def save_hda_from_instance(
+    node_path: str = "",
+    relock: bool = True,
+    node_paths: Optional[List[str]] = None,
+    force: bool = False,
+    defer: bool = False,
+) -> str:
+    """
+    Save HDA definition from an instance and optionally relock.
+
+    The instance is digested first and the library is not rewritten when it
+    already holds the same contents (force=True always writes). With
+    node_paths, instances sharing a definition are saved once. With defer=True
+    inside an edit session, the save runs once at end_edit_session().
+    """
     result = send_command({
         "type": "save_hda_from_instance",
         "params": {
             "node_path": node_path,
+            "node_paths": node_paths or [],
             "relock": relock,
+            "force": force,
+            "defer": defer,
         }
     })
-    return (
+    if result.get("deferred"):
+        return f"⏳ Save deferred to end of edit session '{result.get('session')}': {result['deferred']}"
+    output = (
         f"✅ HDA saved from instance\n"
-        f"Node: {result.get('node_path')}\n"
-        f"Definition: {result.get('definition_name')}\n"
-        f"File: {result.get('library_file_path')}\n"
-        f"Matches definition: {result.get('matches_current_definition')}"
+        f"Results: {result.get('counts')}\n"
+        f"Libraries rewritten: {len(result.get('libraries_written', []))} "
+        f"({result.get('library_bytes')} bytes) | {result.get('seconds')}s\n"
     )
+    for entry in result.get("results", []):
+        output += f"- [{entry['action']}] {entry['node_path']}: {entry.get('reason', '')}"
+        if entry.get("library_file_path"):
+            output += f" ({entry.get('definition_name')} → {entry['library_file_path']})"
+        output += "\n"
+    return output.strip()
 
 
 def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
@@ -32,22 +57,5 @@ def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool
 
 
 def execute_plugin(params, server, hou):
-    """Save the HDA definition from an instance, with optional relock."""
-    node_path = params.get("node_path", "")
-    node = hou.node(node_path)
-    if not node:
-        raise ValueError(f"Node not found: {node_path}")
-    definition = node.type().definition()
-    if definition is None:
-        raise ValueError(f"Node is not an HDA instance: {node_path}")
-
-    definition.updateFromNode(node)
-    if bool(params.get("relock", True)):
-        node.matchCurrentDefinition()
-
-    return {
-        "node_path": node.path(),
-        "definition_name": definition.nodeTypeName(),
-        "library_file_path": definition.libraryFilePath(),
-        "matches_current_definition": node.matchesCurrentDefinition(),
-    }
+    """Save the HDA definition from instances, skipping unchanged contents, with optional relock."""
+    return save_or_defer(params, server, hou, relock_default=True)
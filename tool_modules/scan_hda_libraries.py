@@ -0,0 +1,64 @@
+from typing import List, Optional
+import json
+
+from .hda_library_index import configured_directories, get_hda_library_index
+
+TOOL_NAME = "scan_hda_libraries"
+IS_MUTATING = False
+
+send_command = None
+
+
+def scan_hda_libraries(
+    directories: Optional[List[str]] = None,
+    include_examples: bool = True,
+    force: bool = False,
+) -> str:
+    """
+    Index HDA/OTL libraries on disk without installing them.
+
+    Scans help/examples/nodes, $HOUDINI_MCP_HDA_DIRS and any extra directories.
+    Each library's definitions (type name, category, version, description) are
+    stored in a persistent JSON index; later scans only reparse files whose
+    mtime or size changed. Use find_hda_library to resolve type names to files.
+
+    Args:
+        directories: Extra directories to scan recursively
+        include_examples: Include the bundled help/examples/nodes libraries
+        force: Reparse every library even if unchanged
+    """
+    result = send_command({
+        "type": "scan_hda_libraries",
+        "params": {
+            "directories": directories or [],
+            "include_examples": include_examples,
+            "force": force,
+        }
+    })
+    output = "📚 HDA library index refreshed\n"
+    output += f"Libraries: {result.get('libraries')} (parsed {result.get('parsed')}, unchanged {result.get('unchanged')}, removed {result.get('removed')})\n"
+    output += f"Definitions: {result.get('definitions')}\n"
+    output += f"Time: {result.get('seconds')}s\n"
+    output += f"Index: {result.get('index_path')}"
+    if result.get("errors"):
+        output += f"\nErrors: {json.dumps(result['errors'], indent=2)}"
+    return output
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(scan_hda_libraries)
+
+
+def execute_plugin(params, server, hou):
+    """Incrementally refresh the on-disk HDA library index."""
+    directories = configured_directories(
+        params.get("directories", []) or [],
+        include_examples=bool(params.get("include_examples", True)),
+    )
+    index = get_hda_library_index()
+    result = dict(index.scan(directories, hou, force=bool(params.get("force", False))))
+    result["index_path"] = index.index_path
+    return result
@@ -1,6 +1,9 @@
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 import json
 
+from .hda_save_cache import remember_locked_contents, save_from_node
+from .hda_utils import apply_parameter_bindings
+
 TOOL_NAME = "set_hda_internal_binding"
 IS_MUTATING = True
 
@@ -8,16 +11,23 @@ send_command = None
 
 def set_hda_internal_binding(
     hda_node_path: str,
-    internal_node: str,
-    internal_parm: str,
+    internal_node: str = "",
+    internal_parm: str = "",
     source_parm: Optional[str] = None,
     expression: Optional[str] = None,
     language: str = "hscript",
     unlock: bool = True,
     save_definition: bool = True,
     relock: bool = True,
+    bindings: Optional[List[Dict[str, Any]]] = None,
 ) -> str:
-    """Set an expression binding on an internal parameter of an HDA instance."""
+    """
+    Set an expression binding on an internal parameter of an HDA instance.
+
+    Pass bindings (a list of {"internal_node", "internal_parm", "expression"
+    or "source_parm", "language"}) to apply many bindings in one pass; the
+    definition is then saved once for the whole batch.
+    """
     result = send_command({
         "type": "set_hda_internal_binding",
         "params": {
@@ -30,15 +40,21 @@ def set_hda_internal_binding(
             "unlock": unlock,
             "save_definition": save_definition,
             "relock": relock,
+            "bindings": bindings or [],
         }
     })
-    return (
-        f"✅ Internal binding updated\n"
+    counts = result.get("counts", {})
+    output = (
+        f"{'⚠️' if counts.get('failed') else '✅'} Internal binding updated\n"
         f"HDA: {result.get('hda_node_path')}\n"
-        f"Target: {result.get('target_parm_path')}\n"
-        f"Expression: {result.get('expression')}\n"
-        f"Language: {result.get('language')}"
+        f"Applied: {counts.get('applied')} | Skipped: {counts.get('skipped')} | Failed: {counts.get('failed')}\n"
+        f"Definition: {result.get('save_action', 'not saved')}"
     )
+    for entry in result.get("applied", []):
+        output += f"\n- {entry['parm']} = {entry['expression']} ({entry['language']})"
+    for entry in result.get("failed", []):
+        output += f"\n- binding {entry['index']} {entry.get('parm', '')}: {entry['error']}"
+    return output
 
 
 def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
@@ -49,49 +65,49 @@ def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool
 
 
 def execute_plugin(params, server, hou):
-    """Set an expression binding on an internal parameter of an HDA instance."""
+    """Set expression bindings on internal parameters of an HDA instance, saving the definition once."""
     hda_node_path = params.get("hda_node_path", "")
-    internal_node = params.get("internal_node", "")
-    internal_parm = params.get("internal_parm", "")
-    source_parm = params.get("source_parm")
-    expression = params.get("expression")
-    language_raw = str(params.get("language", "hscript")).lower()
+    bindings = list(params.get("bindings") or [])
+    if params.get("internal_node") or params.get("internal_parm"):
+        bindings.insert(0, {
+            "internal_node": params.get("internal_node"),
+            "internal_parm": params.get("internal_parm"),
+            "source_parm": params.get("source_parm"),
+            "expression": params.get("expression"),
+            "language": params.get("language", "hscript"),
+        })
 
     hda_node = hou.node(hda_node_path)
     if not hda_node:
         raise ValueError(f"HDA node not found: {hda_node_path}")
     if hda_node.type().definition() is None:
         raise ValueError(f"Node is not an HDA instance: {hda_node_path}")
-    if not internal_node or not internal_parm:
-        raise ValueError("internal_node and internal_parm are required")
+    if not bindings:
+        raise ValueError("internal_node and internal_parm (or bindings) are required")
 
-    if bool(params.get("unlock", True)):
+    unlocked_here = bool(params.get("unlock", True)) and hda_node.isLockedHDA()
+    if unlocked_here:
+        remember_locked_contents(hda_node)
         hda_node.allowEditingOfContents()
 
-    target_node = hda_node.node(internal_node)
-    if target_node is None:
-        raise ValueError(f"Internal node not found: {hda_node_path}/{internal_node}")
-
-    target_parm = target_node.parm(internal_parm)
-    if target_parm is None:
-        raise ValueError(f"Internal parameter not found: {target_node.path()}.{internal_parm}")
-
-    if expression is None:
-        if not source_parm:
-            raise ValueError("Either source_parm or expression is required")
-        expression = f'ch(\"../{source_parm}\")'
-
-    language = hou.exprLanguage.Python if language_raw == "python" else hou.exprLanguage.Hscript
-    target_parm.setExpression(str(expression), language)
-
-    if bool(params.get("save_definition", True)):
-        hda_node.type().definition().updateFromNode(hda_node)
-    if bool(params.get("relock", True)):
+    result = apply_parameter_bindings(hda_node, bindings, hou)
+    relock = bool(params.get("relock", True))
+    if not result["counts"]["applied"]:
+        # Nothing changed; leave the definition alone and undo our own unlock.
+        result["save_action"] = "not saved (no bindings applied)"
+        if unlocked_here and relock:
+            hda_node.matchCurrentDefinition()
+    elif bool(params.get("save_definition", True)):
+        save = save_from_node(hda_node, relock=relock)
+        result["save_action"] = f"{save['action']} ({save['reason']})"
+        result["library_size"] = save["library_size"]
+    elif relock:
         hda_node.matchCurrentDefinition()
 
-    return {
-        "hda_node_path": hda_node.path(),
-        "target_parm_path": f"{target_node.path()}.{internal_parm}",
-        "expression": str(expression),
-        "language": "python" if language == hou.exprLanguage.Python else "hscript",
-    }
+    result["hda_node_path"] = hda_node.path()
+    if len(bindings) == 1 and result["applied"]:
+        # Single-binding callers read these fields directly.
+        result["target_parm_path"] = result["applied"][0]["parm"]
+        result["expression"] = result["applied"][0]["expression"]
+        result["language"] = result["applied"][0]["language"]
+    return result
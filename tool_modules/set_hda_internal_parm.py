@@ -1,6 +1,8 @@
 from typing import Any, Optional
 import json
 
+from .hda_save_cache import remember_locked_contents, save_from_node
+
 TOOL_NAME = "set_hda_internal_parm"
 IS_MUTATING = True
 
@@ -36,7 +38,8 @@ def set_hda_internal_parm(
         f"✅ Internal parameter updated\n"
         f"HDA: {result.get('hda_node_path')}\n"
         f"Target: {result.get('target_parm_path')}\n"
-        f"Value: {result.get('value')}"
+        f"Value: {result.get('value')}\n"
+        f"Definition: {result.get('save_action', 'not saved')}"
     )
 
 
@@ -65,6 +68,7 @@ def execute_plugin(params, server, hou):
         raise ValueError("internal_node and internal_parm are required")
 
     if bool(params.get("unlock", True)):
+        remember_locked_contents(hda_node)
         hda_node.allowEditingOfContents()
 
     target_node = hda_node.node(internal_node)
@@ -81,13 +85,18 @@ def execute_plugin(params, server, hou):
     else:
         target_parm.set(param_value)
 
+    relock = bool(params.get("relock", True))
+    save_action = "not saved"
     if bool(params.get("save_definition", True)):
-        hda_node.type().definition().updateFromNode(hda_node)
-    if bool(params.get("relock", True)):
+        # Goes through the save cache, which also drops cached parm templates.
+        save = save_from_node(hda_node, relock=relock)
+        save_action = f"{save['action']} ({save['reason']})"
+    elif relock:
         hda_node.matchCurrentDefinition()
 
     return {
         "hda_node_path": hda_node.path(),
+        "save_action": save_action,
         "target_parm_path": f"{target_node.path()}.{internal_parm}",
         "value": target_parm.evalAsString() if target_parm.parmTemplate().type() == hou.parmTemplateType.String else target_parm.eval(),
     }
@@ -1,7 +1,7 @@
 from typing import Any, Optional
 import json
 
-from .hda_utils import resolve_hda_definition
+from .hda_utils import invalidate_parm_template_cache, resolve_hda_definition
 
 TOOL_NAME = "set_hda_parm_default"
 IS_MUTATING = True
@@ -140,6 +140,7 @@ def execute_plugin(params, server, hou):
 
     ptg.replace(param_name, template)
     definition.setParmTemplateGroup(ptg)
+    invalidate_parm_template_cache(definition)
 
     updated = definition.parmTemplateGroup().find(param_name)
     if updated is None:
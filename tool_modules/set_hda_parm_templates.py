@@ -1,7 +1,7 @@
 from typing import Any, Optional
 import json
 
-from .hda_utils import create_parm_template_from_tree, resolve_hda_definition
+from .hda_utils import create_parm_template_from_tree, invalidate_parm_template_cache, resolve_hda_definition
 
 TOOL_NAME = "set_hda_parm_templates"
 IS_MUTATING = True
@@ -33,7 +33,8 @@ def set_hda_parm_templates(
         f"Definition: {result.get('definition_name')}\n"
         f"File: {result.get('library_file_path')}\n"
         f"Top-level templates: {result.get('num_top_level_templates')}\n"
-        f"replace_all: {result.get('replace_all')}"
+        f"replace_all: {result.get('replace_all')}\n"
+        f"Changed: {result.get('changed')}"
     )
 
 
@@ -67,14 +68,19 @@ def execute_plugin(params, server, hou):
     for spec in templates:
         ptg.append(create_parm_template_from_tree(spec, hou))
 
-    definition.setParmTemplateGroup(ptg)
+    # Rewriting an identical interface still re-syncs every instance; skip it.
+    changed = ptg.asDialogScript() != definition.parmTemplateGroup().asDialogScript()
+    if changed:
+        definition.setParmTemplateGroup(ptg)
+        invalidate_parm_template_cache(definition)
 
-    if node is not None and bool(params.get("sync_instance", True)):
-        node.matchCurrentDefinition()
+        if node is not None and bool(params.get("sync_instance", True)):
+            node.matchCurrentDefinition()
 
     return {
         "definition_name": definition.nodeTypeName(),
         "library_file_path": definition.libraryFilePath(),
         "num_top_level_templates": len(definition.parmTemplateGroup().entries()),
         "replace_all": replace_all,
+        "changed": changed,
     }
@@ -0,0 +1,124 @@
+"""NumPy uniform-grid spatial index for nearest, radius and bounding-box point queries."""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+
+class UniformGridIndex:
+    """Bucket points into a uniform grid sorted by cell id; all queries are vectorized per cell block."""
+
+    def __init__(self, points, target_per_cell: int = 8):
+        import numpy as np
+
+        self._np = np
+        self.points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+        count = self.points.shape[0]
+        if count == 0:
+            self.lower = np.zeros(3)
+            self.cell_size = 1.0
+            self.dims = np.ones(3, dtype=np.int64)
+            self.order = np.zeros(0, dtype=np.int64)
+            self.sorted_ids = np.zeros(0, dtype=np.int64)
+            return
+
+        self.lower = self.points.min(axis=0)
+        extent = self.points.max(axis=0) - self.lower
+        longest = float(extent.max()) or 1.0
+        # Size cells by the populated volume, ignoring flat axes.
+        populated = extent[extent > longest * 1e-6]
+        cells_wanted = max(1.0, count / float(max(1, target_per_cell)))
+        if populated.size:
+            self.cell_size = max(
+                float(np.prod(populated) / cells_wanted) ** (1.0 / populated.size),
+                longest * 1e-6,
+            )
+        else:
+            self.cell_size = 1.0
+        self.dims = np.floor(extent / self.cell_size).astype(np.int64) + 1
+        cell_ids = self._cell_ids(self._cell_coords(self.points))
+        self.order = np.argsort(cell_ids, kind="stable")
+        self.sorted_ids = cell_ids[self.order]
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.points.nbytes + self.order.nbytes + self.sorted_ids.nbytes)
+
+    def _cell_coords(self, positions):
+        np = self._np
+        coords = np.floor((positions - self.lower) / self.cell_size).astype(np.int64)
+        return np.clip(coords, 0, self.dims - 1)
+
+    def _cell_ids(self, coords):
+        return (coords[..., 0] * self.dims[1] + coords[..., 1]) * self.dims[2] + coords[..., 2]
+
+    def _points_in_cells(self, cell_ids):
+        np = self._np
+        starts = np.searchsorted(self.sorted_ids, cell_ids, side="left")
+        ends = np.searchsorted(self.sorted_ids, cell_ids, side="right")
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        return self.order[offsets]
+
+    def _candidates_in_box(self, lower, upper):
+        np = self._np
+        lo = self._cell_coords(np.asarray(lower, dtype=np.float64))
+        hi = self._cell_coords(np.asarray(upper, dtype=np.float64))
+        num_cells = int(np.prod(hi - lo + 1))
+        if num_cells >= self.sorted_ids.size:
+            # Touching more cells than there are points: a flat scan is cheaper.
+            return np.arange(self.points.shape[0], dtype=np.int64)
+        grid = np.stack(
+            np.meshgrid(*(np.arange(lo[axis], hi[axis] + 1) for axis in range(3)), indexing="ij"),
+            axis=-1,
+        ).reshape(-1, 3)
+        return self._points_in_cells(self._cell_ids(grid))
+
+    def radius(self, query, radius: float, max_results: int = 0) -> Tuple[object, object]:
+        """Indices and distances of points within `radius` of `query`, nearest first."""
+        np = self._np
+        query = np.asarray(query, dtype=np.float64).reshape(3)
+        candidates = self._candidates_in_box(query - radius, query + radius)
+        distances = np.linalg.norm(self.points[candidates] - query, axis=1)
+        inside = distances <= radius
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        if max_results:
+            order = order[:max_results]
+        return candidates[order], distances[order]
+
+    def nearest(self, query, k: int = 1) -> Tuple[object, object]:
+        """Indices and distances of the k nearest points to `query`."""
+        np = self._np
+        query = np.asarray(query, dtype=np.float64).reshape(3)
+        count = self.points.shape[0]
+        k = max(1, min(int(k), count))
+        if count == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        # Grow a cube of cells until it holds k points, then close with an exact radius query.
+        ring = 1
+        while True:
+            reach = ring * self.cell_size
+            candidates = self._candidates_in_box(query - reach, query + reach)
+            if candidates.size >= k or candidates.size == count:
+                break
+            ring *= 2
+        distances = np.linalg.norm(self.points[candidates] - query, axis=1)
+        kth = float(np.partition(distances, k - 1)[k - 1])
+        indices, distances = self.radius(query, kth)
+        return indices[:k], distances[:k]
+
+    def bbox(self, lower, upper, max_results: int = 0):
+        """Indices of points inside the axis-aligned box [lower, upper]."""
+        np = self._np
+        lower = np.asarray(lower, dtype=np.float64).reshape(3)
+        upper = np.asarray(upper, dtype=np.float64).reshape(3)
+        candidates = self._candidates_in_box(lower, upper)
+        positions = self.points[candidates]
+        inside = np.all((positions >= lower) & (positions <= upper), axis=1)
+        indices = np.sort(candidates[inside])
+        return indices[:max_results] if max_results else indices
@@ -1,6 +1,7 @@
 from typing import Any, Optional
 import json
 
+from .geometry_cache import cached_geometry_product
 from .hda_utils import geometry_stats
 
 TOOL_NAME = "validate_hda_behavior"
@@ -136,7 +137,9 @@ def execute_plugin(params, server, hou):
                 raise ValueError(
                     f"Unable to resolve geometry output from node: {node.path()}"
                 )
-            stats = geometry_stats(geometry_node, hou)
+            stats = cached_geometry_product(
+                geometry_node, None, "stats", lambda: geometry_stats(geometry_node, hou), hou
+            )
             case_results[name] = stats
 
             for attr_name in require_point_attributes:
@@ -0,0 +1,302 @@
+from typing import Any, Dict, List, Optional
+import fnmatch
+import json
+import os
+import time
+
+from .hda_install_cache import ensure_installed
+from .hda_library_index import configured_directories, get_hda_library_index, iter_library_files
+from .hda_utils import validate_hda_instance
+from .worker_pool import hython_executable, run_worker_shards, shard
+
+TOOL_NAME = "validate_hda_library"
+IS_MUTATING = True
+
+SCRATCH_NAME = "__mcp_validate_hda_library"
+
+send_command = None
+
+
+def asset_key(asset: Dict[str, Any]) -> str:
+    return f"{asset['path']}|{asset['category']}/{asset['type_name']}"
+
+
+def read_progress(progress_path: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Results already recorded in an NDJSON progress file, keyed by asset_key()."""
+    done: Dict[str, Dict[str, Any]] = {}
+    if not progress_path or not os.path.isfile(progress_path):
+        return done
+    with open(progress_path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A crash mid-write leaves a partial last line; that asset simply reruns.
+                continue
+            done[record["key"]] = record
+    return done
+
+
+def summarize_results(results: List[Dict[str, Any]], slowest: int = 10) -> Dict[str, Any]:
+    """Status counts, the most common failing checks and the slowest assets."""
+    counts: Dict[str, int] = {}
+    failing_checks: Dict[str, int] = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+        for check in result.get("checks", []):
+            if not check.get("ok"):
+                name = check["check"].split(":", 1)[0]
+                failing_checks[name] = failing_checks.get(name, 0) + 1
+    timed = sorted(results, key=lambda result: result.get("seconds", 0.0), reverse=True)
+    return {
+        "assets": len(results),
+        "counts": counts,
+        "failing_checks": dict(sorted(failing_checks.items(), key=lambda item: item[1], reverse=True)),
+        "total_seconds": round(sum(result.get("seconds", 0.0) for result in results), 3),
+        "slowest": [
+            {"key": result["key"], "seconds": result.get("seconds")} for result in timed[:slowest]
+        ],
+    }
+
+
+def collect_shard_results(
+    chunks: List[List[Dict[str, Any]]], shard_results: List[Any], progress_path: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Flatten worker results; a failed shard keeps what it recorded in the progress file.
+
+    Its other assets are reported as failed but not recorded, so a resumed run retries them.
+    """
+    recorded = None
+    results: List[Dict[str, Any]] = []
+    for chunk, shard_result in zip(chunks, shard_results):
+        if not isinstance(shard_result, Exception):
+            results.extend(shard_result)
+            continue
+        if recorded is None:
+            recorded = read_progress(progress_path)
+        for asset in chunk:
+            key = asset_key(asset)
+            results.append(recorded.get(key) or {
+                "key": key,
+                "type_name": asset["type_name"],
+                "category": asset["category"],
+                "status": "failed",
+                "errors": [f"Worker failed before validating this asset: {shard_result}"],
+            })
+    return results
+
+
+def _scratch_parent(category: str, hou, created: Dict[str, Any]):
+    """Container for instances of `category`, created on first use and destroyed by the caller."""
+    if category in created:
+        return created[category]
+    containers = {
+        "Object": ("/obj", None),
+        "Sop": ("/obj", "geo"),
+        "Dop": ("/obj", "dopnet"),
+        "Lop": ("/stage", None),
+        "Driver": ("/out", None),
+        "Cop2": ("/img", "img"),
+        "Chop": ("/ch", "ch"),
+    }
+    if category not in containers:
+        return None
+    root_path, container_type = containers[category]
+    root = hou.node(root_path)
+    if root is None:
+        return None
+    parent = root if container_type is None else root.createNode(container_type, f"{SCRATCH_NAME}_{category.lower()}")
+    created[category] = parent
+    return parent
+
+
+def validate_assets(payload: Dict[str, Any], hou) -> List[Dict[str, Any]]:
+    """Instantiate and validate each asset in a scratch network; also the hython worker entry point."""
+    rules = payload.get("rules", {}) or {}
+    cook = bool(payload.get("cook", True))
+    progress_path = payload.get("progress_path")
+    containers: Dict[str, Any] = {}
+    results = []
+    try:
+        with hou.undos.disabler():
+            for asset in payload.get("assets", []):
+                started = time.perf_counter()
+                result = {"key": asset_key(asset), "type_name": asset["type_name"], "category": asset["category"]}
+                instance = None
+                try:
+                    ensure_installed(asset["path"], hou)
+                    parent = _scratch_parent(asset["category"], hou, containers)
+                    if parent is None:
+                        result.update(status="skipped", reason=f"No scratch context for {asset['category']}")
+                    else:
+                        instance = parent.createNode(asset["type_name"], f"{SCRATCH_NAME}_instance")
+                        report = validate_hda_instance(instance, rules)
+                        if cook:
+                            instance.cook(force=True)
+                            cook_errors = list(instance.errors())
+                            report["checks"].append({"check": "cooks_without_errors", "ok": not cook_errors})
+                            report["errors"].extend(f"Cook error: {error}" for error in cook_errors)
+                            report["warnings"].extend(f"Cook warning: {warning}" for warning in instance.warnings())
+                        result.update(
+                            status="valid" if not report["errors"] else "invalid",
+                            errors=report["errors"],
+                            warnings=report["warnings"],
+                            checks=report["checks"],
+                        )
+                except Exception as exc:
+                    result.update(status="failed", errors=[str(exc)])
+                finally:
+                    if instance is not None:
+                        try:
+                            instance.destroy()
+                        except Exception:
+                            pass
+                result["seconds"] = round(time.perf_counter() - started, 4)
+                results.append(result)
+                if progress_path:
+                    with open(progress_path, "a", encoding="utf-8") as handle:
+                        handle.write(json.dumps(result, default=str) + "\n")
+    finally:
+        for category, container in containers.items():
+            if container.name().startswith(SCRATCH_NAME):
+                try:
+                    container.destroy()
+                except Exception:
+                    pass
+    return results
+
+
+def validate_hda_library(
+    library_paths: Optional[List[str]] = None,
+    rules: Optional[Dict[str, Any]] = None,
+    type_pattern: str = "*",
+    cook: bool = True,
+    workers: int = 1,
+    progress_path: str = "",
+    max_assets: int = 0,
+) -> str:
+    """
+    Validate every HDA definition in a set of libraries.
+
+    Each definition is instantiated in a scratch network, checked with the
+    validate_hda rules (and optionally cooked), then deleted. With
+    progress_path, results are appended as NDJSON and assets already recorded
+    there are skipped on the next run, so an interrupted pass resumes.
+    workers > 1 fans the assets out across headless hython processes.
+
+    Args:
+        library_paths: Library files or directories (default: the scan_hda_libraries directories)
+        rules: validate_hda rules applied to every instance
+        type_pattern: Only definitions whose type name matches (fnmatch)
+        cook: Cook each instance and fail on cook errors
+        workers: Number of hython workers (1 = in this session)
+        progress_path: NDJSON progress file for resumable runs
+        max_assets: Stop after this many not-yet-validated assets (0 = all)
+    """
+    result = send_command({
+        "type": "validate_hda_library",
+        "params": {
+            "library_paths": library_paths or [],
+            "rules": rules or {},
+            "type_pattern": type_pattern,
+            "cook": cook,
+            "workers": workers,
+            "progress_path": progress_path,
+            "max_assets": max_assets,
+        }
+    })
+    summary = result.get("summary", {})
+    output = "🧪 validate_hda_library\n"
+    output += f"Assets: {summary.get('assets')} ({result.get('resumed')} resumed, {result.get('remaining')} remaining)\n"
+    output += f"Results: {summary.get('counts')}\n"
+    output += f"Execution: {result.get('execution')} | {summary.get('total_seconds')}s asset time\n"
+    if result.get("pool_note"):
+        output += f"Note: {result['pool_note']}\n"
+    if summary.get("failing_checks"):
+        output += f"Failing checks: {summary['failing_checks']}\n"
+    for entry in result.get("library_errors", []):
+        output += f"- [unreadable] {entry['path']}: {entry['error']}\n"
+    for entry in result.get("problems", []):
+        output += f"- [{entry['status']}] {entry['key']}: {'; '.join(entry.get('errors', [])[:3]) or entry.get('reason', '')}\n"
+    if summary.get("slowest"):
+        output += f"Slowest: {json.dumps(summary['slowest'][:5])}"
+    return output.strip()
+
+
+def register_mcp_tool(mcp, send_command_impl, legacy_bridge_functions=None, tool_decorator=None):
+    global send_command
+    send_command = send_command_impl
+    decorator = tool_decorator or mcp.tool
+    decorator()(validate_hda_library)
+
+
+def execute_plugin(params, server, hou):
+    """Validate every definition in the given libraries, in process or across hython workers."""
+    index = get_hda_library_index()
+    library_files = []
+    for path in params.get("library_paths") or configured_directories():
+        path = os.path.abspath(os.path.expanduser(path))
+        library_files.extend(iter_library_files([path]) if os.path.isdir(path) else [path])
+
+    pattern = params.get("type_pattern") or "*"
+    assets = []
+    library_errors = []
+    for library in library_files:
+        definitions = index.definitions_in_file(library, hou)
+        error = index.library_error(library)
+        if error:
+            library_errors.append({"path": library, "error": error})
+        assets.extend(
+            dict(path=library, type_name=definition["type_name"], category=definition["category"])
+            for definition in definitions
+            if fnmatch.fnmatch(definition["type_name"], pattern)
+        )
+
+    progress_path = params.get("progress_path") or None
+    if progress_path:
+        progress_path = os.path.abspath(os.path.expanduser(progress_path))
+        os.makedirs(os.path.dirname(progress_path), exist_ok=True)
+    done = read_progress(progress_path)
+    pending = [asset for asset in assets if asset_key(asset) not in done]
+    max_assets = int(params.get("max_assets", 0) or 0)
+    batch = pending[:max_assets] if max_assets else pending
+
+    payload = {"rules": params.get("rules", {}) or {}, "cook": bool(params.get("cook", True))}
+    workers = max(1, int(params.get("workers", 1) or 1))
+    execution = "in_process"
+    pool_note = None
+    results = None
+    if workers > 1 and len(batch) > 1:
+        if hython_executable(hou) is None:
+            pool_note = "Worker pool unavailable, ran in process: hython not found (set HOUDINI_MCP_HYTHON)"
+        else:
+            chunks = shard(batch, workers)
+            # Workers append to the progress file per asset, so a crashed shard keeps what it finished.
+            shard_results = run_worker_shards(
+                "tool_modules.validate_hda_library",
+                "validate_assets",
+                [dict(payload, assets=chunk, progress_path=progress_path) for chunk in chunks],
+                len(chunks),
+                hou,
+                load_hip=False,
+                return_errors=True,
+            )
+            results = collect_shard_results(chunks, shard_results, progress_path)
+            execution = f"{len(chunks)} workers"
+    if results is None:
+        results = validate_assets(dict(payload, assets=batch, progress_path=progress_path), hou)
+
+    all_results = list(done.values()) + results
+    return {
+        "execution": execution,
+        "pool_note": pool_note,
+        "resumed": len(done),
+        "remaining": len(pending) - len(batch),
+        "progress_path": progress_path,
+        "summary": summarize_results(all_results),
+        "problems": [result for result in all_results if result["status"] != "valid"],
+        "library_errors": library_errors,
+    }
@@ -0,0 +1,121 @@
+"""Fan work out to headless hython worker processes that load the saved hip file."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hython_worker.py")
+
+
+def hython_executable(hou) -> Optional[str]:
+    """Locate hython from HOUDINI_MCP_HYTHON or $HB."""
+    candidates = [os.environ.get("HOUDINI_MCP_HYTHON")]
+    try:
+        bin_dir = hou.getenv("HB")
+    except Exception:
+        bin_dir = None
+    if bin_dir:
+        suffix = ".exe" if sys.platform.startswith("win") else ""
+        candidates.append(os.path.join(bin_dir, f"hython{suffix}"))
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def pool_unavailable_reason(hou) -> Optional[str]:
+    """Return why workers cannot reproduce the live session, or None if they can."""
+    if hython_executable(hou) is None:
+        return "hython not found (set HOUDINI_MCP_HYTHON)"
+    try:
+        if hou.hipFile.isNewFile():
+            return "hip file has never been saved"
+        if hou.hipFile.hasUnsavedChanges():
+            return "hip file has unsaved changes"
+    except Exception as exc:
+        return f"cannot inspect hip file: {exc}"
+    return None
+
+
+def shard(items: Sequence[Any], count: int) -> List[List[Any]]:
+    """Split items into at most `count` contiguous, non-empty chunks."""
+    items = list(items)
+    count = max(1, min(int(count), len(items)))
+    size, extra = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for index in range(count):
+        end = start + size + (1 if index < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return [chunk for chunk in chunks if chunk]
+
+
+def run_worker_shards(
+    module_name: str,
+    function_name: str,
+    payloads: Sequence[Dict[str, Any]],
+    workers: int,
+    hou,
+    timeout: Optional[float] = None,
+    load_hip: bool = True,
+    return_errors: bool = False,
+) -> List[Any]:
+    """Run `module.function(payload, hou)` for each payload in a hython worker; keep order.
+
+    load_hip=False starts workers on an empty scene for jobs that do not need the live session.
+    return_errors=True puts a failed worker's exception in its slot instead of raising.
+    """
+    hython = hython_executable(hou)
+    if hython is None:
+        raise RuntimeError("hython not found (set HOUDINI_MCP_HYTHON)")
+    hip_file = hou.hipFile.path() if load_hip else None
+    work_dir = tempfile.mkdtemp(prefix="houdini_mcp_workers_")
+
+    def _run(index_payload):
+        index, payload = index_payload
+        request_path = os.path.join(work_dir, f"request_{index}.json")
+        result_path = os.path.join(work_dir, f"result_{index}.json")
+        with open(request_path, "w", encoding="utf-8") as handle:
+            json.dump({
+                "hip_file": hip_file,
+                "module": module_name,
+                "function": function_name,
+                "payload": payload,
+            }, handle)
+        completed = subprocess.run(
+            [hython, WORKER_SCRIPT, request_path, result_path],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        if not os.path.isfile(result_path):
+            tail = (completed.stderr or completed.stdout or "").strip()[-2000:]
+            raise RuntimeError(f"Worker {index} exited with code {completed.returncode}: {tail}")
+        with open(result_path, "r", encoding="utf-8") as handle:
+            response = json.load(handle)
+        if response.get("status") != "success":
+            raise RuntimeError(f"Worker {index} failed: {response.get('error')}")
+        return response.get("result")
+
+    def _run_guarded(index_payload):
+        try:
+            return _run(index_payload)
+        except Exception as exc:
+            if not return_errors:
+                raise
+            return exc
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, int(workers))) as executor:
+            return list(executor.map(_run_guarded, enumerate(payloads)))
+    finally:
+        # Request and result files can hold whole payloads; never leave them behind.
+        shutil.rmtree(work_dir, ignore_errors=True)